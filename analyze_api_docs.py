@@ -1,8 +1,12 @@
+import argparse
 import json
+import os
 from pathlib import Path
 from typing import Dict, List
 import re
 
+from api_doc_index import LazyAPIDocs
+
 class DeepsearchAPIAnalyzer:
     """크롤링한 API 문서 분석"""
     
@@ -10,14 +14,10 @@ class DeepsearchAPIAnalyzer:
         self.docs_dir = Path(docs_dir)
         self.complete_doc_path = self.docs_dir / "deepsearch_api_complete.json"
         
-        if not self.complete_doc_path.exists():
-            raise FileNotFoundError(f"API 문서를 찾을 수 없습니다: {self.complete_doc_path}")
-        
-        # 문서 로드
-        with open(self.complete_doc_path, 'r', encoding='utf-8') as f:
-            self.api_docs = json.load(f)
+        # 문서 로드 (인덱스만 읽고 raw_content / examples는 접근할 때 사이드카에서 읽음)
+        self.api_docs = LazyAPIDocs(self.docs_dir)
         
-        print(f"✅ API 문서 로드 완료: {self.complete_doc_path}")
+        print(f"✅ API 문서 로드 완료: {self.api_docs.index_path}")
     
     def analyze_structure(self) -> Dict:
         """API 구조 분석"""
@@ -53,7 +53,7 @@ class DeepsearchAPIAnalyzer:
                 "endpoint_count": len(endpoints),
                 "endpoints": [],
                 "parameters": section_data.get('parameters', {}),
-                "examples": section_data.get('examples', [])
+                "example_count": section_data.get('example_count', 0)
             }
             
             # 각 엔드포인트 출력
@@ -84,10 +84,9 @@ class DeepsearchAPIAnalyzer:
                 # 공통 파라미터 수집
                 analysis['common_parameters'].update(params.keys())
             
-            # 예제 정보
-            examples = section_data.get('examples', [])
-            if examples:
-                print(f"   예제: {len(examples)}개")
+            # 예제 정보 (개수는 인덱스에 있으므로 예제 본문은 읽지 않음)
+            if section_summary['example_count']:
+                print(f"   예제: {section_summary['example_count']}개")
             
             analysis['sections'][section_name] = section_summary
         
@@ -100,13 +99,49 @@ class DeepsearchAPIAnalyzer:
         
         # 분석 결과 저장
         output_path = self.docs_dir / "api_analysis.json"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(analysis, f, ensure_ascii=False, indent=2)
-        
-        print(f"\n💾 분석 결과 저장: {output_path}")
+        if output_path.exists() and output_path.stat().st_mtime >= self.api_docs.index_path.stat().st_mtime:
+            print(f"\n💾 분석 결과 최신: {output_path}")
+        else:
+            self._write_analysis(analysis, output_path)
+            print(f"\n💾 분석 결과 저장: {output_path}")
         
         return analysis
     
+    def _write_analysis(self, analysis: Dict, output_path: Path):
+        """분석 결과를 저장합니다. 파일 형식에 포함되는 예제 본문은 이때만 사이드카에서 읽습니다."""
+        sections = self.api_docs['sections']
+        output = {
+            **analysis,
+            "sections": {
+                section_name: {**summary, "examples": sections[section_name].get('examples', [])}
+                for section_name, summary in analysis['sections'].items()
+            }
+        }
+        tmp_path = output_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, output_path)
+    
+    def needs_regeneration(self) -> bool:
+        """
+        클라이언트 재생성이 필요한지 판단합니다.
+        
+        크롤러의 변경 보고서(crawl_changes.json)가 변경 없음을 가리키고
+        생성된 클라이언트가 전체 문서보다 최신이면 다시 만들 필요가 없습니다.
+        """
+        report_path = self.docs_dir / "crawl_changes.json"
+        client_path = self.docs_dir / "deepsearch_client_generated.py"
+        
+        if not report_path.exists() or not client_path.exists():
+            return True
+        
+        with open(report_path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+        
+        if client_path.stat().st_mtime < self.api_docs.index_path.stat().st_mtime:
+            return True
+        return bool(report.get("spec_changed", True)) and client_path.stat().st_mtime < report_path.stat().st_mtime
+    
     def extract_base_url(self) -> str:
         """Base URL 추출"""
         base_url = ""
@@ -312,9 +347,17 @@ class DeepsearchAPIClient:
 def main():
     """분석 실행"""
     
+    parser = argparse.ArgumentParser(description="크롤링한 Deepsearch API 문서 분석 및 클라이언트 생성")
+    parser.add_argument("--force", action="store_true", help="스펙 변경이 없어도 클라이언트 재생성")
+    args = parser.parse_args()
+    
     try:
         analyzer = DeepsearchAPIAnalyzer()
         
+        if not args.force and not analyzer.needs_regeneration():
+            print("\n📭 스펙 변경 없음 - 클라이언트 재생성 생략 (--force로 강제 실행)")
+            return
+        
         # 구조 분석
         analysis = analyzer.analyze_structure()
         
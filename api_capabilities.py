@@ -0,0 +1,158 @@
+"""
+API 권한 맵 모듈
+Deepsearch 엔드포인트별 사용 가능 여부(허용 / 403)를 동시에 확인해 TTL과 함께 파일에 저장하고,
+이미 403으로 확인된 엔드포인트에는 요청을 다시 보내지 않도록 합니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Callable, Iterable
+
+from config import get_config
+from config_compat import get_capability_config
+
+
+# 시작 시 확인할 엔드포인트
+PROBE_ENDPOINTS = [
+    "/articles",
+    "/articles/aggregation",
+    "/articles/topics",
+    "/articles/topics/trending",
+    "/articles/documents/disclosure",
+    "/global-articles",
+    "/global-articles/aggregation",
+    "/filings",
+    "/filings/aggregation",
+]
+
+# 확인 요청에 함께 보낼 필수 파라미터 (없으면 400으로 거절되어 권한을 알 수 없음)
+PROBE_PARAMS: Dict[str, Dict[str, Any]] = {
+    "/articles/aggregation": {"keyword": "삼성전자", "groupby": "companies.name"},
+    "/global-articles/aggregation": {"keyword": "Apple", "groupby": "company.company_name"},
+    "/filings/aggregation": {"keyword": "Apple", "groupby": "company", "size": 1},
+}
+
+# 확인 요청에서 인증·권한 검사는 통과했지만 파라미터 검증에서 거절된 응답
+PROBE_VALIDATION_STATUSES = (400, 422)
+
+
+def capability_key(endpoint: str) -> str:
+    """
+    엔드포인트를 권한 단위로 정규화합니다. ID 구간은 {id}로 바꿔 같은 리소스의 ID별 요청을 묶되,
+    목록 엔드포인트와는 구분합니다. (예: /articles/topics/trending/123 → /articles/topics/trending/{id})
+    """
+    parts = ["{id}" if any(ch.isdigit() for ch in part) else part
+             for part in endpoint.strip("/").split("/") if part]
+    return "/" + "/".join(parts)
+
+
+class CapabilityMap:
+    """API 키별 엔드포인트 권한 맵 (파일에 저장, TTL 적용)"""
+
+    def __init__(self, api_key: str, path: str = None, ttl: float = None):
+        """
+        Args:
+            api_key: 권한을 확인할 API 키 (파일에는 해시만 저장)
+            path: 저장 파일 경로 (기본값: DATA_DIR/api_capabilities.json)
+            ttl: 확인 결과 유효 시간 (초)
+        """
+        self.key_id = hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]
+        self.path = path or os.path.join(get_config("DATA_DIR") or "data",
+                                         get_capability_config("FILE") or "api_capabilities.json")
+        self.ttl = ttl or get_capability_config("TTL") or 86400
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load().get(self.key_id, {})
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        """다른 API 키의 결과는 유지한 채 원자적으로 저장합니다. (lock 보유 상태에서 호출)"""
+        data = self._load()
+        data[self.key_id] = self._entries
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def is_allowed(self, endpoint: str) -> Optional[bool]:
+        """
+        엔드포인트 사용 가능 여부. 확인한 적이 없거나 TTL이 지났으면 None.
+        ID가 포함된 경로는 ID와 무관하게 판단합니다. (예: /filings/0000320193-24 → /filings/{id})
+        """
+        with self._lock:
+            entry = self._entries.get(capability_key(endpoint))
+        if entry is None or time.time() - entry["checked_at"] > self.ttl:
+            return None
+        return entry["allowed"]
+
+    def record(self, endpoint: str, status_code: int):
+        """
+        응답 상태 코드로 권한을 기록합니다. 2xx는 허용, 403은 거부로 기록하고
+        그 밖의 응답(400/401/404/429/5xx 등)은 권한을 판단할 수 없으므로 무시합니다.
+        """
+        if status_code != 403 and not 200 <= status_code < 300:
+            return
+        self._store(endpoint, status_code != 403, status_code)
+
+    def _store(self, endpoint: str, allowed: bool, status_code: int):
+        with self._lock:
+            self._entries[capability_key(endpoint)] = {
+                "allowed": allowed,
+                "status": status_code,
+                "checked_at": time.time()
+            }
+            self._save()
+
+    def stale_endpoints(self, endpoints: Iterable[str] = None) -> List[str]:
+        """확인이 필요한(기록이 없거나 TTL이 지난) 엔드포인트"""
+        return [endpoint for endpoint in (endpoints or PROBE_ENDPOINTS) if self.is_allowed(endpoint) is None]
+
+    def probe(self,
+              send: Callable[[str], int],
+              endpoints: Iterable[str] = None,
+              force: bool = False,
+              max_workers: int = 8) -> Dict[str, Optional[bool]]:
+        """
+        엔드포인트를 동시에 확인하고 결과를 저장합니다.
+        확인 요청이 400/422(파라미터 오류)로 거절되면 권한 검사는 통과한 것이므로 허용으로 기록합니다.
+
+        Args:
+            send: 엔드포인트를 받아 HTTP 상태 코드를 반환하는 함수 (실패 시 예외, PROBE_PARAMS 참고)
+            endpoints: 확인할 엔드포인트 (기본값: PROBE_ENDPOINTS)
+            force: True이면 TTL이 남은 엔드포인트도 다시 확인
+        """
+        endpoints = list(endpoints or PROBE_ENDPOINTS)
+        targets = endpoints if force else self.stale_endpoints(endpoints)
+
+        def check(endpoint: str):
+            try:
+                status = send(endpoint)
+                if status in PROBE_VALIDATION_STATUSES:
+                    self._store(endpoint, True, status)
+                else:
+                    self.record(endpoint, status)
+            except Exception as e:
+                print(f"권한 확인 실패 ({endpoint}): {e}")
+
+        if targets:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(targets))),
+                                    thread_name_prefix="capability-probe") as executor:
+                list(executor.map(check, targets))
+
+        return {endpoint: self.is_allowed(endpoint) for endpoint in endpoints}
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {endpoint: dict(entry) for endpoint, entry in self._entries.items()}
@@ -5,37 +5,73 @@ Deepsearch, Finnhub, Slack API를 위한 클라이언트들을 포함합니다.
 
 import requests
 import json
-from typing import Dict, List, Optional, Any, Union
-from datetime import datetime, date
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Union, Callable, Iterator, BinaryIO
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date, timedelta
 from config import get_api_key, get_endpoint
+from http_transport import HTTPTransport, get_transport
+from response_cache import ResponseCache, get_response_cache
+from request_coalescing import get_single_flight
+from rate_limiter import get_rate_limiter, send_with_rate_limit
+from resilience import call_with_retry, get_circuit_breaker, get_circuit_states
 
 
 class DeepsearchClient:
     """Deepsearch API 클라이언트"""
     
-    def __init__(self):
+    def __init__(self, transport: HTTPTransport = None, cache: ResponseCache = None):
         self.api_key = get_api_key("DEEPSEARCH_API_KEY")
         self.base_url = "https://api-v2.deepsearch.com/v1"
+        self.transport = transport or get_transport()
+        self.cache = cache or get_response_cache()
+        self.inflight = get_single_flight("deepsearch")
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
     
     def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """API 요청을 수행합니다."""
+        """
+        API 요청을 수행합니다.
+        
+        캐시가 설정되어 있으면 먼저 캐시를 확인하고, 동일한 요청이 이미 진행 중이면
+        새 요청을 보내지 않고 그 결과를 공유합니다.
+        """
         if params is None:
             params = {}
         
+        request_key = ResponseCache.make_key(endpoint, params)
+        if self.cache is not None:
+            cached = self.cache.get(request_key)
+            if cached is not None:
+                return cached
+        
+        return self.inflight.do(request_key, lambda: self._fetch(endpoint, params, request_key))
+    
+    def _fetch(self, endpoint: str, params: Dict[str, Any], request_key: str) -> Dict[str, Any]:
+        """네트워크 요청을 수행하고 성공한 응답을 캐시에 저장합니다."""
         # API 키를 파라미터에 추가
         params["api_key"] = self.api_key
         
-        try:
-            response = requests.get(f"{self.base_url}{endpoint}", params=params, headers=self.headers)
+        def send():
+            response = self.transport.get(f"{self.base_url}{endpoint}", params=params, headers=self.headers)
             response.raise_for_status()
             return response.json()
+        
+        try:
+            # 일시적 오류는 백오프 후 재시도, 엔드포인트 장애 중에는 서킷이 즉시 차단
+            result = call_with_retry(send, get_circuit_breaker("deepsearch", endpoint))
         except requests.exceptions.RequestException as e:
             print(f"API 요청 실패: {e}")
             return {"error": str(e)}
+        
+        # 오류 응답은 캐시하지 않음
+        if self.cache is not None and not (isinstance(result, dict) and "error" in result):
+            self.cache.set(request_key, result, self.cache.ttl_for(endpoint, params))
+        return result
     
     def get_articles(self, 
                     keyword: str = None,
@@ -407,6 +443,269 @@ class DeepsearchClient:
             
         return self._make_request("/articles/documents/disclosure", params)
     
+    def _iter_pages(self,
+                    fetch_page: Callable[[int], Dict[str, Any]],
+                    page_size: int,
+                    max_items: int = None,
+                    raise_on_error: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        페이지를 자동으로 넘기며 항목을 하나씩 반환합니다.
+        
+        호출자가 N 페이지를 소비하는 동안 N+1 페이지를 백그라운드에서 미리 가져오며,
+        메모리에는 최대 두 페이지만 유지합니다.
+        
+        Args:
+            fetch_page: 페이지 번호를 받아 API 응답을 반환하는 함수
+            page_size: 페이지 크기
+            max_items: 반환할 최대 항목 수 (None이면 total_items까지)
+            raise_on_error: True이면 페이지 조회 실패 시 중단 대신 RuntimeError 발생
+        """
+        if max_items is not None and max_items <= 0:
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="deepsearch-prefetch")
+        future = executor.submit(fetch_page, 1)
+        page = 1
+        yielded = 0
+        
+        try:
+            while future is not None:
+                result = future.result()
+                future = None
+                
+                if "error" in result:
+                    if raise_on_error:
+                        raise RuntimeError(f"페이지 {page} 조회 실패: {result['error']}")
+                    print(f"페이지 {page} 조회 실패: {result['error']}")
+                    return
+                
+                items = result.get("data") or []
+                total_items = result.get("total_items")
+                
+                # 다음 페이지가 필요하면 현재 페이지를 넘겨주기 전에 미리 요청
+                has_more = len(items) >= page_size and (total_items is None or page * page_size < total_items)
+                if has_more and (max_items is None or yielded + len(items) < max_items):
+                    page += 1
+                    future = executor.submit(fetch_page, page)
+                
+                for item in items:
+                    yield item
+                    yielded += 1
+                    if max_items is not None and yielded >= max_items:
+                        return
+        finally:
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=False)
+    
+    def iter_articles(self, 
+                      keyword: str = None,
+                      company_name: str = None,
+                      symbols: str = None,
+                      date_from: str = None,
+                      date_to: str = None,
+                      page_size: int = 100,
+                      max_items: int = None,
+                      highlight: str = None,
+                      clustering: bool = None) -> Iterator[Dict[str, Any]]:
+        """
+        국내 기사를 페이지 구분 없이 하나씩 반환 (다음 페이지 미리 가져오기)
+        
+        Args:
+            page_size: 요청당 페이지 크기
+            max_items: 반환할 최대 기사 수
+            나머지 인자는 get_articles와 동일
+        """
+        def fetch_page(page: int) -> Dict[str, Any]:
+            return self.get_articles(keyword=keyword, company_name=company_name, symbols=symbols,
+                                     date_from=date_from, date_to=date_to, page=page, page_size=page_size,
+                                     highlight=highlight, clustering=clustering)
+        
+        return self._iter_pages(fetch_page, page_size, max_items)
+    
+    def iter_global_articles(self, 
+                             keyword: str = None,
+                             company_name: str = None,
+                             symbols: str = None,
+                             date_from: str = None,
+                             date_to: str = None,
+                             page_size: int = 100,
+                             max_items: int = None) -> Iterator[Dict[str, Any]]:
+        """해외 기사를 페이지 구분 없이 하나씩 반환 (다음 페이지 미리 가져오기)"""
+        def fetch_page(page: int) -> Dict[str, Any]:
+            return self.get_global_articles(keyword=keyword, company_name=company_name, symbols=symbols,
+                                            date_from=date_from, date_to=date_to, page=page, page_size=page_size)
+        
+        return self._iter_pages(fetch_page, page_size, max_items)
+    
+    def iter_filings(self, 
+                     keyword: str = None,
+                     company_name: str = None,
+                     symbol: str = None,
+                     date_from: str = None,
+                     date_to: str = None,
+                     page_size: int = 100,
+                     max_items: int = None) -> Iterator[Dict[str, Any]]:
+        """해외 공시를 페이지 구분 없이 하나씩 반환 (다음 페이지 미리 가져오기)"""
+        def fetch_page(page: int) -> Dict[str, Any]:
+            return self.get_filings(keyword=keyword, company_name=company_name, symbol=symbol,
+                                    date_from=date_from, date_to=date_to, page=page, page_size=page_size)
+        
+        return self._iter_pages(fetch_page, page_size, max_items)
+    
+    def iter_disclosure_documents(self, 
+                                  keyword: str = None,
+                                  company_name: str = None,
+                                  symbols: str = None,
+                                  date_from: str = None,
+                                  date_to: str = None,
+                                  page_size: int = 100,
+                                  max_items: int = None) -> Iterator[Dict[str, Any]]:
+        """국내 공시 문서를 페이지 구분 없이 하나씩 반환 (다음 페이지 미리 가져오기)"""
+        def fetch_page(page: int) -> Dict[str, Any]:
+            return self.get_disclosure_documents(keyword=keyword, company_name=company_name, symbols=symbols,
+                                                 date_from=date_from, date_to=date_to, page=page,
+                                                 page_size=page_size)
+        
+        return self._iter_pages(fetch_page, page_size, max_items)
+
+    @staticmethod
+    def _item_timestamp(item: Dict[str, Any]) -> str:
+        """정렬 기준 시각 (기사: published_at, 공시: filing_date 등)"""
+        for key in ("published_at", "filing_date", "filed_at", "date"):
+            if item.get(key):
+                return str(item[key]).replace(" ", "T")
+        return ""
+
+    def _plan_shards(self,
+                     fetch: Callable[..., Dict[str, Any]],
+                     date_from: date,
+                     date_to: date,
+                     shard_items: int,
+                     executor: ThreadPoolExecutor,
+                     params: Dict[str, Any]) -> List[tuple]:
+        """
+        기간을 total_items가 shard_items 이하가 되도록 반으로 나눠 가며 (시작일, 종료일) 목록을 만듭니다.
+        각 구간의 total_items는 page_size=1 요청으로 확인하며, 같은 단계의 구간은 동시에 확인합니다.
+        """
+        def probe(window: tuple) -> Optional[int]:
+            result = fetch(date_from=window[0].isoformat(), date_to=window[1].isoformat(),
+                           page=1, page_size=1, **params)
+            if "error" in result:
+                raise RuntimeError(f"구간 {window[0]}~{window[1]} 조회 실패: {result['error']}")
+            return result.get("total_items")
+
+        shards = []
+        pending = [(date_from, date_to)]
+        while pending:
+            totals = list(executor.map(probe, pending))
+            next_level = []
+            for (start, end), total in zip(pending, totals):
+                if total == 0:
+                    continue
+                if total is not None and total > shard_items and start < end:
+                    middle = start + (end - start) // 2
+                    next_level.extend([(start, middle), (middle + timedelta(days=1), end)])
+                else:
+                    shards.append((start, end))
+            pending = next_level
+
+        # 최신 구간부터
+        shards.sort(reverse=True)
+        return shards
+
+    def iter_sharded(self,
+                     fetch: Callable[..., Dict[str, Any]],
+                     date_from: str,
+                     date_to: str = None,
+                     shard_items: int = 1000,
+                     max_workers: int = 8,
+                     page_size: int = 100,
+                     **params) -> Iterator[Dict[str, Any]]:
+        """
+        기간을 적응형 구간으로 나눠 병렬로 조회하고 published_at 최신순으로 하나씩 반환합니다.
+
+        결과가 많은 구간은 total_items를 기준으로 더 잘게 나누므로 한 결과 집합을 깊이 넘기는 대신
+        구간 수만큼 동시에 가져옵니다. 구간은 서로 겹치지 않으므로 구간 내 정렬 후 최신 구간부터
+        이어 붙이면 전체가 정렬됩니다. 조회에 실패하면 RuntimeError가 발생합니다.
+
+        Args:
+            fetch: date_from/date_to/page/page_size를 받는 조회 메서드 (예: self.get_articles)
+            date_from: 시작 날짜 (YYYY-MM-DD)
+            date_to: 종료 날짜 (YYYY-MM-DD, 기본값: 오늘)
+            shard_items: 구간당 최대 항목 수 (넘으면 구간을 나눔, 하루짜리 구간은 그대로 조회)
+            max_workers: 동시에 조회할 구간 수
+            page_size: 요청당 페이지 크기
+            params: fetch에 그대로 전달할 검색 조건
+        """
+        start = datetime.strptime(date_from[:10], "%Y-%m-%d").date()
+        end = datetime.strptime(date_to[:10], "%Y-%m-%d").date() if date_to else date.today()
+
+        def fetch_shard(window: tuple) -> List[Dict[str, Any]]:
+            def fetch_page(page: int) -> Dict[str, Any]:
+                return fetch(date_from=window[0].isoformat(), date_to=window[1].isoformat(),
+                             page=page, page_size=page_size, **params)
+
+            items = list(self._iter_pages(fetch_page, page_size, raise_on_error=True))
+            items.sort(key=self._item_timestamp, reverse=True)
+            return items
+
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="deepsearch-shard")
+        in_flight = []
+        try:
+            shards = iter(self._plan_shards(fetch, start, end, shard_items, executor, params))
+            # 소비 속도에 맞춰 최대 max_workers * 2개 구간만 메모리에 유지
+            for window in shards:
+                in_flight.append(executor.submit(fetch_shard, window))
+                if len(in_flight) >= max(1, max_workers) * 2:
+                    break
+            while in_flight:
+                items = in_flight.pop(0).result()
+                window = next(shards, None)
+                if window is not None:
+                    in_flight.append(executor.submit(fetch_shard, window))
+                yield from items
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_articles_sharded(self,
+                              date_from: str,
+                              date_to: str = None,
+                              keyword: str = None,
+                              company_name: str = None,
+                              symbols: str = None,
+                              shard_items: int = 1000,
+                              max_workers: int = 8) -> Iterator[Dict[str, Any]]:
+        """국내 기사를 기간 구간별로 병렬 조회해 최신순으로 반환 (iter_sharded 참고)"""
+        return self.iter_sharded(self.get_articles, date_from, date_to, shard_items, max_workers,
+                                 keyword=keyword, company_name=company_name, symbols=symbols)
+
+    def iter_global_articles_sharded(self,
+                                     date_from: str,
+                                     date_to: str = None,
+                                     keyword: str = None,
+                                     company_name: str = None,
+                                     symbols: str = None,
+                                     shard_items: int = 1000,
+                                     max_workers: int = 8) -> Iterator[Dict[str, Any]]:
+        """해외 기사를 기간 구간별로 병렬 조회해 최신순으로 반환 (iter_sharded 참고)"""
+        return self.iter_sharded(self.get_global_articles, date_from, date_to, shard_items, max_workers,
+                                 keyword=keyword, company_name=company_name, symbols=symbols)
+
+    def iter_filings_sharded(self,
+                             date_from: str,
+                             date_to: str = None,
+                             keyword: str = None,
+                             company_name: str = None,
+                             symbol: str = None,
+                             shard_items: int = 1000,
+                             max_workers: int = 8) -> Iterator[Dict[str, Any]]:
+        """해외 공시를 기간 구간별로 병렬 조회해 최신순으로 반환 (iter_sharded 참고)"""
+        return self.iter_sharded(self.get_filings, date_from, date_to, shard_items, max_workers,
+                                 keyword=keyword, company_name=company_name, symbol=symbol)
+
     def download_briefing_csv(self, 
                              briefing_type: str,
                              date: str) -> bytes:
@@ -422,33 +721,174 @@ class DeepsearchClient:
             "api_key": self.api_key
         }
         
-        try:
-            response = requests.get(f"{self.base_url}/briefings/csv/{briefing_type}", params=params)
+        def send():
+            response = self.transport.get(f"{self.base_url}/briefings/csv/{briefing_type}", params=params)
             response.raise_for_status()
             return response.content
+        
+        try:
+            return call_with_retry(send, get_circuit_breaker("deepsearch", "/briefings/csv"))
         except requests.exceptions.RequestException as e:
             print(f"CSV 다운로드 실패: {e}")
             return None
+    
+    def _open_briefing_stream(self, briefing_type: str, date: str) -> requests.Response:
+        """브리핑 CSV 스트리밍 응답을 엽니다. (본문은 아직 읽지 않음)"""
+        params = {
+            "date": date,
+            "api_key": self.api_key
+        }
+        
+        def send():
+            response = self.transport.get(f"{self.base_url}/briefings/csv/{briefing_type}",
+                                          params=params, stream=True)
+            try:
+                response.raise_for_status()
+            except requests.exceptions.HTTPError:
+                response.close()
+                raise
+            # gzip 등 전송 인코딩을 풀어서 읽도록 설정
+            response.raw.decode_content = True
+            return response
+        
+        return call_with_retry(send, get_circuit_breaker("deepsearch", "/briefings/csv"))
+    
+    def download_briefing_csv_to(self, 
+                                 briefing_type: str,
+                                 date: str,
+                                 destination: Union[str, Path, BinaryIO],
+                                 chunk_size: int = 1 << 16,
+                                 raise_on_error: bool = False) -> Optional[int]:
+        """
+        브리핑 CSV를 메모리에 모으지 않고 파일로 바로 저장
+        
+        Args:
+            briefing_type: 브리핑 타입 (stock, etf, global-stock, global-etf)
+            date: 날짜 (YYYYMMDD)
+            destination: 저장할 경로 또는 쓰기 가능한 바이너리 파일 객체
+            chunk_size: 한 번에 쓰는 바이트 수
+            raise_on_error: True이면 실패 시 None 대신 예외를 그대로 발생 (상태 코드 확인용)
+        
+        Returns:
+            저장한 바이트 수 (실패 시 None)
+        """
+        to_path = isinstance(destination, (str, Path))
+        tmp_path = None
+        
+        try:
+            with self._open_briefing_stream(briefing_type, date) as response:
+                if to_path:
+                    # 완료된 파일만 보이도록 임시 파일에 쓴 뒤 교체
+                    path = Path(destination)
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = path.with_name(f".{path.name}.part")
+                    with open(tmp_path, 'wb') as f:
+                        written = self._copy_stream(response, f, chunk_size)
+                    tmp_path.replace(path)
+                    tmp_path = None
+                else:
+                    written = self._copy_stream(response, destination, chunk_size)
+            return written
+        except (requests.exceptions.RequestException, OSError) as e:
+            if raise_on_error:
+                raise
+            print(f"CSV 다운로드 실패: {e}")
+            return None
+        finally:
+            if tmp_path is not None and tmp_path.exists():
+                tmp_path.unlink()
+    
+    @staticmethod
+    def _copy_stream(response: requests.Response, out: BinaryIO, chunk_size: int) -> int:
+        written = 0
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            if chunk:
+                out.write(chunk)
+                written += len(chunk)
+        return written
+    
+    def iter_briefing_csv(self, 
+                          briefing_type: str,
+                          date: str,
+                          chunksize: int = 50_000,
+                          engine: str = "pandas",
+                          encoding: str = "utf-8") -> Iterator[Any]:
+        """
+        브리핑 CSV를 내려받는 동시에 점진적으로 파싱하여 배치 단위로 반환
+        
+        전체 파일을 메모리에 올리지 않으므로 global-stock, global-etf 같은 큰 브리핑도
+        일정한 메모리로 처리할 수 있습니다.
+        
+        Args:
+            briefing_type: 브리핑 타입 (stock, etf, global-stock, global-etf)
+            date: 날짜 (YYYYMMDD)
+            chunksize: pandas 엔진에서 DataFrame 하나당 행 수
+            engine: "pandas" (DataFrame 청크) 또는 "arrow" (pyarrow RecordBatch)
+            encoding: CSV 인코딩
+        """
+        if engine not in ("pandas", "arrow"):
+            raise ValueError(f"지원하지 않는 엔진: {engine}")
+        
+        try:
+            response = self._open_briefing_stream(briefing_type, date)
+        except requests.exceptions.RequestException as e:
+            print(f"CSV 다운로드 실패: {e}")
+            return
+        
+        with response:
+            if engine == "arrow":
+                from pyarrow import csv as pa_csv
+                
+                reader = pa_csv.open_csv(response.raw, read_options=pa_csv.ReadOptions(encoding=encoding))
+                for batch in reader:
+                    yield batch
+            else:
+                import pandas as pd
+                
+                with pd.read_csv(response.raw, chunksize=chunksize, encoding=encoding) as reader:
+                    for frame in reader:
+                        yield frame
 
 
 class FinnhubClient:
     """Finnhub API 클라이언트"""
     
-    def __init__(self):
+    # get_quotes 결과 컬럼 (현재가/고가/저가/시가/전일종가/시각)
+    QUOTE_FIELDS = ("c", "h", "l", "o", "pc", "t")
+    
+    def __init__(self, transport: HTTPTransport = None):
         self.api_key = get_api_key("FINNHUB_API_KEY")
         self.base_url = "https://finnhub.io/api/v1"
+        self.transport = transport or get_transport()
+        self.inflight = get_single_flight("finnhub")
+        self.rate_limiter = get_rate_limiter("finnhub", self.api_key)
+        # 심볼별 마지막 시세 스냅샷: {symbol: (조회 시각(epoch), quote)}
+        self._quote_snapshots: Dict[str, tuple] = {}
+        self._quote_snapshots_lock = threading.Lock()
     
     def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """API 요청을 수행합니다."""
+        """API 요청을 수행합니다. 동일한 요청이 이미 진행 중이면 그 결과를 공유합니다."""
         if params is None:
             params = {}
         
+        request_key = ResponseCache.make_key(endpoint, params)
+        return self.inflight.do(request_key, lambda: self._fetch(endpoint, params))
+    
+    def _fetch(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """네트워크 요청을 수행합니다."""
         params["token"] = self.api_key
         
-        try:
-            response = requests.get(f"{self.base_url}{endpoint}", params=params)
+        def send():
+            # API 키별 호출 한도에 맞춰 전송 (429 시 Retry-After 후 재시도)
+            response = send_with_rate_limit(
+                self.rate_limiter,
+                lambda: self.transport.get(f"{self.base_url}{endpoint}", params=params)
+            )
             response.raise_for_status()
             return response.json()
+        
+        try:
+            return call_with_retry(send, get_circuit_breaker("finnhub", endpoint))
         except requests.exceptions.RequestException as e:
             print(f"Finnhub API 요청 실패: {e}")
             return {"error": str(e)}
@@ -457,6 +897,75 @@ class FinnhubClient:
         """주식 현재가 조회"""
         return self._make_request("/quote", {"symbol": symbol})
     
+    def get_quotes(self, 
+                   symbols: List[str],
+                   max_age: float = None,
+                   max_workers: int = 8):
+        """
+        여러 종목의 현재가를 한 번에 조회하여 컬럼형 DataFrame으로 반환
+        
+        호출은 API 키의 호출 한도(rate_limiter) 안에서 동시에 수행되며, 중복 심볼은 한 번만 조회합니다.
+        
+        Args:
+            symbols: 종목 심볼 목록 (예: ["AAPL", "MSFT"])
+            max_age: 이 시간(초)보다 최근에 조회한 심볼은 다시 요청하지 않고 스냅샷 사용
+                     (None이면 모두 새로 조회)
+            max_workers: 동시 요청 스레드 수
+        
+        Returns:
+            symbol 인덱스, c/h/l/o/pc/t/fetched_at/error 컬럼의 DataFrame
+        """
+        import numpy as np
+        import pandas as pd
+        
+        unique_symbols = list(dict.fromkeys(symbol.strip() for symbol in symbols if symbol and symbol.strip()))
+        now = time.time()
+        
+        with self._quote_snapshots_lock:
+            if max_age is None:
+                stale = unique_symbols
+            else:
+                stale = [symbol for symbol in unique_symbols
+                         if symbol not in self._quote_snapshots
+                         or now - self._quote_snapshots[symbol][0] > max_age]
+        
+        errors: Dict[str, str] = {}
+        if stale:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(stale))),
+                                    thread_name_prefix="finnhub-quotes") as executor:
+                for symbol, quote in zip(stale, executor.map(self.get_quote, stale)):
+                    if not isinstance(quote, dict) or "error" in quote:
+                        errors[symbol] = quote.get("error", "invalid response") if isinstance(quote, dict) \
+                            else "invalid response"
+                    elif not quote.get("t"):
+                        # 존재하지 않는 심볼은 모든 값이 0으로 반환됨
+                        errors[symbol] = "no data"
+                    else:
+                        with self._quote_snapshots_lock:
+                            self._quote_snapshots[symbol] = (time.time(), quote)
+        
+        size = len(unique_symbols)
+        columns = {field: np.full(size, np.nan) for field in self.QUOTE_FIELDS}
+        fetched_at = np.full(size, np.nan)
+        error_column = np.full(size, None, dtype=object)
+        
+        with self._quote_snapshots_lock:
+            for i, symbol in enumerate(unique_symbols):
+                if symbol in errors or symbol not in self._quote_snapshots:
+                    error_column[i] = errors.get(symbol, "no data")
+                    continue
+                fetched_at[i], quote = self._quote_snapshots[symbol]
+                for field in self.QUOTE_FIELDS:
+                    value = quote.get(field)
+                    if value is not None:
+                        columns[field][i] = value
+        
+        frame = pd.DataFrame(columns, index=pd.Index(unique_symbols, name="symbol"))
+        frame["t"] = frame["t"].astype("Int64")
+        frame["fetched_at"] = pd.to_datetime(fetched_at, unit="s")
+        frame["error"] = error_column
+        return frame
+    
     def get_company_profile(self, symbol: str) -> Dict[str, Any]:
         """회사 프로필 조회"""
         return self._make_request("/stock/profile2", {"symbol": symbol})
@@ -497,26 +1006,33 @@ class FinnhubClient:
 class SlackClient:
     """Slack API 클라이언트"""
     
-    def __init__(self):
+    def __init__(self, transport: HTTPTransport = None):
         self.token = get_api_key("SLACK_BOT_TOKEN")  # Bot Token 사용
         self.base_url = "https://slack.com/api"
+        self.transport = transport or get_transport()
         self.headers = {
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json"
         }
     
     def _make_request(self, method: str, endpoint: str, data: Dict[str, Any] = None) -> Dict[str, Any]:
-        """API 요청을 수행합니다."""
+        """API 요청을 수행합니다. 메서드별 호출 tier에 맞춰 속도를 조절합니다."""
         url = f"{self.base_url}{endpoint}"
         
-        try:
+        def request():
             if method.upper() == "POST":
-                response = requests.post(url, headers=self.headers, json=data)
-            else:
-                response = requests.get(url, headers=self.headers, params=data)
-            
+                return self.transport.post(url, headers=self.headers, json=data)
+            return self.transport.get(url, headers=self.headers, params=data)
+        
+        def send():
+            response = send_with_rate_limit(get_rate_limiter("slack", self.token, endpoint), request)
             response.raise_for_status()
             return response.json()
+        
+        try:
+            # POST(메시지 전송 등)는 중복 전송을 피하기 위해 재시도하지 않음
+            return call_with_retry(send, get_circuit_breaker("slack", endpoint),
+                                   idempotent=method.upper() != "POST")
         except requests.exceptions.RequestException as e:
             print(f"Slack API 요청 실패: {e}")
             return {"error": str(e)}
@@ -532,6 +1048,18 @@ class SlackClient:
             
         return self._make_request("POST", "/chat.postMessage", data)
     
+    def enqueue_message(self, channel: str, text: str, blocks: List[Dict[str, Any]] = None):
+        """
+        메시지를 백그라운드 전송 큐에 넣고 바로 반환합니다.
+        같은 채널에 짧은 시간 안에 들어온 메시지는 하나로 합쳐 전송됩니다. (slack_queue 참고)
+        
+        Returns:
+            전송 결과(Slack 응답)로 완료되는 concurrent.futures.Future
+        """
+        from slack_queue import get_slack_queue
+        
+        return get_slack_queue(self).enqueue(channel, text, blocks)
+    
     def upload_file(self, channels: str, file_content: bytes, filename: str, title: str = None) -> Dict[str, Any]:
         """파일 업로드"""
         headers = {
@@ -549,19 +1077,169 @@ class SlackClient:
             "file": (filename, file_content)
         }
         
-        try:
-            response = requests.post(f"{self.base_url}/files.upload", headers=headers, data=data, files=files)
+        def send():
+            response = send_with_rate_limit(
+                get_rate_limiter("slack", self.token, "/files.upload"),
+                lambda: self.transport.post(f"{self.base_url}/files.upload", headers=headers, data=data, files=files)
+            )
             response.raise_for_status()
             return response.json()
+        
+        try:
+            return call_with_retry(send, get_circuit_breaker("slack", "/files.upload"), idempotent=False)
         except requests.exceptions.RequestException as e:
             print(f"파일 업로드 실패: {e}")
             return {"error": str(e)}
-    
+
+    def upload_file_stream(self,
+                           channels: str,
+                           file: Union[str, Path, BinaryIO],
+                           filename: str = None,
+                           title: str = None,
+                           length: int = None,
+                           chunk_size: int = 1 << 20,
+                           progress: Callable[[int, int], None] = None) -> Dict[str, Any]:
+        """
+        대용량 파일 업로드 (외부 업로드 방식)
+
+        files.getUploadURLExternal로 업로드 URL을 받고, 파일을 chunk_size 단위로 읽어 스트리밍한 뒤
+        files.completeUploadExternal로 채널에 공유합니다. 파일 전체를 메모리에 올리지 않습니다.
+
+        Args:
+            channels: 공유할 채널 ID (쉼표로 구분)
+            file: 파일 경로 또는 바이너리 스트림
+            filename: 파일 이름 (기본값: 경로의 파일 이름)
+            title: 파일 제목
+            length: 스트림 크기 (바이트, 모르면 seek 또는 임시 파일로 계산)
+            chunk_size: 전송 단위 (바이트)
+            progress: 청크를 보낼 때마다 progress(보낸 바이트, 전체 바이트)로 호출
+        """
+        if isinstance(file, (str, Path)):
+            path = Path(file)
+            with open(path, 'rb') as stream:
+                return self.upload_file_stream(channels, stream, filename or path.name, title,
+                                               path.stat().st_size, chunk_size, progress)
+
+        # 임시 파일로 옮기기 전에 원래 스트림에서 이름을 정함 (fd로 연 파일은 name이 정수)
+        name = getattr(file, "name", None)
+        filename = filename or (name if isinstance(name, str) else None) or "upload.bin"
+        filename = Path(filename).name
+
+        if length is None:
+            length = _stream_length(file)
+        if length is None:
+            # 크기를 알 수 없는 스트림은 임시 파일(일정 크기 이상은 디스크)로 옮긴 뒤 업로드
+            import shutil
+            import tempfile
+
+            with tempfile.SpooledTemporaryFile(max_size=chunk_size) as spooled:
+                shutil.copyfileobj(file, spooled, chunk_size)
+                length = spooled.tell()
+                spooled.seek(0)
+                return self.upload_file_stream(channels, spooled, filename, title, length, chunk_size, progress)
+
+        # 1. 업로드 URL 발급
+        ticket = self._make_request("GET", "/files.getUploadURLExternal", {"filename": filename, "length": length})
+        if "error" in ticket or not ticket.get("ok", True):
+            print(f"업로드 URL 발급 실패: {ticket.get('error')}")
+            return ticket
+
+        # 2. 파일 본문 스트리밍
+        body = _UploadBody(file, length, chunk_size, progress)
+
+        def send():
+            response = self.transport.post(ticket["upload_url"], data=body,
+                                           headers={"Content-Type": "application/octet-stream"})
+            response.raise_for_status()
+            return response
+
+        try:
+            # 스트림은 다시 읽을 수 없으므로 재시도하지 않음
+            call_with_retry(send, get_circuit_breaker("slack", "/files.uploadExternal"), idempotent=False)
+        except requests.exceptions.RequestException as e:
+            print(f"파일 업로드 실패: {e}")
+            return {"error": str(e)}
+
+        # 3. 업로드 완료 및 채널 공유
+        files = [{"id": ticket["file_id"], "title": title or filename}]
+        data: Dict[str, Any] = {"files": files}
+        if channels:
+            channel_ids = [channel.strip() for channel in channels.split(",") if channel.strip()]
+            if len(channel_ids) == 1:
+                data["channel_id"] = channel_ids[0]
+            else:
+                data["channels"] = ",".join(channel_ids)
+        return self._make_request("POST", "/files.completeUploadExternal", data)
+
+    def upload_files(self,
+                     uploads: List[Dict[str, Any]],
+                     max_workers: int = 3) -> List[Dict[str, Any]]:
+        """
+        여러 파일을 동시에 업로드합니다.
+
+        Args:
+            uploads: upload_file_stream 인자 목록 (예: [{"channels": "C123", "file": "report.pdf"}, ...])
+            max_workers: 동시 업로드 수
+
+        Returns:
+            입력 순서대로의 업로드 결과
+        """
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="slack-upload") as executor:
+            futures = [executor.submit(self.upload_file_stream, **upload) for upload in uploads]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append({"error": str(e)})
+            return results
+
     def get_channels(self) -> Dict[str, Any]:
         """채널 목록 조회"""
         return self._make_request("GET", "/conversations.list")
 
 
+class _UploadBody:
+    """
+    업로드 본문 스트림
+    
+    requests가 Content-Length(__len__)를 붙이고 chunked 인코딩 없이 청크 단위로 보내도록
+    __iter__/__len__만 제공하며, 청크를 보낼 때마다 진행률 콜백을 호출합니다.
+    """
+    
+    def __init__(self, stream: BinaryIO, length: int, chunk_size: int,
+                 progress: Callable[[int, int], None] = None):
+        self.stream = stream
+        self.length = length
+        self.chunk_size = chunk_size
+        self.progress = progress
+    
+    def __len__(self) -> int:
+        return self.length
+    
+    def __iter__(self) -> Iterator[bytes]:
+        sent = 0
+        while sent < self.length:
+            chunk = self.stream.read(min(self.chunk_size, self.length - sent))
+            if not chunk:
+                raise IOError(f"스트림이 예상보다 일찍 끝났습니다 ({sent}/{self.length} 바이트)")
+            sent += len(chunk)
+            if self.progress:
+                self.progress(sent, self.length)
+            yield chunk
+
+
+def _stream_length(stream: BinaryIO) -> Optional[int]:
+    """seek 가능한 스트림의 남은 크기를 반환합니다. 알 수 없으면 None."""
+    try:
+        position = stream.tell()
+        end = stream.seek(0, 2)
+        stream.seek(position)
+        return end - position
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
 # 사용 예제
 if __name__ == "__main__":
     # Deepsearch 클라이언트 테스트
@@ -584,3 +1262,27 @@ if __name__ == "__main__":
         page_size=5
     )
     print("Apple 해외 뉴스:", json.dumps(global_articles, ensure_ascii=False, indent=2))
+    
+    # 한 달치 삼성전자 기사를 페이지 구분 없이 스트리밍
+    count = 0
+    for article in deepsearch.iter_articles(company_name="삼성전자",
+                                            date_from="2024-01-01",
+                                            date_to="2024-01-31",
+                                            max_items=500):
+        count += 1
+    print(f"삼성전자 1월 기사: {count}개")
+    
+    # 캐시 통계
+    if deepsearch.cache:
+        print("캐시 통계:", deepsearch.cache.stats())
+    
+    # 서킷 브레이커 상태
+    print("서킷 상태:", get_circuit_states())
+    
+    # 여러 종목 현재가 일괄 조회 (5분 이내 조회한 심볼은 재사용)
+    finnhub = FinnhubClient()
+    quotes = finnhub.get_quotes(["AAPL", "MSFT", "NVDA", "AAPL"], max_age=300)
+    print("현재가:", quotes[["c", "pc", "error"]])
+    
+    # 커넥션 풀 재사용 현황
+    print("커넥션 풀 통계:", json.dumps(deepsearch.transport.get_pool_stats(), ensure_ascii=False, indent=2))
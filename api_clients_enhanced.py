@@ -4,48 +4,159 @@
 """
 
 import requests
+import inspect
 import json
-from typing import Dict, List, Optional, Any, Union
+import threading
+import time
+from typing import Dict, List, Optional, Any, Union, Iterator, Tuple
 from datetime import datetime, date
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
 from config import get_api_key, get_endpoint
+from config_compat import get_capability_config
+from http_transport import HTTPTransport, get_transport
+from resilience import call_with_retry, get_circuit_breaker
+from api_capabilities import CapabilityMap, PROBE_PARAMS
 
 
 class EnhancedDeepsearchClient:
     """향상된 Deepsearch API 클라이언트 - 권한 제한 대응"""
     
-    def __init__(self):
+    # 권한이 없을 때(403) 대신 호출할 대안 메서드 (정확히 같은 엔드포인트만 대체, ID 경로는 대체하지 않음)
+    ALTERNATIVE_ROUTES = {
+        "/articles/topics": "get_articles_with_alternative_search",
+        "/articles/topics/trending": "get_trending_alternative",
+        "/filings": "get_disclosure_alternative"
+    }
+    
+    def __init__(self, transport: HTTPTransport = None, capabilities: CapabilityMap = None, probe: bool = True):
+        """
+        Args:
+            transport: 공유 HTTP 전송 계층
+            capabilities: 엔드포인트 권한 맵 (기본값: API 키별 파일 저장 맵)
+            probe: 시작 시 확인 기록이 없거나 만료된 엔드포인트의 권한을 백그라운드에서 동시에 확인할지 여부
+                   (권한 맵이 TTL 안에 있으면 요청을 보내지 않으며, 생성자는 확인을 기다리지 않음)
+        """
         self.api_key = get_api_key("DEEPSEARCH_API_KEY")
         self.base_url = "https://api-v2.deepsearch.com/v1"
+        self.transport = transport or get_transport()
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+        self.capabilities = capabilities or CapabilityMap(self.api_key)
+        self._probe_done: Optional[threading.Event] = None
+        if probe and self.capabilities.stale_endpoints():
+            self._probe_done = threading.Event()
+            threading.Thread(target=self._probe_capabilities, name="capability-probe", daemon=True).start()
     
-    def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """API 요청을 수행합니다."""
+    def _probe_capabilities(self):
+        try:
+            self.capabilities.probe(self._probe_status)
+        finally:
+            self._probe_done.set()
+    
+    def _known_permission(self, endpoint: str) -> Optional[bool]:
+        """권한 맵의 기록을 반환합니다. 시작 시 확인이 진행 중이면 결과를 잠시 기다려 403 요청을 피합니다."""
+        allowed = self.capabilities.is_allowed(endpoint)
+        if allowed is None and self._probe_done is not None and not self._probe_done.is_set():
+            self._probe_done.wait(get_capability_config("PROBE_TIMEOUT") or 5)
+            allowed = self.capabilities.is_allowed(endpoint)
+        return allowed
+    
+    def _probe_status(self, endpoint: str) -> int:
+        """권한 확인용 최소 요청(엔드포인트별 필수 파라미터 포함)을 보내고 상태 코드를 반환합니다."""
+        params = {"api_key": self.api_key, "page_size": 1, **PROBE_PARAMS.get(endpoint, {})}
+        response = self.transport.get(f"{self.base_url}{endpoint}",
+                                      params=params,
+                                      headers=self.headers,
+                                      timeout=get_capability_config("PROBE_TIMEOUT") or 5)
+        return response.status_code
+    
+    def _route_alternative(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        권한이 없는 엔드포인트 요청을 대안 메서드로 보냅니다.
+        대안이 없거나, 대안이 요청 파라미터를 모두 반영할 수 없으면 None (호출자가 403 오류를 반환).
+        """
+        method_name = self.ALTERNATIVE_ROUTES.get(endpoint)
+        if method_name is None:
+            return None
+        
+        method = getattr(self, method_name)
+        accepted = inspect.signature(method).parameters
+        kwargs = {}
+        for key, value in params.items():
+            if key == "api_key" or value is None:
+                continue
+            if key == "symbol" and "symbol" not in accepted:
+                key = "symbols"
+            if key not in accepted:
+                # 조건을 무시한 결과를 돌려주지 않도록 대체하지 않음
+                return None
+            kwargs[key] = value
+        
+        result = method(**kwargs)
+        if result is None:
+            return None
+        result = dict(result)
+        result["_routed_from"] = endpoint
+        return result
+    
+    def _make_request(self, endpoint: str, params: Dict[str, Any] = None, timeout: float = None) -> Dict[str, Any]:
+        """
+        API 요청을 수행합니다.
+        
+        권한 맵에 403으로 기록된 엔드포인트는 요청 없이 대안 메서드로 보내며,
+        처음 403을 받은 엔드포인트도 기록한 뒤 대안으로 보냅니다.
+        """
         if params is None:
             params = {}
         
+        allowed = self._known_permission(endpoint)
+        if allowed is False:
+            routed = self._route_alternative(endpoint, params)
+            if routed is not None:
+                return routed
+            return {"error": f"API 권한 없음 (403): {endpoint}"}
+        
         # API 키를 파라미터에 추가
         params["api_key"] = self.api_key
         
-        try:
-            response = requests.get(f"{self.base_url}{endpoint}", params=params, headers=self.headers)
+        request_kwargs = {"params": params, "headers": self.headers}
+        if timeout is not None:
+            request_kwargs["timeout"] = timeout
+        
+        def send():
+            response = self.transport.get(f"{self.base_url}{endpoint}", **request_kwargs)
             response.raise_for_status()
             return response.json()
+        
+        try:
+            result = call_with_retry(send, get_circuit_breaker("deepsearch", endpoint))
+        except requests.exceptions.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if status is not None:
+                self.capabilities.record(endpoint, status)
+            if status == 403:
+                routed = self._route_alternative(endpoint, params)
+                if routed is not None:
+                    return routed
+            print(f"API 요청 실패: {e}")
+            return {"error": str(e)}
         except requests.exceptions.RequestException as e:
             print(f"API 요청 실패: {e}")
             return {"error": str(e)}
+        
+        if allowed is None:
+            self.capabilities.record(endpoint, 200)
+        return result
     
     def _check_api_permission(self, endpoint: str) -> bool:
-        """API 권한을 확인합니다."""
-        try:
-            response = requests.get(f"{self.base_url}{endpoint}", 
-                                  params={"api_key": self.api_key}, 
-                                  headers=self.headers)
-            return response.status_code != 403
-        except:
-            return False
+        """API 권한을 확인합니다. 권한 맵에 유효한 기록이 있으면 요청을 보내지 않습니다."""
+        allowed = self._known_permission(endpoint)
+        if allowed is None:
+            self.capabilities.probe(self._probe_status, [endpoint])
+            allowed = self.capabilities.is_allowed(endpoint)
+        return bool(allowed)
     
     def get_articles_with_alternative_search(self, 
                                            keyword: str = None,
@@ -128,91 +239,206 @@ class EnhancedDeepsearchClient:
     def get_company_analysis(self, 
                            company_name: str,
                            date_from: str = None,
-                           date_to: str = None) -> Dict[str, Any]:
+                           date_to: str = None,
+                           source_timeout: float = 15.0) -> Dict[str, Any]:
         """
-        기업 종합 분석 - 여러 소스에서 정보 수집
+        기업 종합 분석 - 여러 소스에서 정보를 동시에 수집
+        
+        각 소스는 병렬로 요청되며, source_timeout 안에 응답하지 않거나 실패한 소스는
+        {"error": ...} 로 표시되고 나머지 결과는 그대로 반환됩니다.
+        
+        Args:
+            company_name: 기업명
+            date_from: 시작 날짜 (YYYY-MM-DD)
+            date_to: 종료 날짜 (YYYY-MM-DD)
+            source_timeout: 소스별 타임아웃 (초)
         """
         analysis = {
             "company_name": company_name,
             "analysis_date": datetime.now().isoformat(),
-            "data_sources": {}
+            "data_sources": {},
+            "timings": {},
+            "errors": {}
         }
         
-        # 1. 국내 뉴스
-        domestic_news = self._make_request("/articles", {
-            "company_name": company_name,
-            "date_from": date_from,
-            "date_to": date_to,
-            "page_size": 10
-        })
-        analysis["data_sources"]["domestic_news"] = domestic_news
+        sources = {
+            # 1. 국내 뉴스
+            "domestic_news": ("/articles", {
+                "company_name": company_name,
+                "date_from": date_from,
+                "date_to": date_to,
+                "page_size": 10
+            }),
+            # 2. 해외 뉴스
+            "global_news": ("/global-articles", {
+                "company_name": company_name,
+                "date_from": date_from,
+                "date_to": date_to,
+                "page_size": 10
+            }),
+            # 3. 국내 공시
+            "disclosure": ("/articles/documents/disclosure", {
+                "company_name": company_name,
+                "date_from": date_from,
+                "date_to": date_to,
+                "page_size": 10
+            }),
+            # 4. 집계 데이터 (기업별 언급 횟수)
+            "media_coverage": ("/articles/aggregation", {
+                "keyword": company_name,
+                "groupby": "publisher",
+                "date_from": date_from,
+                "date_to": date_to,
+                "page_size": 10
+            })
+        }
         
-        # 2. 해외 뉴스
-        global_news = self._make_request("/global-articles", {
-            "company_name": company_name,
-            "date_from": date_from,
-            "date_to": date_to,
-            "page_size": 10
-        })
-        analysis["data_sources"]["global_news"] = global_news
+        def fetch(endpoint: str, params: Dict[str, Any]):
+            started = time.perf_counter()
+            result = self._make_request(endpoint, params, timeout=source_timeout)
+            return result, time.perf_counter() - started
         
-        # 3. 국내 공시
-        disclosure = self._make_request("/articles/documents/disclosure", {
-            "company_name": company_name,
-            "date_from": date_from,
-            "date_to": date_to,
-            "page_size": 10
-        })
-        analysis["data_sources"]["disclosure"] = disclosure
+        started = time.perf_counter()
+        executor = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="company-analysis")
+        futures = {name: executor.submit(fetch, endpoint, params)
+                   for name, (endpoint, params) in sources.items()}
         
-        # 4. 집계 데이터 (기업별 언급 횟수)
-        aggregation = self._make_request("/articles/aggregation", {
-            "keyword": company_name,
-            "groupby": "publisher",
-            "date_from": date_from,
-            "date_to": date_to,
-            "page_size": 10
-        })
-        analysis["data_sources"]["media_coverage"] = aggregation
+        try:
+            for name, future in futures.items():
+                remaining = max(source_timeout - (time.perf_counter() - started), 0)
+                try:
+                    result, elapsed = future.result(timeout=remaining)
+                except FutureTimeoutError:
+                    result, elapsed = {"error": f"timeout after {source_timeout}s"}, time.perf_counter() - started
+                except Exception as e:
+                    result, elapsed = {"error": str(e)}, time.perf_counter() - started
+                
+                analysis["data_sources"][name] = result
+                analysis["timings"][name] = round(elapsed, 3)
+                if isinstance(result, dict) and "error" in result:
+                    analysis["errors"][name] = result["error"]
+        finally:
+            # 늦은 소스를 기다리지 않고 반환
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        analysis["timings"]["total"] = round(time.perf_counter() - started, 3)
+        analysis["partial"] = bool(analysis["errors"])
         
         return analysis
     
-    def get_sector_analysis(self, 
-                          sector_keywords: List[str],
-                          date_from: str = None,
-                          date_to: str = None) -> Dict[str, Any]:
-        """
-        섹터 분석 - 여러 키워드에 대한 종합 분석
-        """
-        sector_analysis = {
-            "sector_keywords": sector_keywords,
-            "analysis_date": datetime.now().isoformat(),
-            "sector_data": {}
-        }
-        
-        for keyword in sector_keywords:
+    def _sector_queries(self,
+                        keyword: str,
+                        date_from: str = None,
+                        date_to: str = None) -> Dict[str, tuple]:
+        """섹터 분석에서 키워드별로 수행할 요청 목록"""
+        return {
             # 키워드별 뉴스 분석
-            news_data = self._make_request("/articles", {
+            "news": ("/articles", {
                 "keyword": keyword,
                 "date_from": date_from,
                 "date_to": date_to,
                 "page_size": 20
-            })
-            
+            }),
             # 키워드별 집계 분석
-            aggregation_data = self._make_request("/articles/aggregation", {
+            "companies": ("/articles/aggregation", {
                 "keyword": keyword,
                 "groupby": "companies.name",
                 "date_from": date_from,
                 "date_to": date_to,
                 "page_size": 10
             })
+        }
+    
+    def iter_sector_analysis(self, 
+                             sector_keywords: List[str],
+                             date_from: str = None,
+                             date_to: str = None,
+                             max_concurrency: int = 8,
+                             kinds: Tuple[str, ...] = ("news", "companies")) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        섹터 분석 (병렬) - 키워드×요청 쌍을 max_concurrency 이내로 동시에 실행하고
+        키워드별 결과가 모두 모이는 즉시 (keyword, {"news": ..., "companies": ...}) 를 반환합니다.
+        
+        반환 순서는 완료 순서이며 입력 순서와 다를 수 있습니다.
+        kinds로 수행할 요청 종류를 제한할 수 있습니다.
+        """
+        keywords = list(dict.fromkeys(sector_keywords))
+        executor = ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="sector-analysis")
+        futures = {}
+        pending: Dict[str, Dict[str, Any]] = {}
+        
+        try:
+            for keyword in keywords:
+                pending[keyword] = {}
+                for kind, (endpoint, params) in self._sector_queries(keyword, date_from, date_to).items():
+                    if kind in kinds:
+                        futures[executor.submit(self._make_request, endpoint, params)] = (keyword, kind)
             
-            sector_analysis["sector_data"][keyword] = {
-                "news": news_data,
-                "companies": aggregation_data
+            for future in as_completed(futures):
+                keyword, kind = futures[future]
+                try:
+                    pending[keyword][kind] = future.result()
+                except Exception as e:
+                    pending[keyword][kind] = {"error": str(e)}
+                
+                if len(pending[keyword]) == len(kinds):
+                    result = pending.pop(keyword)
+                    yield keyword, {kind: result[kind] for kind in kinds}
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def get_sector_analysis(self, 
+                          sector_keywords: List[str],
+                          date_from: str = None,
+                          date_to: str = None,
+                          parallel: bool = False,
+                          max_concurrency: int = 8,
+                          local_aggregator=None) -> Dict[str, Any]:
+        """
+        섹터 분석 - 여러 키워드에 대한 종합 분석
+        
+        Args:
+            sector_keywords: 분석할 키워드 목록
+            date_from: 시작 날짜 (YYYY-MM-DD)
+            date_to: 종료 날짜 (YYYY-MM-DD)
+            parallel: True이면 iter_sector_analysis로 병렬 수집
+            max_concurrency: 병렬 수집 시 동시 요청 수 상한
+            local_aggregator: article_aggregation.LocalAggregator를 주면 기업별 집계를
+                              키워드마다 API로 조회하지 않고 로컬 저장소에서 한 번에 계산
+                              (기간만큼 동기화하지 않은 키워드는 API로 조회)
+        """
+        sector_analysis = {
+            "sector_keywords": sector_keywords,
+            "analysis_date": datetime.now().isoformat(),
+            "sector_data": {}
+        }
+        
+        kinds = ("news", "companies")
+        companies = {}
+        if local_aggregator is not None:
+            kinds = ("news",)
+            companies = local_aggregator.aggregate_many(list(dict.fromkeys(sector_keywords)), ["companies.name"],
+                                                        date_from=date_from, date_to=date_to, page_size=10)
+        
+        if parallel:
+            results = dict(self.iter_sector_analysis(sector_keywords, date_from, date_to, max_concurrency, kinds))
+        else:
+            results = {
+                keyword: {
+                    kind: self._make_request(endpoint, params)
+                    for kind, (endpoint, params) in self._sector_queries(keyword, date_from, date_to).items()
+                    if kind in kinds
+                }
+                for keyword in sector_keywords
             }
         
+        # 입력 키워드 순서 유지
+        for keyword in sector_keywords:
+            if keyword in results:
+                if keyword in companies:
+                    results[keyword]["companies"] = companies[keyword]["companies.name"]
+                sector_analysis["sector_data"][keyword] = results[keyword]
+        
         return sector_analysis
     
     # 기존 기능들도 포함
@@ -227,16 +453,29 @@ class EnhancedDeepsearchClient:
     def get_aggregation(self, **kwargs):
         """기존 get_aggregation 메서드"""
         return self._make_request("/articles/aggregation", kwargs)
+    
+    def get_topics(self, **kwargs):
+        """토픽 검색 (권한이 없으면 키워드 기반 검색으로 대체)"""
+        return self._make_request("/articles/topics", kwargs)
+    
+    def get_trending_topics(self, **kwargs):
+        """트렌딩 토픽 조회 (권한이 없으면 최신 기사로 대체)"""
+        return self._make_request("/articles/topics/trending", kwargs)
+    
+    def get_filings(self, **kwargs):
+        """해외 공시 검색 (권한이 없으면 국내 공시 문서 검색으로 대체)"""
+        return self._make_request("/filings", kwargs)
 
 
 class SlackClientFixed:
     """수정된 Slack API 클라이언트"""
     
-    def __init__(self):
+    def __init__(self, transport: HTTPTransport = None):
         # Bot Token을 사용해야 합니다
         self.token = get_api_key("SLACK_CLIENT_SECRET")  # 이건 잘못된 토큰
         # 올바른 Bot Token을 설정해야 합니다
         self.base_url = "https://slack.com/api"
+        self.transport = transport or get_transport()
         self.headers = {
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json"
@@ -246,14 +485,18 @@ class SlackClientFixed:
         """API 요청을 수행합니다."""
         url = f"{self.base_url}{endpoint}"
         
-        try:
+        def send():
             if method.upper() == "POST":
-                response = requests.post(url, headers=self.headers, json=data)
+                response = self.transport.post(url, headers=self.headers, json=data)
             else:
-                response = requests.get(url, headers=self.headers, params=data)
+                response = self.transport.get(url, headers=self.headers, params=data)
             
             response.raise_for_status()
             return response.json()
+        
+        try:
+            return call_with_retry(send, get_circuit_breaker("slack", endpoint),
+                                   idempotent=method.upper() != "POST")
         except requests.exceptions.RequestException as e:
             print(f"Slack API 요청 실패: {e}")
             return {"error": str(e)}
@@ -292,7 +535,7 @@ class SlackClientFixed:
         }
         
         try:
-            response = requests.post(f"{self.base_url}/files.upload", headers=headers, data=data, files=files)
+            response = self.transport.post(f"{self.base_url}/files.upload", headers=headers, data=data, files=files)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -320,16 +563,23 @@ if __name__ == "__main__":
     )
     print(f"   국내 뉴스: {analysis['data_sources']['domestic_news'].get('total_items', 0)}개")
     print(f"   해외 뉴스: {analysis['data_sources']['global_news'].get('total_items', 0)}개")
-    print(f"   공시 문서: {analysis['data_sources']['disclosure'].get('total_items', 0)}개\n")
+    print(f"   공시 문서: {analysis['data_sources']['disclosure'].get('total_items', 0)}개")
+    print(f"   소스별 소요 시간: {analysis['timings']}")
+    if analysis['partial']:
+        print(f"   실패한 소스: {list(analysis['errors'])}")
+    print()
     
     # 2. 섹터 분석
     print("2. 반도체 섹터 분석")
     sector_analysis = enhanced_client.get_sector_analysis(
         sector_keywords=["반도체", "메모리", "AI"],
         date_from="2024-01-01",
-        date_to="2024-01-31"
+        date_to="2024-01-31",
+        parallel=True
     )
     for keyword, data in sector_analysis["sector_data"].items():
         print(f"   {keyword}: {data['news'].get('total_items', 0)}개 뉴스, {len(data['companies'].get('data', []))}개 기업")
     
+    print(f"\n   커넥션 풀 통계: {enhanced_client.transport.get_pool_stats()}")
+    
     print("\n=== 테스트 완료 ===")
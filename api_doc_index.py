@@ -0,0 +1,164 @@
+"""
+API 문서 인덱스 모듈
+크롤링한 전체 문서(deepsearch_api_complete.json)를 가벼운 인덱스(JSON)와
+무거운 필드(raw_content, examples)를 담은 바이너리 사이드카로 나눠 저장하고,
+무거운 필드는 접근할 때만 읽는 지연 로딩 문서 모델을 제공합니다.
+"""
+
+import base64
+import json
+import os
+import threading
+import zlib
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional, Union
+
+
+COMPLETE_FILE = "deepsearch_api_complete.json"
+INDEX_FILE = "deepsearch_api_index.json"
+BLOB_FILE = "deepsearch_api_blobs.bin"
+INDEX_VERSION = 1
+
+# 인덱스에 넣지 않고 사이드카에서 필요할 때만 읽는 필드
+LAZY_FIELDS = ("raw_content", "examples")
+
+
+def load_raw_content(section_data: Dict) -> str:
+    """섹션의 raw_content를 반환합니다. 압축 저장(raw_content_z)이면 풀어서 반환합니다."""
+    if "raw_content_z" in section_data:
+        return zlib.decompress(base64.b64decode(section_data["raw_content_z"])).decode("utf-8")
+    return section_data.get("raw_content", "")
+
+
+def write_doc_index(all_docs: Dict, docs_dir: Union[str, Path]) -> Path:
+    """
+    전체 문서를 인덱스 + 사이드카로 저장합니다.
+
+    사이드카에는 섹션/필드별로 zlib 압축한 JSON 블록을 이어 붙이고,
+    인덱스에는 나머지 필드와 각 블록의 (offset, length), 예제 개수를 기록합니다.
+    """
+    docs_dir = Path(docs_dir)
+    index_path = docs_dir / INDEX_FILE
+    blob_path = docs_dir / BLOB_FILE
+
+    index = {"version": INDEX_VERSION, "metadata": all_docs.get("metadata", {}), "sections": {}}
+    offset = 0
+
+    with open(blob_path.with_suffix(".tmp"), 'wb') as blob_file:
+        for section_name, section_data in all_docs.get("sections", {}).items():
+            entry = {key: value for key, value in section_data.items()
+                     if key not in LAZY_FIELDS and key != "raw_content_z"}
+            entry["example_count"] = len(section_data.get("examples", []))
+            entry["_blobs"] = {}
+
+            if "error" not in section_data:
+                lazy_values = {"raw_content": load_raw_content(section_data),
+                               "examples": section_data.get("examples", [])}
+                for field, value in lazy_values.items():
+                    blob = zlib.compress(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+                    blob_file.write(blob)
+                    entry["_blobs"][field] = [offset, len(blob)]
+                    offset += len(blob)
+
+            index["sections"][section_name] = entry
+
+    with open(index_path.with_suffix(".tmp"), 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False)
+
+    # 사이드카를 먼저 교체해야 인덱스가 항상 유효한 오프셋을 가리킵니다
+    os.replace(blob_path.with_suffix(".tmp"), blob_path)
+    os.replace(index_path.with_suffix(".tmp"), index_path)
+    return index_path
+
+
+class LazySection(Mapping):
+    """섹션 데이터 (dict처럼 사용, raw_content / examples는 접근할 때 사이드카에서 읽음)"""
+
+    def __init__(self, docs: "LazyAPIDocs", entry: Dict[str, Any]):
+        self._docs = docs
+        self._entry = entry
+        self._blobs = entry.get("_blobs", {})
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._blobs:
+            return self._docs._read_blob(*self._blobs[key])
+        if key == "_blobs" or key not in self._entry:
+            raise KeyError(key)
+        return self._entry[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._entry:
+            if key != "_blobs":
+                yield key
+        yield from self._blobs
+
+    def __len__(self) -> int:
+        return len(self._entry) - 1 + len(self._blobs)
+
+
+class LazyAPIDocs(Mapping):
+    """
+    지연 로딩 문서 모델 ({"metadata": ..., "sections": {이름: LazySection}})
+
+    인덱스가 없거나 전체 문서보다 오래됐으면 전체 문서를 한 번 읽어 인덱스를 다시 만듭니다.
+    """
+
+    def __init__(self, docs_dir: Union[str, Path] = "deepsearch_docs"):
+        self.docs_dir = Path(docs_dir)
+        self.index_path = self.docs_dir / INDEX_FILE
+        self.blob_path = self.docs_dir / BLOB_FILE
+        self.complete_path = self.docs_dir / COMPLETE_FILE
+        self._blob_file = None
+        self._lock = threading.Lock()
+
+        index = self._load_index()
+        if index is None:
+            if not self.complete_path.exists():
+                raise FileNotFoundError(f"API 문서를 찾을 수 없습니다: {self.complete_path}")
+            with open(self.complete_path, 'r', encoding='utf-8') as f:
+                write_doc_index(json.load(f), self.docs_dir)
+            index = self._load_index()
+
+        self.metadata = index["metadata"]
+        self.sections = {name: LazySection(self, entry) for name, entry in index["sections"].items()}
+
+    def _load_index(self) -> Optional[Dict[str, Any]]:
+        """유효한 인덱스를 읽습니다. 없거나, 전체 문서보다 오래됐거나, 버전이 다르면 None."""
+        if not self.index_path.exists() or not self.blob_path.exists():
+            return None
+        if self.complete_path.exists() and self.index_path.stat().st_mtime < self.complete_path.stat().st_mtime:
+            return None
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return index if index.get("version") == INDEX_VERSION else None
+
+    def _read_blob(self, offset: int, length: int) -> Any:
+        with self._lock:
+            if self._blob_file is None:
+                self._blob_file = open(self.blob_path, 'rb')
+            self._blob_file.seek(offset)
+            blob = self._blob_file.read(length)
+        return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "metadata":
+            return self.metadata
+        if key == "sections":
+            return self.sections
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(("metadata", "sections"))
+
+    def __len__(self) -> int:
+        return 2
+
+    def close(self):
+        with self._lock:
+            if self._blob_file is not None:
+                self._blob_file.close()
+                self._blob_file = None
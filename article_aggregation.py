@@ -0,0 +1,333 @@
+"""
+로컬 기사 집계 모듈
+get_aggregation / get_global_aggregation과 같은 groupby 집계(companies.name, publisher, sections 등)를
+로컬 기사 저장소에서 사전 인코딩된 컬럼과 NumPy 연산으로 계산합니다.
+키워드를 요청 기간만큼 동기화하지 않은 경우에만 해당 키워드를 API로 조회합니다.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+from datetime import date, datetime
+from typing import Dict, List, Optional, Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from config import get_config
+from article_search import ArticleSearchIndex, build_match_query
+
+
+def _company_names(article_companies: List[Any]) -> List[str]:
+    return [company.get("name") or company.get("company_name")
+            for company in article_companies
+            if isinstance(company, dict) and (company.get("name") or company.get("company_name"))]
+
+
+def _company_symbols(article_companies: List[Any]) -> List[str]:
+    return [company["symbol"] for company in article_companies if isinstance(company, dict) and company.get("symbol")]
+
+
+# groupby 필드 → (저장소 컬럼, 값 목록 추출 함수)
+GROUPBY_FIELDS: Dict[str, tuple] = {
+    "publisher": ("publisher", lambda value: [value] if value else []),
+    "sections": ("sections", lambda values: [value for value in values if value]),
+    "companies.name": ("companies", _company_names),
+    "companies.symbol": ("companies", _company_symbols),
+    # 해외 기사 집계 필드명
+    "company.company_name": ("companies", _company_names),
+}
+
+
+class _GroupColumn:
+    """사전 인코딩된 groupby 컬럼: (기사 행 번호, 값 코드) 쌍과 코드 → 값 사전"""
+
+    def __init__(self, rows: np.ndarray, codes: np.ndarray, categories: np.ndarray):
+        self.rows = rows
+        self.codes = codes
+        self.categories = categories
+
+
+class _Corpus:
+    """출처 하나의 기사 컬럼 스냅샷"""
+
+    def __init__(self, frame: pd.DataFrame, version: Optional[str]):
+        self.version = version
+        self.docids = frame["docid"].to_numpy(dtype=np.int64)
+        self.days = pd.to_datetime(frame["published_date"]).to_numpy(dtype="datetime64[D]")
+        self._frame = frame
+        self._columns: Dict[str, _GroupColumn] = {}
+        # 키워드 → 매칭 기사 마스크 (스냅샷이 바뀌면 함께 버려짐)
+        self.keyword_masks: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.docids)
+
+    def column(self, groupby: str) -> _GroupColumn:
+        """groupby 필드를 (행, 코드) 쌍으로 펼쳐 인코딩합니다. 필드별로 한 번만 계산합니다."""
+        if groupby not in self._columns:
+            source_column, extract = GROUPBY_FIELDS[groupby]
+            values = self._frame[source_column]
+            if source_column != "publisher":
+                values = values.map(lambda text: json.loads(text or "[]"))
+            exploded = values.map(extract).explode().dropna()
+            codes, categories = pd.factorize(exploded)
+            self._columns[groupby] = _GroupColumn(exploded.index.to_numpy(dtype=np.int64),
+                                                  codes.astype(np.int64),
+                                                  np.asarray(categories, dtype=object))
+        return self._columns[groupby]
+
+
+class LocalAggregator:
+    """로컬 기사 저장소 기반 groupby 집계 엔진 (API 폴백 포함)"""
+
+    def __init__(self, db_path: str = None, client=None, search_index: ArticleSearchIndex = None):
+        """
+        Args:
+            db_path: ArticleStore SQLite 파일 경로 (기본값: DATA_DIR/articles.db)
+            client: 폴백에 사용할 DeepsearchClient (기본값: 필요할 때 생성)
+            search_index: 키워드 매칭에 사용할 ArticleSearchIndex
+        """
+        self.db_path = db_path or os.path.join(get_config("DATA_DIR") or "data", "articles.db")
+        self.search_index = search_index or ArticleSearchIndex(self.db_path)
+        self._client = client
+        self._corpora: Dict[str, _Corpus] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        if self._client is None:
+            from api_clients import DeepsearchClient
+            self._client = DeepsearchClient()
+        return self._client
+
+    # ========================================
+    # 코퍼스 적재
+    # ========================================
+
+    def _corpus(self, source: str) -> _Corpus:
+        """출처별 컬럼 스냅샷을 반환합니다. 저장소가 바뀌었으면 다시 읽습니다."""
+        self.search_index.refresh()
+        with self._lock:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                version = conn.execute(
+                    "SELECT MAX(stored_at) FROM articles WHERE source = ?", (source,)).fetchone()[0]
+                corpus = self._corpora.get(source)
+                if corpus is None or corpus.version != version:
+                    frame = pd.read_sql_query("""
+                        SELECT d.docid, a.published_date, a.publisher, a.sections, a.companies
+                        FROM articles a
+                        JOIN articles_fts_docs d
+                          ON d.source = a.source AND d.published_date = a.published_date AND d.id = a.id
+                        WHERE a.source = ?
+                    """, conn, params=(source,))
+                    corpus = _Corpus(frame, version)
+                    self._corpora[source] = corpus
+            finally:
+                conn.close()
+            return corpus
+
+    def covers(self, source: str, keyword: Optional[str], date_from: str = None, date_to: str = None) -> bool:
+        """
+        keyword 쿼리를 오류 없이 동기화한 구간(sync_watermarks)이 요청 기간을 포함하면 True
+
+        keyword 또는 company_name 하나만으로 동기화한 쿼리를 찾으며, keyword가 None이면 조건 없이
+        동기화한 쿼리를 찾습니다. date_from 기본값은 동기화 시작일, date_to 기본값은 오늘입니다.
+        """
+        if keyword:
+            try:
+                build_match_query(keyword)
+            except ValueError:
+                return False
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = conn.execute("""
+                SELECT params, synced_from, covered_to FROM sync_watermarks
+                WHERE source = ? AND synced_from IS NOT NULL AND covered_to IS NOT NULL
+            """, (source,)).fetchall()
+        except sqlite3.OperationalError:
+            # 동기화 구간을 기록하기 전의 저장소
+            return False
+        finally:
+            conn.close()
+
+        wanted = [{"keyword": keyword}, {"company_name": keyword}] if keyword else [{}]
+        end = _to_date(date_to) or date.today()
+        for params, synced_from, covered_to in rows:
+            query = {key: value for key, value in json.loads(params).items() if value}
+            if query not in wanted:
+                continue
+            start = _to_date(date_from) or _to_date(synced_from)
+            if start > end or (_to_date(synced_from) <= start and _to_date(covered_to) >= end):
+                return True
+        return False
+
+    # ========================================
+    # 집계
+    # ========================================
+
+    def _keyword_masks(self, corpus: _Corpus, keywords: List[Optional[str]],
+                       date_from: str, date_to: str) -> np.ndarray:
+        """키워드별 기사 선택 마스크 (키워드 수 × 기사 수)"""
+        in_range = np.ones(len(corpus), dtype=bool)
+        if date_from:
+            in_range &= corpus.days >= np.datetime64(date_from[:10], "D")
+        if date_to:
+            in_range &= corpus.days <= np.datetime64(date_to[:10], "D")
+
+        masks = np.zeros((len(keywords), len(corpus)), dtype=bool)
+        for i, keyword in enumerate(keywords):
+            if keyword:
+                matched = corpus.keyword_masks.get(keyword)
+                if matched is None:
+                    docids = self.search_index.match_docids(keyword)
+                    matched = np.isin(corpus.docids, np.asarray(docids, dtype=np.int64))
+                    corpus.keyword_masks[keyword] = matched
+                masks[i] = matched & in_range
+            else:
+                masks[i] = in_range
+        return masks
+
+    @staticmethod
+    def _count(column: _GroupColumn, masks: np.ndarray) -> np.ndarray:
+        """모든 키워드의 그룹별 기사 수를 한 번에 계산합니다. (키워드 수 × 그룹 수)"""
+        n_groups = len(column.categories)
+        keyword_index, pair_index = np.nonzero(masks[:, column.rows])
+        counts = np.bincount(keyword_index * n_groups + column.codes[pair_index],
+                             minlength=len(masks) * n_groups)
+        return counts.reshape(len(masks), n_groups)
+
+    @staticmethod
+    def _response(counts: np.ndarray, categories: np.ndarray, page: int, page_size: int) -> Dict[str, Any]:
+        """API 집계 응답과 같은 형태로 변환합니다. (건수 내림차순, 같으면 이름순)"""
+        nonzero = np.flatnonzero(counts)
+        order = nonzero[np.lexsort((categories[nonzero].astype(str), -counts[nonzero]))]
+        start = (page - 1) * page_size
+        selected = order[start:start + page_size]
+        total_items = len(order)
+        return {
+            "data": [{"key": categories[i], "count": int(counts[i])} for i in selected],
+            "total_items": total_items,
+            "total_pages": -(-total_items // page_size) if page_size else 0,
+            "page": page,
+            "page_size": page_size,
+            "_local": True
+        }
+
+    def aggregate_many(self,
+                       keywords: List[Optional[str]],
+                       groupbys: List[str],
+                       source: str = "domestic",
+                       date_from: str = None,
+                       date_to: str = None,
+                       page: int = 1,
+                       page_size: int = 10,
+                       fallback: bool = True) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        키워드 × groupby 조합을 한 번에 집계합니다.
+
+        Args:
+            keywords: 검색 키워드 목록 (None이면 기간 내 전체 기사)
+            groupbys: groupby 필드 목록 (GROUPBY_FIELDS 참고)
+            source: "domestic" / "global"
+            fallback: 키워드를 요청 기간만큼 동기화하지 않았으면 해당 키워드는 API로 조회
+
+        Returns:
+            {keyword: {groupby: {"data": [{"key": ..., "count": ...}], "total_items": ...}}}
+        """
+        unknown = [groupby for groupby in groupbys if groupby not in GROUPBY_FIELDS]
+        if fallback and unknown:
+            return self._aggregate_remote(keywords, groupbys, source, date_from, date_to, page, page_size)
+        if unknown:
+            raise ValueError(f"로컬에서 지원하지 않는 groupby: {unknown}")
+
+        remote_keywords = [keyword for keyword in keywords
+                           if fallback and not self.covers(source, keyword, date_from, date_to)]
+        local_keywords = [keyword for keyword in keywords if keyword not in remote_keywords]
+
+        results: Dict[str, Dict[str, Dict[str, Any]]] = {keyword: {} for keyword in keywords}
+        if remote_keywords:
+            results.update(self._aggregate_remote(remote_keywords, groupbys, source, date_from, date_to,
+                                                  page, page_size))
+        if local_keywords:
+            corpus = self._corpus(source)
+            masks = self._keyword_masks(corpus, local_keywords, date_from, date_to)
+            for groupby in groupbys:
+                column = corpus.column(groupby)
+                counts = self._count(column, masks)
+                for i, keyword in enumerate(local_keywords):
+                    results[keyword][groupby] = self._response(counts[i], column.categories, page, page_size)
+        return results
+
+    def aggregate(self,
+                  keyword: str,
+                  groupby: str,
+                  source: str = "domestic",
+                  date_from: str = None,
+                  date_to: str = None,
+                  page: int = 1,
+                  page_size: int = 10,
+                  fallback: bool = True) -> Dict[str, Any]:
+        """get_aggregation / get_global_aggregation의 로컬 버전"""
+        return self.aggregate_many([keyword], [groupby], source, date_from, date_to,
+                                   page, page_size, fallback)[keyword][groupby]
+
+    def _aggregate_remote(self, keywords, groupbys, source, date_from, date_to, page, page_size):
+        """동기화 구간이 요청 기간을 포함하지 않는 키워드는 API 집계로 대체합니다."""
+        fetch: Callable[..., Dict[str, Any]] = \
+            self.client.get_aggregation if source == "domestic" else self.client.get_global_aggregation
+        return {
+            keyword: {
+                groupby: fetch(keyword=keyword, groupby=groupby, date_from=date_from, date_to=date_to,
+                               page=page, page_size=page_size)
+                for groupby in groupbys
+            }
+            for keyword in keywords
+        }
+
+
+def _to_date(value: Optional[str]) -> Optional[date]:
+    if not value:
+        return None
+    return datetime.strptime(value[:10], "%Y-%m-%d").date()
+
+
+# ========================================
+# 메인 실행 함수
+# ========================================
+
+def main():
+    """로컬 집계 실행"""
+    import time
+
+    from article_store import SOURCES
+
+    parser = argparse.ArgumentParser(description="저장된 기사 groupby 집계 (get_aggregation 로컬 버전)")
+    parser.add_argument("keywords", nargs="+", help="검색 키워드 목록")
+    parser.add_argument("--groupby", nargs="+", default=["companies.name"], help="groupby 필드 목록")
+    parser.add_argument("--source", choices=SOURCES, default="domestic")
+    parser.add_argument("--from", dest="date_from", help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="date_to", help="종료 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--local-only", action="store_true", help="API 폴백 없이 저장소만 사용")
+    args = parser.parse_args()
+
+    aggregator = LocalAggregator()
+    started = time.perf_counter()
+    results = aggregator.aggregate_many(args.keywords, args.groupby, args.source, args.date_from, args.date_to,
+                                        page_size=args.page_size, fallback=not args.local_only)
+    print(f"📊 {len(args.keywords)}개 키워드 × {len(args.groupby)}개 필드 집계 "
+          f"({(time.perf_counter() - started) * 1000:.1f}ms)")
+    for keyword, by_field in results.items():
+        for groupby, result in by_field.items():
+            origin = "로컬" if result.get("_local") else "API"
+            items = ", ".join(f"{item.get('key')}({item.get('count')})" for item in result.get("data") or [])
+            print(f"  [{keyword} / {groupby} / {origin}] {items or result.get('error', '')}")
+
+
+if __name__ == "__main__":
+    main()
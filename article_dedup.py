@@ -0,0 +1,259 @@
+"""
+기사 유사 중복 제거 모듈
+같은 통신사 기사를 언론사별로 재작성한 기사들을 MinHash 서명과 LSH 밴드 버킷으로 묶고,
+클러스터마다 대표 기사 하나만 남깁니다.
+"""
+
+import argparse
+import re
+from typing import Dict, List, Any, Iterable, Union
+
+import numpy as np
+
+
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+_SHIFT = np.uint64(32)
+_SHINGLE_BASE = np.uint64(1000003)
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+class ArticleDeduplicator:
+    """
+    MinHash + LSH 기반 유사 중복 기사 클러스터링
+
+    제목+요약을 정규화한 뒤 문자 k-gram(한글은 띄어쓰기가 달라도 잡히도록 공백 제거)으로 MinHash 서명을 만들고,
+    서명을 bands개 밴드로 나눠 같은 밴드 해시를 가진 기사만 후보로 비교합니다.
+    """
+
+    def __init__(self,
+                 num_perm: int = 64,
+                 bands: int = 16,
+                 threshold: float = 0.6,
+                 shingle_size: int = 3,
+                 batch_size: int = 512,
+                 seed: int = 1):
+        """
+        Args:
+            num_perm: MinHash 순열 수 (서명 길이)
+            bands: LSH 밴드 수 (num_perm의 약수)
+            threshold: 같은 클러스터로 묶을 추정 Jaccard 유사도 하한
+            shingle_size: 문자 k-gram 길이
+            batch_size: 서명 계산 시 한 번에 처리하는 기사 수
+            seed: 해시 계수 난수 시드
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})의 배수여야 합니다")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.batch_size = batch_size
+
+        # 순열 해시 a * x + b (mod 2^32) 계수 (a가 홀수이면 32비트 공간의 순열)
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64).astype(np.uint32) | np.uint32(1)
+        self._b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64).astype(np.uint32)
+
+    # ========================================
+    # 서명
+    # ========================================
+
+    @staticmethod
+    def article_text(article: Dict[str, Any]) -> str:
+        """지문에 사용할 정규화된 텍스트 (제목 + 요약, 소문자, 공백/기호 제거)"""
+        text = f"{article.get('title') or ''} {article.get('summary') or ''}"
+        return _NON_WORD.sub("", text.lower())
+
+    def signatures(self, texts: List[str]) -> np.ndarray:
+        """정규화된 텍스트 목록의 MinHash 서명 (len(texts) × num_perm, uint32)"""
+        result = np.empty((len(texts), self.num_perm), dtype=np.uint32)
+        for start in range(0, len(texts), self.batch_size):
+            batch = texts[start:start + self.batch_size]
+            result[start:start + len(batch)] = self._batch_signatures(batch)
+        return result
+
+    def _batch_signatures(self, texts: List[str]) -> np.ndarray:
+        """한 배치의 k-gram 해시를 이어 붙여 한 번에 MinHash를 계산합니다."""
+        k = self.shingle_size
+        shingle_hashes = []
+        offsets = []
+        position = 0
+        for text in texts:
+            codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+            if len(codes) < k:
+                codes = np.concatenate([codes, np.zeros(k - len(codes), dtype=np.uint64)])
+            hashes = np.zeros(len(codes) - k + 1, dtype=np.uint64)
+            for i in range(k):
+                hashes = hashes * _SHINGLE_BASE + codes[i:len(codes) - k + 1 + i]
+            offsets.append(position)
+            position += len(hashes)
+            shingle_hashes.append(hashes)
+
+        # k-gram 해시를 섞어 상위 32비트만 사용
+        shingles = ((np.concatenate(shingle_hashes) * _MIX) >> _SHIFT).astype(np.uint32)
+        permuted = shingles[:, None] * self._a
+        permuted += self._b
+        return np.minimum.reduceat(permuted, offsets, axis=0)
+
+    # ========================================
+    # 클러스터링
+    # ========================================
+
+    def cluster_signatures(self, signatures: np.ndarray, valid: np.ndarray = None) -> np.ndarray:
+        """
+        서명 행렬을 클러스터링하고 각 행의 클러스터 루트 인덱스를 반환합니다.
+
+        밴드마다 밴드 해시로 정렬해 같은 버킷의 첫 기사(리더)와만 서명 일치율을 비교하므로
+        전체 비교 없이 O(N log N × bands)로 동작합니다.
+        """
+        n = len(signatures)
+        parent = list(range(n))
+        if valid is None:
+            valid = np.ones(n, dtype=bool)
+        candidates = np.flatnonzero(valid)
+        if len(candidates) < 2:
+            return np.arange(n)
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        sigs = signatures[candidates]
+        for band in range(self.bands):
+            columns = sigs[:, band * self.rows:(band + 1) * self.rows].astype(np.uint64)
+            band_hash = np.zeros(len(candidates), dtype=np.uint64)
+            for column in columns.T:
+                band_hash = band_hash * _SHINGLE_BASE ^ column
+
+            order = np.argsort(band_hash, kind="stable")
+            sorted_hash = band_hash[order]
+            is_start = np.empty(len(order), dtype=bool)
+            is_start[0] = True
+            is_start[1:] = sorted_hash[1:] != sorted_hash[:-1]
+            leader = order[np.maximum.accumulate(np.where(is_start, np.arange(len(order)), 0))]
+
+            members = order[~is_start]
+            if not len(members):
+                continue
+            leaders = leader[~is_start]
+            similar = (sigs[members] == sigs[leaders]).mean(axis=1) >= self.threshold
+            for member, lead in zip(candidates[members[similar]].tolist(), candidates[leaders[similar]].tolist()):
+                root_a, root_b = find(member), find(lead)
+                if root_a != root_b:
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+
+        return np.array([find(i) for i in range(n)])
+
+    def cluster(self, articles: Union[Iterable[Dict[str, Any]], Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        기사를 유사 중복 클러스터로 묶습니다.
+
+        Args:
+            articles: 기사 목록 또는 get_articles / get_global_articles 응답
+
+        Returns:
+            [{"representative": 대표 기사, "representative_id": 대표 기사 id,
+              "members": [기사 id...], "size": 기사 수}, ...] (큰 클러스터 순)
+            id가 없는 기사는 입력 목록의 위치(문자열)를 id로 사용합니다.
+        """
+        articles = _as_article_list(articles)
+        if not articles:
+            return []
+
+        texts = [self.article_text(article) for article in articles]
+        valid = np.array([len(text) >= self.shingle_size for text in texts], dtype=bool)
+        roots = self.cluster_signatures(self.signatures(texts), valid)
+
+        groups: Dict[int, List[int]] = {}
+        for index, root in enumerate(roots):
+            groups.setdefault(int(root), []).append(index)
+
+        clusters = []
+        for indices in groups.values():
+            representative = min(indices, key=lambda i: _representative_rank(articles[i]))
+            clusters.append({
+                "representative": articles[representative],
+                "representative_id": _article_id(articles[representative], representative),
+                "members": [_article_id(articles[i], i) for i in indices],
+                "size": len(indices)
+            })
+        clusters.sort(key=lambda c: c["size"], reverse=True)
+        return clusters
+
+
+def _as_article_list(articles: Union[Iterable[Dict[str, Any]], Dict[str, Any]]) -> List[Dict[str, Any]]:
+    if isinstance(articles, dict):
+        return list(articles.get("data") or [])
+    return list(articles)
+
+
+def _article_id(article: Dict[str, Any], index: int) -> str:
+    return str(article.get("id") or article.get("content_url") or index)
+
+
+def _representative_rank(article: Dict[str, Any]) -> tuple:
+    """가장 먼저 보도된 기사를 대표로, 같은 시각이면 요약이 긴 기사를 선택합니다."""
+    return (str(article.get("published_at") or "9999"), -len(article.get("summary") or ""))
+
+
+def deduplicate_articles(articles: Union[Iterable[Dict[str, Any]], Dict[str, Any]],
+                         threshold: float = 0.6,
+                         deduplicator: ArticleDeduplicator = None) -> List[Dict[str, Any]]:
+    """
+    유사 중복을 제거한 대표 기사 목록을 반환합니다.
+
+    대표 기사에는 _cluster_size(묶인 기사 수)와 _duplicate_ids(제거된 기사 id)가 추가됩니다.
+
+    Args:
+        articles: 기사 목록 또는 get_articles / get_global_articles 응답
+        threshold: 추정 Jaccard 유사도 하한
+        deduplicator: 재사용할 ArticleDeduplicator
+    """
+    deduplicator = deduplicator or ArticleDeduplicator(threshold=threshold)
+    representatives = []
+    for cluster in deduplicator.cluster(articles):
+        article = dict(cluster["representative"])
+        duplicate_ids = list(cluster["members"])
+        duplicate_ids.remove(cluster["representative_id"])
+        article["_cluster_size"] = cluster["size"]
+        article["_duplicate_ids"] = duplicate_ids
+        representatives.append(article)
+    return representatives
+
+
+# ========================================
+# 메인 실행 함수
+# ========================================
+
+def main():
+    """로컬 기사 저장소의 유사 중복 현황 출력"""
+    from article_store import ArticleStore, SOURCES
+
+    parser = argparse.ArgumentParser(description="저장된 기사의 유사 중복 클러스터링")
+    parser.add_argument("--source", choices=SOURCES)
+    parser.add_argument("--from", dest="date_from", help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="date_to", help="종료 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--threshold", type=float, default=0.6, help="유사도 하한 (0~1)")
+    parser.add_argument("--top", type=int, default=10, help="출력할 클러스터 수")
+    args = parser.parse_args()
+
+    store = ArticleStore()
+    try:
+        articles = list(store.iter_articles(args.source, args.date_from, args.date_to))
+    finally:
+        store.close()
+
+    clusters = ArticleDeduplicator(threshold=args.threshold).cluster(articles)
+    duplicates = len(articles) - len(clusters)
+    print(f"📰 기사 {len(articles)}건 → 클러스터 {len(clusters)}개 (중복 {duplicates}건 제거)")
+    for cluster in clusters[:args.top]:
+        if cluster["size"] < 2:
+            break
+        print(f"  [{cluster['size']}건] {cluster['representative'].get('title')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,445 @@
+"""
+오프라인 기사 검색 모듈
+로컬 기사 저장소(article_store)에 쌓인 기사의 제목·요약·기업 태그를 SQLite FTS5로 색인해
+API 호출 없이 불리언/구문 검색, 날짜 필터, BM25 순위 검색을 제공합니다.
+
+한글은 조사가 붙은 어절("삼성전자가")도 찾을 수 있도록 음절 bigram으로 나눠 색인합니다.
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Any, Iterator, Union
+
+from config import get_config
+
+
+SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, summary, companies,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+
+CREATE TABLE IF NOT EXISTS articles_fts_docs (
+    docid           INTEGER PRIMARY KEY,    -- articles_fts rowid
+    source          TEXT NOT NULL,
+    published_date  TEXT NOT NULL,
+    id              TEXT NOT NULL,
+    UNIQUE (source, published_date, id)
+);
+
+CREATE TABLE IF NOT EXISTS articles_fts_state (
+    key             TEXT PRIMARY KEY,
+    value           TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_articles_stored_at ON articles (stored_at);
+"""
+
+# 제목 / 요약 / 기업 태그 BM25 가중치
+BM25_WEIGHTS = (5.0, 1.0, 3.0)
+
+COLUMN_ALIASES = {
+    "title": "title",
+    "summary": "summary",
+    "company": "companies",
+    "companies": "companies"
+}
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+_HANGUL_SPLIT = re.compile(r"[가-힣]+|[^가-힣]+")
+_QUERY_TOKEN = re.compile(r'"[^"]*"\*?|\(|\)|[^\s()"]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    색인/검색용 토큰 목록
+
+    한글 연속 구간은 음절 bigram("삼성전자" → 삼성, 성전, 전자)으로, 그 외(영문/숫자)는 소문자 단어로 나눕니다.
+    """
+    tokens = []
+    for word in _WORD.findall((text or "").lower()):
+        for run in _HANGUL_SPLIT.findall(word):
+            if "가" <= run[0] <= "힣" and len(run) > 1:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+            else:
+                tokens.append(run)
+    return tokens
+
+
+def _phrase(text: str, prefix: bool = False) -> Optional[str]:
+    """검색어를 FTS5 구문("토큰 토큰 ...")으로 변환합니다."""
+    tokens = tokenize(text)
+    if not tokens:
+        return None
+    phrase = '"' + " ".join(tokens) + '"'
+    # 한 음절 한글은 그 음절로 시작하는 bigram을 찾도록 접두어 검색
+    if prefix or (len(tokens) == 1 and len(tokens[0]) == 1 and "가" <= tokens[0] <= "힣"):
+        phrase += " *"
+    return phrase
+
+
+def build_match_query(query: str) -> str:
+    """
+    검색 문법을 FTS5 MATCH 식으로 변환합니다.
+
+    - 공백: AND, OR / AND / NOT: 연산자, 괄호: 그룹
+    - "삼성전자 HBM": 구문 검색
+    - -단어, 식 맨 앞의 NOT 단어: 제외
+    - title:단어, company:삼성전자: 컬럼 한정
+    - hbm*: 접두어 검색
+
+    짝이 맞지 않는 괄호/따옴표, 피연산자가 없는 연산자, 빈 괄호는 버리고 항상 올바른 FTS5 식을 만듭니다.
+    검색어가 남지 않거나, 제외 조건만 있거나, 제외로 바꿀 수 없는 단항 NOT(OR 뒤, 괄호 안, 괄호 묶음 앞)이면
+    ValueError가 발생합니다.
+    """
+    parts: List[str] = []
+    excluded: List[str] = []
+    depth = 0
+    negate_next = False
+
+    def expects_operand() -> bool:
+        return not parts or parts[-1] in ("(", "AND", "OR", "NOT")
+
+    def add_operand(operand: str):
+        # FTS5는 괄호 앞뒤의 암묵적 AND를 허용하지 않으므로 피연산자 사이에는 AND를 명시
+        if not expects_operand():
+            parts.append("AND")
+        parts.append(operand)
+
+    for token in _QUERY_TOKEN.findall(query):
+        if token == "(":
+            if negate_next:
+                raise ValueError(f"괄호 묶음은 NOT으로 제외할 수 없습니다: {query!r}")
+            add_operand(token)
+            depth += 1
+            continue
+        if token == ")":
+            if depth == 0:
+                continue
+            while parts[-1] in ("AND", "OR", "NOT"):
+                parts.pop()
+            depth -= 1
+            if parts[-1] == "(":
+                parts.pop()  # 빈 괄호
+                if parts and parts[-1] == "AND":
+                    parts.pop()
+            else:
+                parts.append(token)
+            continue
+        if token in ("AND", "OR", "NOT"):
+            if not expects_operand():
+                parts.append(token)
+            elif token == "NOT" and parts and parts[-1] == "AND":
+                parts[-1] = "NOT"  # "a AND NOT b" == "a NOT b"
+            elif token == "NOT":
+                # 피연산자 없이 시작하는 NOT은 다음 검색어의 제외로 처리 (버리면 반대 결과가 됨)
+                if depth or (parts and parts[-1] == "OR"):
+                    raise ValueError(f"NOT 앞에 검색어가 필요합니다: {query!r}")
+                negate_next = True
+            continue
+
+        negate = negate_next or (token.startswith("-") and len(token) > 1)
+        negate_next = False
+        if token.startswith("-") and len(token) > 1:
+            token = token[1:]
+
+        column = None
+        field, sep, rest = token.partition(":")
+        if sep and field.lower() in COLUMN_ALIASES and rest:
+            column, token = COLUMN_ALIASES[field.lower()], rest
+
+        prefix = token.endswith("*")
+        phrase = _phrase(token.strip('"*'), prefix=prefix)
+        if phrase is None:
+            continue
+        if column:
+            phrase = f"{column} : {phrase}"
+        if negate:
+            excluded.append(phrase)
+        else:
+            add_operand(phrase)
+
+    # 끝에 남은 연산자 제거, 닫히지 않은 괄호 닫기
+    while parts and parts[-1] in ("AND", "OR", "NOT"):
+        parts.pop()
+    while depth:
+        if parts and parts[-1] == "(":
+            parts.pop()
+            while parts and parts[-1] in ("AND", "OR", "NOT"):
+                parts.pop()
+        else:
+            parts.append(")")
+        depth -= 1
+        while parts and parts[-1] in ("AND", "OR", "NOT"):
+            parts.pop()
+
+    expression = " ".join(parts).strip()
+    if not expression and excluded:
+        raise ValueError(f"제외 조건만으로는 검색할 수 없습니다: {query!r}")
+    if not expression:
+        raise ValueError(f"검색어가 비어 있습니다: {query!r}")
+    if excluded:
+        expression = f"({expression}) NOT ({' OR '.join(excluded)})"
+    return expression
+
+
+def _company_text(companies_json: Optional[str]) -> str:
+    """companies 컬럼(JSON)에서 기업명/종목코드를 꺼내 색인용 텍스트로 만듭니다."""
+    try:
+        companies = json.loads(companies_json or "[]")
+    except ValueError:
+        return ""
+    names = []
+    for company in companies:
+        if isinstance(company, dict):
+            names.extend(str(company[key]) for key in ("name", "symbol") if company.get(key))
+        elif company:
+            names.append(str(company))
+    return " ".join(names)
+
+
+class ArticleSearchIndex:
+    """ArticleStore DB를 공유하는 FTS5 검색 색인"""
+
+    def __init__(self, db_path: str = None, auto_refresh: bool = True):
+        """
+        Args:
+            db_path: ArticleStore SQLite 파일 경로 (기본값: DATA_DIR/articles.db)
+            auto_refresh: 검색 전에 새로 저장된 기사를 색인에 반영할지 여부
+        """
+        from article_store import ArticleStore
+
+        self.db_path = db_path or os.path.join(get_config("DATA_DIR") or "data", "articles.db")
+        self.auto_refresh = auto_refresh
+        # 기사 테이블이 없으면 생성
+        ArticleStore(self.db_path).close()
+
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        with self._lock:
+            self._conn.executescript(SCHEMA)
+
+    # ========================================
+    # 색인
+    # ========================================
+
+    def _get_state(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM articles_fts_state WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def refresh(self, batch_size: int = 1000) -> int:
+        """
+        마지막 색인 이후 저장/갱신된 기사(stored_at 기준)만 색인에 반영합니다.
+        반영한 기사 수를 반환합니다.
+        """
+        with self._lock:
+            indexed_at = self._get_state("indexed_at") or ""
+            cursor = self._conn.execute("""
+                SELECT source, published_date, id, title, summary, companies, stored_at
+                FROM articles WHERE stored_at > ? ORDER BY stored_at
+            """, (indexed_at,))
+
+            indexed = 0
+            latest = indexed_at
+            with self._conn:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        self._index_row(row)
+                        latest = max(latest, row["stored_at"])
+                    indexed += len(rows)
+                if latest != indexed_at:
+                    self._conn.execute("""
+                        INSERT INTO articles_fts_state (key, value) VALUES ('indexed_at', ?)
+                        ON CONFLICT (key) DO UPDATE SET value = excluded.value
+                    """, (latest,))
+        return indexed
+
+    def _index_row(self, row: sqlite3.Row):
+        """기사 한 건을 색인합니다. 이미 색인된 기사는 교체합니다. (lock/트랜잭션 안에서 호출)"""
+        key = (row["source"], row["published_date"], row["id"])
+        self._conn.execute(
+            "INSERT OR IGNORE INTO articles_fts_docs (source, published_date, id) VALUES (?, ?, ?)", key)
+        docid = self._conn.execute(
+            "SELECT docid FROM articles_fts_docs WHERE source = ? AND published_date = ? AND id = ?",
+            key).fetchone()[0]
+        self._conn.execute("DELETE FROM articles_fts WHERE rowid = ?", (docid,))
+        self._conn.execute(
+            "INSERT INTO articles_fts (rowid, title, summary, companies) VALUES (?, ?, ?, ?)",
+            (docid,
+             " ".join(tokenize(row["title"])),
+             " ".join(tokenize(row["summary"])),
+             " ".join(tokenize(_company_text(row["companies"])))))
+
+    def rebuild(self) -> int:
+        """색인을 비우고 저장소 전체를 다시 색인합니다."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM articles_fts")
+            self._conn.execute("DELETE FROM articles_fts_docs")
+            self._conn.execute("DELETE FROM articles_fts_state")
+        indexed = self.refresh()
+        with self._lock, self._conn:
+            self._conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('optimize')")
+        return indexed
+
+    # ========================================
+    # 검색
+    # ========================================
+
+    def _where(self, query: str, source: str, date_from: str, date_to: str) -> tuple:
+        clauses, params = ["articles_fts MATCH ?"], [build_match_query(query)]
+        if source:
+            clauses.append("d.source = ?")
+            params.append(source)
+        if date_from:
+            clauses.append("d.published_date >= ?")
+            params.append(date_from[:10])
+        if date_to:
+            clauses.append("d.published_date <= ?")
+            params.append(date_to[:10])
+        return " AND ".join(clauses), params
+
+    def search(self,
+               query: str,
+               source: str = None,
+               date_from: str = None,
+               date_to: str = None,
+               limit: int = 20,
+               offset: int = 0) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        저장된 기사를 BM25 순으로 검색합니다.
+
+        Args:
+            query: 검색어 (예: 'HBM 삼성전자', '"반도체 수출" -중국', 'company:SK하이닉스 OR company:삼성전자')
+            source: "domestic" / "global"
+            date_from / date_to: 게시일 범위 (YYYY-MM-DD)
+            limit / offset: 페이지
+
+        Returns:
+            기사 목록 (_source, _score 포함, 점수가 낮을수록 관련도 높음)
+            검색어 오류 시 목록 대신 {"error": 오류 메시지} (build_match_query 참고)
+        """
+        if self.auto_refresh:
+            self.refresh()
+
+        try:
+            where, params = self._where(query, source, date_from, date_to)
+        except ValueError as e:
+            print(f"검색어 오류: {e}")
+            return {"error": str(e)}
+        with self._lock:
+            rows = self._conn.execute(f"""
+                SELECT d.source, bm25(articles_fts, ?, ?, ?) AS score, a.raw
+                FROM articles_fts
+                CROSS JOIN articles_fts_docs d ON d.docid = articles_fts.rowid
+                JOIN articles a ON a.source = d.source AND a.published_date = d.published_date AND a.id = d.id
+                WHERE {where}
+                ORDER BY score
+                LIMIT ? OFFSET ?
+            """, [*BM25_WEIGHTS, *params, limit, offset]).fetchall()
+
+        results = []
+        for row in rows:
+            article = json.loads(row["raw"])
+            article["_source"] = row["source"]
+            article["_score"] = round(row["score"], 4)
+            results.append(article)
+        return results
+
+    def count(self, query: str, source: str = None, date_from: str = None,
+              date_to: str = None) -> Union[int, Dict[str, Any]]:
+        """검색 결과 수. 검색어 오류 시 숫자 대신 {"error": 오류 메시지}"""
+        if self.auto_refresh:
+            self.refresh()
+
+        try:
+            where, params = self._where(query, source, date_from, date_to)
+        except ValueError as e:
+            print(f"검색어 오류: {e}")
+            return {"error": str(e)}
+        with self._lock:
+            return self._conn.execute(f"""
+                SELECT COUNT(*) FROM articles_fts
+                CROSS JOIN articles_fts_docs d ON d.docid = articles_fts.rowid
+                WHERE {where}
+            """, params).fetchone()[0]
+
+    def match_docids(self, query: str) -> List[int]:
+        """검색어에 해당하는 기사의 색인 docid 목록 (순위 계산/필터 없음, 집계용). 검색어 오류 시 ValueError"""
+        if self.auto_refresh:
+            self.refresh()
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?", (build_match_query(query),)).fetchall()
+        return [row[0] for row in rows]
+
+    def iter_search(self, query: str, page_size: int = 500, **filters) -> Iterator[Dict[str, Any]]:
+        """검색 결과 전체를 페이지 단위로 하나씩 반환합니다."""
+        offset = 0
+        while True:
+            page = self.search(query, limit=page_size, offset=offset, **filters)
+            if isinstance(page, dict):
+                return
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# ========================================
+# 메인 실행 함수
+# ========================================
+
+def main():
+    """저장된 기사 검색"""
+    import time
+
+    from article_store import SOURCES
+
+    parser = argparse.ArgumentParser(description="로컬 기사 전문 검색 (API 호출 없음)")
+    parser.add_argument("query", nargs="?", help="검색어 (예: 'HBM 삼성전자')")
+    parser.add_argument("--source", choices=SOURCES)
+    parser.add_argument("--from", dest="date_from", help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="date_to", help="종료 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--rebuild", action="store_true", help="색인 전체 재생성")
+    args = parser.parse_args()
+
+    index = ArticleSearchIndex()
+    try:
+        if args.rebuild:
+            print(f"🔧 색인 재생성: {index.rebuild()}건")
+        else:
+            print(f"🔧 색인 갱신: {index.refresh()}건")
+        if not args.query:
+            return
+
+        started = time.perf_counter()
+        results = index.search(args.query, source=args.source, date_from=args.date_from,
+                               date_to=args.date_to, limit=args.limit)
+        if isinstance(results, dict):
+            return
+        elapsed = (time.perf_counter() - started) * 1000
+        total = index.count(args.query, source=args.source, date_from=args.date_from, date_to=args.date_to)
+        print(f"🔍 '{args.query}': {total}건 중 {len(results)}건 ({elapsed:.1f}ms)")
+        for article in results:
+            print(f"  [{article.get('published_at', '')[:10]}] {article.get('title')} "
+                  f"({article.get('publisher')}, {article['_score']})")
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
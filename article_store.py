@@ -0,0 +1,375 @@
+"""
+로컬 기사 저장소 모듈
+get_articles / get_global_articles 결과를 SQLite에 날짜·출처(domestic/global)별로 저장하고,
+쿼리별 published_at 워터마크로 마지막 동기화 이후의 기사만 가져옵니다.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Iterable, Iterator
+
+from config import get_config
+
+
+SOURCES = ("domestic", "global")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    source          TEXT NOT NULL,          -- domestic / global
+    published_date  TEXT NOT NULL,          -- YYYY-MM-DD (파티션 키)
+    id              TEXT NOT NULL,
+    published_at    TEXT NOT NULL,
+    title           TEXT,
+    summary         TEXT,
+    publisher       TEXT,
+    sections        TEXT,                   -- JSON 배열
+    companies       TEXT,                   -- JSON 배열
+    content_url     TEXT,
+    raw             TEXT NOT NULL,          -- 원본 JSON
+    stored_at       TEXT NOT NULL,
+    PRIMARY KEY (source, published_date, id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles (source, published_at);
+
+CREATE TABLE IF NOT EXISTS sync_watermarks (
+    query_key       TEXT PRIMARY KEY,
+    source          TEXT NOT NULL,
+    params          TEXT NOT NULL,          -- JSON
+    watermark       TEXT,                   -- 마지막으로 저장한 published_at
+    synced_at       TEXT,
+    total_synced    INTEGER NOT NULL DEFAULT 0,
+    synced_from     TEXT,                   -- 빠짐없이 저장한 구간의 시작 날짜 (YYYY-MM-DD)
+    covered_to      TEXT                    -- 마지막으로 오류 없이 끝난 동기화의 시작 시각
+);
+"""
+
+
+class ArticleStore:
+    """날짜/출처별로 클러스터링된 SQLite 기사 저장소"""
+
+    def __init__(self, db_path: str = None):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (기본값: DATA_DIR/articles.db)
+        """
+        self.db_path = db_path or os.path.join(get_config("DATA_DIR") or "data", "articles.db")
+        if self.db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+            # 구간 컬럼이 없던 저장소 마이그레이션 (기존 쿼리는 다음 동기화부터 구간이 기록됨)
+            columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(sync_watermarks)")}
+            for column in ("synced_from", "covered_to"):
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE sync_watermarks ADD COLUMN {column} TEXT")
+
+    # ========================================
+    # 저장 / 조회
+    # ========================================
+
+    def upsert_articles(self, articles: Iterable[Dict[str, Any]], source: str) -> int:
+        """기사를 저장합니다. 이미 있는 기사는 갱신합니다. 저장한 기사 수를 반환합니다."""
+        if source not in SOURCES:
+            raise ValueError(f"알 수 없는 출처: {source}")
+
+        # 검색 색인(article_search)이 stored_at으로 증분 반영하므로 배치마다 구분되도록 마이크로초까지 기록
+        stored_at = datetime.now().isoformat(timespec="microseconds")
+        rows = []
+        for article in articles:
+            row = _article_row(article, source, stored_at)
+            if row is not None:
+                rows.append(row)
+
+        if not rows:
+            return 0
+
+        with self._lock, self._conn:
+            self._conn.executemany("""
+                INSERT INTO articles (source, published_date, id, published_at, title, summary, publisher,
+                                      sections, companies, content_url, raw, stored_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (source, published_date, id) DO UPDATE SET
+                    published_at = excluded.published_at,
+                    title = excluded.title,
+                    summary = excluded.summary,
+                    publisher = excluded.publisher,
+                    sections = excluded.sections,
+                    companies = excluded.companies,
+                    content_url = excluded.content_url,
+                    raw = excluded.raw,
+                    stored_at = excluded.stored_at
+            """, rows)
+        return len(rows)
+
+    def iter_articles(self,
+                      source: str = None,
+                      date_from: str = None,
+                      date_to: str = None) -> Iterator[Dict[str, Any]]:
+        """저장된 기사를 published_at 역순으로 하나씩 반환합니다."""
+        clauses, params = [], []
+        if source:
+            clauses.append("source = ?")
+            params.append(source)
+        if date_from:
+            clauses.append("published_date >= ?")
+            params.append(date_from[:10])
+        if date_to:
+            clauses.append("published_date <= ?")
+            params.append(date_to[:10])
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            cursor = self._conn.execute(
+                f"SELECT source, raw FROM articles {where} ORDER BY published_at DESC", params)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(1000)
+            if not rows:
+                break
+            for row in rows:
+                article = json.loads(row["raw"])
+                article["_source"] = row["source"]
+                yield article
+
+    def count(self, source: str = None) -> int:
+        with self._lock:
+            if source:
+                return self._conn.execute("SELECT COUNT(*) FROM articles WHERE source = ?", (source,)).fetchone()[0]
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def partition_counts(self) -> List[Dict[str, Any]]:
+        """출처/날짜 파티션별 기사 수"""
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT source, published_date, COUNT(*) AS articles
+                FROM articles GROUP BY source, published_date ORDER BY source, published_date
+            """).fetchall()
+        return [dict(row) for row in rows]
+
+    # ========================================
+    # 워터마크 동기화
+    # ========================================
+
+    @staticmethod
+    def query_key(source: str, params: Dict[str, Any]) -> str:
+        normalized = {key: value for key, value in params.items() if value}
+        payload = json.dumps({"source": source, "params": normalized}, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def get_watermark(self, query_key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT watermark FROM sync_watermarks WHERE query_key = ?", (query_key,)).fetchone()
+        return row["watermark"] if row else None
+
+    def list_watermarks(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM sync_watermarks ORDER BY synced_at DESC").fetchall()
+        return [dict(row) for row in rows]
+
+    def _set_watermark(self, query_key: str, source: str, params: Dict[str, Any],
+                       watermark: Optional[str], synced: int,
+                       synced_from: str = None, covered_to: str = None):
+        """
+        워터마크를 갱신합니다. synced_from / covered_to는 오류 없이 끝난 동기화에서만 넘기며,
+        synced_from은 처음 기록된 값을 유지하고 covered_to는 마지막 성공 시각으로 갱신됩니다.
+        """
+        with self._lock, self._conn:
+            self._conn.execute("""
+                INSERT INTO sync_watermarks (query_key, source, params, watermark, synced_at, total_synced,
+                                             synced_from, covered_to)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (query_key) DO UPDATE SET
+                    watermark = COALESCE(excluded.watermark, sync_watermarks.watermark),
+                    synced_at = excluded.synced_at,
+                    total_synced = sync_watermarks.total_synced + excluded.total_synced,
+                    synced_from = COALESCE(sync_watermarks.synced_from, excluded.synced_from),
+                    covered_to = COALESCE(excluded.covered_to, sync_watermarks.covered_to)
+            """, (query_key, source, json.dumps(params, ensure_ascii=False), watermark,
+                  datetime.now().isoformat(timespec="seconds"), synced, synced_from, covered_to))
+
+    def sync(self,
+             client,
+             source: str = "domestic",
+             keyword: str = None,
+             company_name: str = None,
+             symbols: str = None,
+             sections: str = None,
+             lookback_days: int = 30,
+             batch_size: int = 500) -> Dict[str, Any]:
+        """
+        워터마크 이후의 새 기사만 가져와 저장합니다.
+
+        처음 동기화하는 쿼리는 lookback_days 전부터 가져오며, 이후에는 워터마크 날짜부터 조회하고
+        워터마크보다 이전의 published_at은 건너뜁니다. 워터마크와 같은 시각의 기사는 나중에 추가됐을 수 있으므로
+        다시 저장합니다. (upsert이므로 중복되지 않음)
+        오류 없이 끝나면 빠짐없이 저장한 구간(synced_from ~ covered_to)을 기록하며, 로컬 집계가 이 구간으로
+        쿼리별 보유 여부를 판단합니다.
+
+        Args:
+            client: DeepsearchClient
+            source: "domestic" (get_articles) 또는 "global" (get_global_articles)
+            keyword / company_name / symbols: 검색 조건
+            sections: 섹션명 (예: "economy,tech")
+            lookback_days: 첫 동기화 시 조회 기간 (일)
+            batch_size: 한 번에 저장하는 기사 수
+        """
+        if source not in SOURCES:
+            raise ValueError(f"알 수 없는 출처: {source}")
+
+        params = {"keyword": keyword, "company_name": company_name, "symbols": symbols, "sections": sections}
+        query_key = self.query_key(source, params)
+        started_at = datetime.now().isoformat(timespec="seconds")
+        watermark = self.get_watermark(query_key)
+        date_from = watermark[:10] if watermark else \
+            (datetime.now() - timedelta(days=lookback_days)).strftime("%Y-%m-%d")
+
+        articles = self._iter_remote(client, source, date_from, keyword, company_name, symbols, sections)
+
+        new_watermark = watermark
+        stored = 0
+        skipped = 0
+        error = None
+        batch: List[Dict[str, Any]] = []
+        try:
+            for article in articles:
+                published_at = _normalize_published_at(article.get("published_at"))
+                if published_at is None or (watermark and published_at < watermark):
+                    skipped += 1
+                    continue
+                batch.append(article)
+                if new_watermark is None or published_at > new_watermark:
+                    new_watermark = published_at
+                if len(batch) >= batch_size:
+                    stored += self.upsert_articles(batch, source)
+                    batch = []
+        except RuntimeError as e:
+            # 중간에 실패하면 빠진 기사가 있을 수 있으므로 워터마크를 올리지 않음
+            error = str(e)
+            new_watermark = watermark
+            print(f"동기화 중단: {e}")
+        stored += self.upsert_articles(batch, source)
+
+        if error is None:
+            self._set_watermark(query_key, source, params, new_watermark, stored,
+                                synced_from=date_from, covered_to=started_at)
+        else:
+            self._set_watermark(query_key, source, params, new_watermark, stored)
+        return {
+            "query_key": query_key,
+            "source": source,
+            "date_from": date_from,
+            "previous_watermark": watermark,
+            "watermark": new_watermark,
+            "stored": stored,
+            "skipped": skipped,
+            "error": error
+        }
+
+    @staticmethod
+    def _iter_remote(client, source, date_from, keyword, company_name, symbols, sections) -> Iterator[Dict]:
+        """동기화 대상 기사를 API에서 스트리밍합니다. 페이지 조회 실패 시 RuntimeError가 발생합니다."""
+        page_size = 100
+        if sections:
+            fetch = client.get_articles_by_section if source == "domestic" else client.get_global_articles_by_section
+
+            def fetch_page(page: int) -> Dict[str, Any]:
+                return fetch(sections, keyword=keyword, company_name=company_name, symbols=symbols,
+                             date_from=date_from, page=page, page_size=page_size)
+        else:
+            fetch = client.get_articles if source == "domestic" else client.get_global_articles
+
+            def fetch_page(page: int) -> Dict[str, Any]:
+                return fetch(keyword=keyword, company_name=company_name, symbols=symbols,
+                             date_from=date_from, page=page, page_size=page_size)
+
+        return client._iter_pages(fetch_page, page_size, raise_on_error=True)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _normalize_published_at(value: Any) -> Optional[str]:
+    """published_at을 비교 가능한 ISO 문자열(YYYY-MM-DDTHH:MM:SS)로 맞춥니다."""
+    if not value:
+        return None
+    text = str(value).replace(" ", "T")
+    return text[:19] if len(text) >= 10 else None
+
+
+def _article_row(article: Dict[str, Any], source: str, stored_at: str) -> Optional[tuple]:
+    published_at = _normalize_published_at(article.get("published_at"))
+    if published_at is None:
+        return None
+    article_id = article.get("id") or article.get("content_url") or \
+        hashlib.sha1(f"{article.get('title')}|{published_at}".encode("utf-8")).hexdigest()
+    return (
+        source,
+        published_at[:10],
+        str(article_id),
+        published_at,
+        article.get("title"),
+        article.get("summary"),
+        article.get("publisher"),
+        json.dumps(article.get("sections") or [], ensure_ascii=False),
+        json.dumps(article.get("companies") or [], ensure_ascii=False),
+        article.get("content_url"),
+        json.dumps(article, ensure_ascii=False),
+        stored_at
+    )
+
+
+# ========================================
+# 메인 실행 함수
+# ========================================
+
+def main():
+    """기사 저장소 동기화 / 통계"""
+    parser = argparse.ArgumentParser(description="로컬 기사 저장소")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    sync_parser = subparsers.add_parser("sync", help="워터마크 이후 새 기사 동기화")
+    sync_parser.add_argument("--source", choices=SOURCES, default="domestic")
+    sync_parser.add_argument("--keyword")
+    sync_parser.add_argument("--company")
+    sync_parser.add_argument("--symbols")
+    sync_parser.add_argument("--sections")
+    sync_parser.add_argument("--lookback-days", type=int, default=30)
+
+    subparsers.add_parser("stats", help="저장소 통계")
+    args = parser.parse_args()
+
+    store = ArticleStore()
+    try:
+        if args.command == "sync":
+            from api_clients import DeepsearchClient
+
+            result = store.sync(DeepsearchClient(), source=args.source, keyword=args.keyword,
+                                company_name=args.company, symbols=args.symbols, sections=args.sections,
+                                lookback_days=args.lookback_days)
+            print(f"✅ 동기화 완료: {result['stored']}건 저장 (워터마크 {result['previous_watermark']} → "
+                  f"{result['watermark']})")
+        else:
+            print(f"📦 전체 기사: {store.count()}건 "
+                  f"(국내 {store.count('domestic')}건, 해외 {store.count('global')}건)")
+            for watermark in store.list_watermarks():
+                print(f"  - [{watermark['source']}] {watermark['params']} → {watermark['watermark']}")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,493 @@
+"""
+비동기 API 클라이언트 모듈
+asyncio 기반 Deepsearch, Finnhub 클라이언트와 공유 커넥션 풀을 포함합니다.
+"""
+
+import asyncio
+import weakref
+from typing import Dict, List, Optional, Any
+
+import aiohttp
+
+from config import get_api_key
+from config_compat import get_http_config, get_rate_limit_config
+from request_coalescing import get_async_single_flight
+from response_cache import ResponseCache
+from rate_limiter import TokenBucket, get_rate_limiter
+from resilience import (CircuitOpenError, DEFAULT_RETRY_EXCEPTIONS, RetryPolicy,
+                        call_with_retry_async, get_circuit_breaker)
+
+
+class AsyncHTTPTransport:
+    """이벤트 루프에서 공유하는 aiohttp 커넥션 풀 + 동시 요청 수 제한"""
+
+    def __init__(self,
+                 max_concurrency: int = None,
+                 limit_per_host: int = None,
+                 timeout: float = None):
+        """
+        Args:
+            max_concurrency: 동시에 진행할 수 있는 최대 요청 수
+            limit_per_host: 호스트당 최대 연결 수 (0이면 무제한)
+            timeout: 요청당 전체 타임아웃 (초)
+        """
+        self.max_concurrency = max_concurrency or get_http_config("MAX_CONCURRENCY") or 50
+        self.limit_per_host = limit_per_host if limit_per_host is not None else (
+            get_http_config("DEFAULT_POOL_SIZE") or 10)
+        self.timeout = timeout or ((get_http_config("CONNECT_TIMEOUT") or 5) + (get_http_config("READ_TIMEOUT") or 30))
+        # 세마포어는 처음 사용하는 이벤트 루프에 묶이므로 루프별로 지연 생성
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = \
+            weakref.WeakKeyDictionary()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """세션을 지연 생성합니다. (실행 중인 이벤트 루프 안에서 호출)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.limit_per_host)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """실행 중인 이벤트 루프의 동시 요청 수 제한 세마포어를 반환합니다."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def request_json(self, method: str, url: str, rate_limiter: TokenBucket = None,
+                           max_throttle_retries: int = None, **kwargs) -> Any:
+        """
+        요청을 수행하고 JSON 응답을 반환합니다. 실패 시 aiohttp.ClientError를,
+        본문이 JSON이 아니면(HTML 오류 페이지, 잘린 응답 등) ValueError를 발생시킵니다.
+
+        rate_limiter가 주어지면 호출 전에 토큰을 기다리고, 응답 헤더로 속도를 조정하며,
+        429 응답은 Retry-After 후 최대 max_throttle_retries번 다시 보냅니다.
+        """
+        if max_throttle_retries is None:
+            max_throttle_retries = get_rate_limit_config("MAX_THROTTLE_RETRIES") or 0
+
+        for attempt in range(max_throttle_retries + 1):
+            if rate_limiter is not None:
+                await rate_limiter.acquire_async()
+            async with self._get_semaphore():
+                async with self._get_session().request(method, url, **kwargs) as response:
+                    if rate_limiter is not None:
+                        rate_limiter.update_from_response(response.status, response.headers)
+                        if response.status == 429 and attempt < max_throttle_retries:
+                            continue
+                    response.raise_for_status()
+                    return await response.json(content_type=None)
+
+    async def request_bytes(self, method: str, url: str, **kwargs) -> bytes:
+        """요청을 수행하고 응답 본문을 bytes로 반환합니다."""
+        async with self._get_semaphore():
+            async with self._get_session().request(method, url, **kwargs) as response:
+                response.raise_for_status()
+                return await response.read()
+
+    async def close(self):
+        """세션과 커넥션 풀을 닫습니다."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+_loop_transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncHTTPTransport]" = weakref.WeakKeyDictionary()
+
+
+def get_async_transport() -> AsyncHTTPTransport:
+    """현재 이벤트 루프에서 공유하는 기본 AsyncHTTPTransport를 반환합니다."""
+    loop = asyncio.get_running_loop()
+    transport = _loop_transports.get(loop)
+    if transport is None:
+        transport = AsyncHTTPTransport()
+        _loop_transports[loop] = transport
+    return transport
+
+
+# aiohttp 연결 오류도 일시적인 오류로 재시도
+_RETRY_EXCEPTIONS = DEFAULT_RETRY_EXCEPTIONS + (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)
+
+
+def _compact(params: Dict[str, Any]) -> Dict[str, Any]:
+    """값이 없는 파라미터를 제거합니다."""
+    return {key: value for key, value in params.items() if value is not None and value != ""}
+
+
+class AsyncDeepsearchClient:
+    """Deepsearch API 비동기 클라이언트 (DeepsearchClient와 동일한 메서드 구성)"""
+
+    def __init__(self, transport: AsyncHTTPTransport = None):
+        self.api_key = get_api_key("DEEPSEARCH_API_KEY")
+        self.base_url = "https://api-v2.deepsearch.com/v1"
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self._transport = transport
+        self.inflight = get_async_single_flight("deepsearch")
+
+    @property
+    def transport(self) -> AsyncHTTPTransport:
+        if self._transport is None:
+            self._transport = get_async_transport()
+        return self._transport
+
+    async def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """API 요청을 수행합니다. 동일한 요청이 이미 진행 중이면 그 결과를 공유합니다."""
+        params = _compact(params or {})
+        request_key = ResponseCache.make_key(endpoint, params)
+        return await self.inflight.do(request_key, lambda: self._fetch(endpoint, params))
+
+    async def _fetch(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """네트워크 요청을 수행합니다."""
+        # API 키를 파라미터에 추가
+        params["api_key"] = self.api_key
+
+        try:
+            return await call_with_retry_async(
+                lambda: self.transport.request_json(
+                    "GET", f"{self.base_url}{endpoint}", params=params, headers=self.headers),
+                get_circuit_breaker("deepsearch", endpoint),
+                RetryPolicy(retry_exceptions=_RETRY_EXCEPTIONS)
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError, CircuitOpenError, ValueError) as e:
+            print(f"API 요청 실패: {e}")
+            return {"error": str(e)}
+
+    async def get_articles(self,
+                           keyword: str = None,
+                           company_name: str = None,
+                           symbols: str = None,
+                           date_from: str = None,
+                           date_to: str = None,
+                           page: int = 1,
+                           page_size: int = 10,
+                           highlight: str = None,
+                           clustering: bool = None) -> Dict[str, Any]:
+        """국내 기사 검색 (DeepsearchClient.get_articles 참고)"""
+        params = _compact({
+            "keyword": keyword,
+            "company_name": company_name,
+            "symbols": symbols,
+            "date_from": date_from,
+            "date_to": date_to,
+            "page": page,
+            "page_size": page_size,
+            "highlight": highlight
+        })
+        if clustering is not None:
+            params["clustering"] = str(clustering).lower()
+        return await self._make_request("/articles", params)
+
+    async def get_articles_by_section(self,
+                                      sections: str,
+                                      keyword: str = None,
+                                      company_name: str = None,
+                                      symbols: str = None,
+                                      date_from: str = None,
+                                      date_to: str = None,
+                                      page: int = 1,
+                                      page_size: int = 10) -> Dict[str, Any]:
+        """섹션별 기사 검색 (economy, tech, politics 등)"""
+        return await self._make_request(f"/articles/{sections}", {
+            "keyword": keyword,
+            "company_name": company_name,
+            "symbols": symbols,
+            "date_from": date_from,
+            "date_to": date_to,
+            "page": page,
+            "page_size": page_size
+        })
+
+    async def get_global_articles(self,
+                                  keyword: str = None,
+                                  company_name: str = None,
+                                  symbols: str = None,
+                                  date_from: str = None,
+                                  date_to: str = None,
+                                  page: int = 1,
+                                  page_size: int = 10) -> Dict[str, Any]:
+        """해외 기사 검색"""
+        return await self._make_request("/global-articles", {
+            "keyword": keyword,
+            "company_name": company_name,
+            "symbols": symbols,
+            "date_from": date_from,
+            "date_to": date_to,
+            "page": page,
+            "page_size": page_size
+        })
+
+    async def get_global_articles_by_section(self,
+                                             sections: str,
+                                             keyword: str = None,
+                                             company_name: str = None,
+                                             symbols: str = None,
+                                             date_from: str = None,
+                                             date_to: str = None,
+                                             page: int = 1,
+                                             page_size: int = 10) -> Dict[str, Any]:
+        """해외 섹션별 기사 검색 (business, technology, economy 등)"""
+        return await self._make_request(f"/global-articles/{sections}", {
+            "keyword": keyword,
+            "company_name": company_name,
+            "symbols": symbols,
+            "date_from": date_from,
+            "date_to": date_to,
+            "page": page,
+            "page_size": page_size
+        })
+
+    async def get_topics(self,
+                         company_name: str = None,
+                         symbols: str = None,
+                         date_from: str = None,
+                         date_to: str = None,
+                         page: int = 1,
+                         page_size: int = 10) -> Dict[str, Any]:
+        """토픽 검색"""
+        return await self._make_request("/articles/topics", {
+            "company_name": company_name,
+            "symbols": symbols,
+            "date_from": date_from,
+            "date_to": date_to,
+            "page": page,
+            "page_size": page_size
+        })
+
+    async def get_trending_topics(self, page: int = 1, page_size: int = 10) -> Dict[str, Any]:
+        """트렌딩 토픽 조회"""
+        return await self._make_request("/articles/topics/trending", {
+            "page": page,
+            "page_size": page_size
+        })
+
+    async def get_topic_detail(self, topic_id: str) -> Dict[str, Any]:
+        """특정 토픽 상세 조회"""
+        return await self._make_request(f"/articles/topics/trending/{topic_id}")
+
+    async def get_aggregation(self,
+                              keyword: str,
+                              groupby: str,
+                              date_from: str = None,
+                              date_to: str = None,
+                              page: int = 1,
+                              page_size: int = 10) -> Dict[str, Any]:
+        """집계 데이터 조회"""
+        return await self._make_request("/articles/aggregation", {
+            "keyword": keyword,
+            "groupby": groupby,
+            "page": page,
+            "page_size": page_size,
+            "date_from": date_from,
+            "date_to": date_to
+        })
+
+    async def get_global_aggregation(self,
+                                     keyword: str,
+                                     groupby: str,
+                                     date_from: str = None,
+                                     date_to: str = None,
+                                     page: int = 1,
+                                     page_size: int = 10) -> Dict[str, Any]:
+        """해외 집계 데이터 조회"""
+        return await self._make_request("/global-articles/aggregation", {
+            "keyword": keyword,
+            "groupby": groupby,
+            "page": page,
+            "page_size": page_size,
+            "date_from": date_from,
+            "date_to": date_to
+        })
+
+    async def get_filings(self,
+                          keyword: str = None,
+                          company_name: str = None,
+                          symbol: str = None,
+                          date_from: str = None,
+                          date_to: str = None,
+                          page: int = 1,
+                          page_size: int = 10) -> Dict[str, Any]:
+        """해외 공시 검색"""
+        return await self._make_request("/filings", {
+            "keyword": keyword,
+            "company_name": company_name,
+            "symbol": symbol,
+            "date_from": date_from,
+            "date_to": date_to,
+            "page": page,
+            "page_size": page_size
+        })
+
+    async def get_filing_detail(self, accession_number: str) -> Dict[str, Any]:
+        """특정 공시 상세 조회"""
+        return await self._make_request(f"/filings/{accession_number}")
+
+    async def get_filing_summary(self, accession_number: str) -> Dict[str, Any]:
+        """특정 공시 요약 조회"""
+        return await self._make_request(f"/filings/{accession_number}/summary")
+
+    async def get_filing_aggregation(self,
+                                     keyword: str,
+                                     groupby: str,
+                                     date_from: str = None,
+                                     date_to: str = None,
+                                     size: int = 10) -> Dict[str, Any]:
+        """공시 집계 데이터 조회"""
+        return await self._make_request("/filings/aggregation", {
+            "keyword": keyword,
+            "groupby": groupby,
+            "size": size,
+            "date_from": date_from,
+            "date_to": date_to
+        })
+
+    async def get_disclosure_documents(self,
+                                       keyword: str = None,
+                                       company_name: str = None,
+                                       symbols: str = None,
+                                       date_from: str = None,
+                                       date_to: str = None,
+                                       page: int = 1,
+                                       page_size: int = 10) -> Dict[str, Any]:
+        """국내 공시 문서 검색"""
+        return await self._make_request("/articles/documents/disclosure", {
+            "keyword": keyword,
+            "company_name": company_name,
+            "symbols": symbols,
+            "date_from": date_from,
+            "date_to": date_to,
+            "page": page,
+            "page_size": page_size
+        })
+
+    async def download_briefing_csv(self,
+                                    briefing_type: str,
+                                    date: str) -> bytes:
+        """
+        브리핑 CSV 다운로드
+
+        Args:
+            briefing_type: 브리핑 타입 (stock, etf, global-stock, global-etf)
+            date: 날짜 (YYYYMMDD)
+        """
+        params = {
+            "date": date,
+            "api_key": self.api_key
+        }
+
+        try:
+            return await call_with_retry_async(
+                lambda: self.transport.request_bytes(
+                    "GET", f"{self.base_url}/briefings/csv/{briefing_type}", params=params),
+                get_circuit_breaker("deepsearch", "/briefings/csv"),
+                RetryPolicy(retry_exceptions=_RETRY_EXCEPTIONS)
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError, CircuitOpenError, ValueError) as e:
+            print(f"CSV 다운로드 실패: {e}")
+            return None
+
+
+class AsyncFinnhubClient:
+    """Finnhub API 비동기 클라이언트 (FinnhubClient와 동일한 메서드 구성)"""
+
+    def __init__(self, transport: AsyncHTTPTransport = None):
+        self.api_key = get_api_key("FINNHUB_API_KEY")
+        self.base_url = "https://finnhub.io/api/v1"
+        self._transport = transport
+        self.inflight = get_async_single_flight("finnhub")
+        self.rate_limiter = get_rate_limiter("finnhub", self.api_key)
+
+    @property
+    def transport(self) -> AsyncHTTPTransport:
+        if self._transport is None:
+            self._transport = get_async_transport()
+        return self._transport
+
+    async def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Any:
+        """API 요청을 수행합니다. 동일한 요청이 이미 진행 중이면 그 결과를 공유합니다."""
+        params = dict(params or {})
+        request_key = ResponseCache.make_key(endpoint, params)
+        return await self.inflight.do(request_key, lambda: self._fetch(endpoint, params))
+
+    async def _fetch(self, endpoint: str, params: Dict[str, Any]) -> Any:
+        """네트워크 요청을 수행합니다."""
+        params["token"] = self.api_key
+
+        try:
+            return await call_with_retry_async(
+                lambda: self.transport.request_json(
+                    "GET", f"{self.base_url}{endpoint}", rate_limiter=self.rate_limiter, params=params),
+                get_circuit_breaker("finnhub", endpoint),
+                RetryPolicy(retry_exceptions=_RETRY_EXCEPTIONS)
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError, CircuitOpenError, ValueError) as e:
+            print(f"Finnhub API 요청 실패: {e}")
+            return {"error": str(e)}
+
+    async def get_quote(self, symbol: str) -> Dict[str, Any]:
+        """주식 현재가 조회"""
+        return await self._make_request("/quote", {"symbol": symbol})
+
+    async def get_company_profile(self, symbol: str) -> Dict[str, Any]:
+        """회사 프로필 조회"""
+        return await self._make_request("/stock/profile2", {"symbol": symbol})
+
+    async def get_company_news(self, symbol: str, from_date: str, to_date: str) -> List[Dict[str, Any]]:
+        """회사 뉴스 조회"""
+        result = await self._make_request("/company-news", {
+            "symbol": symbol,
+            "from": from_date,
+            "to": to_date
+        })
+        return result if isinstance(result, list) else []
+
+    async def get_market_news(self, category: str = "general") -> List[Dict[str, Any]]:
+        """시장 뉴스 조회"""
+        result = await self._make_request("/news", {"category": category})
+        return result if isinstance(result, list) else []
+
+    async def get_earnings_calendar(self, from_date: str, to_date: str) -> Dict[str, Any]:
+        """실적 발표 일정 조회"""
+        return await self._make_request("/calendar/earnings", {
+            "from": from_date,
+            "to": to_date
+        })
+
+    async def get_economic_calendar(self, from_date: str, to_date: str) -> Dict[str, Any]:
+        """경제 지표 일정 조회"""
+        return await self._make_request("/calendar/economic", {
+            "from": from_date,
+            "to": to_date
+        })
+
+
+# 사용 예제
+if __name__ == "__main__":
+    async def main():
+        async with AsyncHTTPTransport(max_concurrency=20) as transport:
+            deepsearch = AsyncDeepsearchClient(transport)
+            finnhub = AsyncFinnhubClient(transport)
+
+            # 여러 요청을 한 번에 실행
+            symbols = ["AAPL", "MSFT", "NVDA", "GOOGL", "AMZN"]
+            articles, *quotes = await asyncio.gather(
+                deepsearch.get_articles(company_name="삼성전자", page_size=5),
+                *(finnhub.get_quote(symbol) for symbol in symbols)
+            )
+            print("삼성전자 뉴스:", articles.get("total_items", 0))
+            for symbol, quote in zip(symbols, quotes):
+                print(f"{symbol}: {quote.get('c')}")
+
+    asyncio.run(main())
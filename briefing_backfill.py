@@ -0,0 +1,319 @@
+"""
+브리핑 CSV 과거 데이터 백필 모듈
+기간 × 브리핑 타입별 CSV를 호출 한도 안에서 병렬로 내려받고,
+체크섬 manifest로 이미 받은 날짜는 건너뛰며 날짜/타입별로 분할된 Parquet 저장소에 기록합니다.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+import pandas as pd
+import requests
+
+from api_clients import DeepsearchClient
+from config import get_config
+from rate_limiter import get_rate_limiter
+
+
+BRIEFING_TYPES = ["stock", "etf", "global-stock", "global-etf"]
+
+# 브리핑 타입별로 고정한 Parquet 스키마 파일 (pyarrow.dataset은 "_"로 시작하는 파일을 데이터로 읽지 않음)
+SCHEMA_FILE = "_common_metadata"
+
+
+class BriefingBackfill:
+    """브리핑 CSV 병렬 백필"""
+
+    def __init__(self,
+                 client: DeepsearchClient = None,
+                 raw_dir: str = None,
+                 store_dir: str = None,
+                 max_workers: int = 8):
+        """
+        Args:
+            client: 사용할 DeepsearchClient
+            raw_dir: 원본 CSV 저장 경로 (기본값: RAW_DATA_DIR/briefings)
+            store_dir: Parquet 저장소 경로 (기본값: DATA_DIR/briefings_parquet)
+            max_workers: 동시 다운로드 수
+        """
+        self.client = client or DeepsearchClient()
+        self.raw_dir = Path(raw_dir or os.path.join(get_config("RAW_DATA_DIR") or "data/raw", "briefings"))
+        self.store_dir = Path(store_dir or os.path.join(get_config("DATA_DIR") or "data", "briefings_parquet"))
+        self.max_workers = max_workers
+        self.rate_limiter = get_rate_limiter("deepsearch", self.client.api_key, "/briefings/csv")
+
+        self.raw_dir.mkdir(parents=True, exist_ok=True)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.raw_dir / "manifest.json"
+        self.manifest = self._load_manifest()
+        self._manifest_lock = threading.Lock()
+        self._schema_lock = threading.Lock()
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        if not self.manifest_path.exists():
+            return {}
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_manifest(self):
+        """manifest를 원자적으로 저장합니다. (lock 보유 상태에서 호출)"""
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    @staticmethod
+    def trading_days(date_from: str, date_to: str) -> List[str]:
+        """기간 내 평일 날짜 목록 (YYYYMMDD)"""
+        return [day.strftime("%Y%m%d") for day in pd.bdate_range(_parse_date(date_from), _parse_date(date_to))]
+
+    def raw_path(self, briefing_type: str, day: str) -> Path:
+        return self.raw_dir / briefing_type / f"{day}.csv"
+
+    def partition_path(self, briefing_type: str, day: str) -> Path:
+        return self.store_dir / f"briefing_type={briefing_type}" / f"date={day}" / "part-0.parquet"
+
+    def schema_path(self, briefing_type: str) -> Path:
+        return self.store_dir / f"briefing_type={briefing_type}" / SCHEMA_FILE
+
+    def is_complete(self, briefing_type: str, day: str, verify: bool = True) -> bool:
+        """manifest에 기록되어 있고 원본 파일 체크섬이 일치하면 True (브리핑이 없는 날은 기록만 확인)"""
+        entry = self.manifest.get(f"{briefing_type}/{day}")
+        if not entry:
+            return False
+        if entry.get("missing"):
+            return True
+        raw_path = self.raw_path(briefing_type, day)
+        if not raw_path.exists():
+            return False
+        if entry.get("rows") and not self.partition_path(briefing_type, day).exists():
+            return False
+        if not verify:
+            return raw_path.stat().st_size == entry.get("bytes")
+        return _sha256(raw_path) == entry.get("sha256")
+
+    def run(self,
+            date_from: str,
+            date_to: str,
+            briefing_types: List[str] = None,
+            force: bool = False,
+            verify: bool = True) -> Dict[str, Any]:
+        """
+        백필 실행
+
+        Args:
+            date_from: 시작 날짜 (YYYY-MM-DD 또는 YYYYMMDD)
+            date_to: 종료 날짜 (YYYY-MM-DD 또는 YYYYMMDD)
+            briefing_types: 브리핑 타입 목록 (기본값: 전체)
+            force: True이면 이미 받은 날짜도 다시 다운로드
+            verify: 건너뛰기 전에 원본 파일 체크섬을 다시 계산할지 여부
+        """
+        briefing_types = briefing_types or BRIEFING_TYPES
+        jobs = [(briefing_type, day)
+                for day in self.trading_days(date_from, date_to)
+                for briefing_type in briefing_types]
+
+        summary = {"total": len(jobs), "downloaded": 0, "skipped": 0, "missing": 0, "failed": [], "elapsed": 0.0}
+        started = time.perf_counter()
+
+        pending = []
+        for briefing_type, day in jobs:
+            if not force and self.is_complete(briefing_type, day, verify=verify):
+                summary["skipped"] += 1
+            else:
+                pending.append((briefing_type, day))
+
+        print(f"🚀 백필 시작: {len(pending)}건 다운로드, {summary['skipped']}건 건너뜀")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="briefing-backfill") as executor:
+            futures = {executor.submit(self._process, briefing_type, day): (briefing_type, day)
+                       for briefing_type, day in pending}
+            for future in as_completed(futures):
+                briefing_type, day = futures[future]
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    entry = None
+                    print(f"❌ {briefing_type}/{day} 처리 실패: {e}")
+
+                if entry is None:
+                    summary["failed"].append(f"{briefing_type}/{day}")
+                    continue
+
+                summary["missing" if entry.get("missing") else "downloaded"] += 1
+                with self._manifest_lock:
+                    self.manifest[f"{briefing_type}/{day}"] = entry
+                    self._save_manifest()
+
+        summary["elapsed"] = round(time.perf_counter() - started, 2)
+        print(f"✅ 백필 완료: {summary['downloaded']}건 다운로드, {summary['skipped']}건 건너뜀, "
+              f"{summary['missing']}건 브리핑 없음, {len(summary['failed'])}건 실패 ({summary['elapsed']}초)")
+        return summary
+
+    def _process(self, briefing_type: str, day: str) -> Optional[Dict[str, Any]]:
+        """하루치 CSV를 내려받아 Parquet 파티션으로 변환합니다."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        raw_path = self.raw_path(briefing_type, day)
+        try:
+            written = self.client.download_briefing_csv_to(briefing_type, day, raw_path, raise_on_error=True)
+        except requests.exceptions.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if status == 404 and day < datetime.now().strftime("%Y%m%d"):
+                # 지난 휴장일 등 브리핑이 없는 날 - 실패로 남겨 매번 다시 받지 않도록 기록
+                return {"missing": True, "rows": 0, "partition": None, "status": status,
+                        "downloaded_at": datetime.now().isoformat(timespec="seconds")}
+            print(f"CSV 다운로드 실패: {e}")
+            return None
+        except (requests.exceptions.RequestException, OSError) as e:
+            print(f"CSV 다운로드 실패: {e}")
+            return None
+
+        rows = self._write_partition(briefing_type, raw_path, self.partition_path(briefing_type, day))
+        return {
+            "sha256": _sha256(raw_path),
+            "bytes": written,
+            "rows": rows,
+            "raw_path": str(raw_path),
+            # 브리핑이 없는 날(휴일, 빈 CSV)은 파티션 없이 완료로 기록
+            "partition": str(self.partition_path(briefing_type, day).parent) if rows else None,
+            "downloaded_at": datetime.now().isoformat(timespec="seconds")
+        }
+
+    def _pinned_schema(self, briefing_type: str, inferred=None):
+        """
+        브리핑 타입의 고정 스키마를 반환합니다. 없으면 inferred(첫 파티션의 스키마)로 고정합니다.
+        null로 추론된 열은 다른 날 값이 들어와도 담을 수 있도록 문자열로 고정합니다.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = self.schema_path(briefing_type)
+        with self._schema_lock:
+            if path.exists():
+                return pq.read_schema(str(path))
+            if inferred is None:
+                return None
+            schema = pa.schema([field.with_type(pa.string()) if pa.types.is_null(field.type) else field
+                                for field in inferred])
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{SCHEMA_FILE}.tmp")
+            pq.write_metadata(schema, str(tmp_path))
+            os.replace(tmp_path, path)
+            return schema
+
+    def _write_partition(self, briefing_type: str, raw_path: Path, partition_path: Path) -> int:
+        """
+        CSV를 배치 단위로 읽어 Parquet 파일로 씁니다. 행 수를 반환합니다.
+        모든 날짜의 파티션을 함께 읽을 수 있도록 각 배치를 브리핑 타입의 고정 스키마로 맞춥니다.
+        빈 파일이나 헤더만 있는 CSV는 파티션을 만들지 않고 0을 반환합니다.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        from pyarrow import csv as pa_csv
+
+        if raw_path.stat().st_size == 0:
+            return 0
+
+        schema = self._pinned_schema(briefing_type)
+        convert_options = None
+        if schema is not None:
+            # 고정 스키마 타입으로 바로 파싱 (날마다 추론이 달라져도 같은 타입)
+            convert_options = pa_csv.ConvertOptions(column_types={field.name: field.type for field in schema})
+        try:
+            reader = pa_csv.open_csv(str(raw_path), convert_options=convert_options)
+        except pa.ArrowInvalid as e:
+            # 공백/줄바꿈만 있는 파일
+            if "Empty CSV" in str(e):
+                return 0
+            raise
+
+        partition_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = partition_path.with_suffix(".parquet.tmp")
+        writer = None
+        rows = 0
+        try:
+            for batch in reader:
+                if batch.num_rows == 0:
+                    continue
+                if writer is None:
+                    schema = schema or self._pinned_schema(briefing_type, batch.schema)
+                    writer = pq.ParquetWriter(str(tmp_path), schema)
+                writer.write_table(_conform(pa.Table.from_batches([batch]), schema))
+                rows += batch.num_rows
+            if writer is not None:
+                writer.close()
+        except BaseException:
+            # 중간에 실패하면 반쯤 쓴 임시 파일을 남기지 않음
+            if writer is not None:
+                writer.close()
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+
+        if writer is None:
+            # 헤더만 있는 CSV - 파티션을 만들지 않음
+            return 0
+        os.replace(tmp_path, partition_path)
+        return rows
+
+
+def _conform(table, schema):
+    """테이블을 고정 스키마로 맞춥니다. 없는 열은 null로 채우고, 스키마에 없는 열은 버립니다."""
+    import pyarrow as pa
+
+    columns = [table.column(field.name).cast(field.type) if field.name in table.column_names
+               else pa.nulls(len(table), field.type)
+               for field in schema]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _parse_date(value: str) -> datetime:
+    """YYYY-MM-DD 또는 YYYYMMDD 문자열을 datetime으로 변환합니다."""
+    return datetime.strptime(value.replace("-", ""), "%Y%m%d")
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# ========================================
+# 메인 실행 함수
+# ========================================
+
+def main():
+    """브리핑 CSV 백필 실행"""
+    parser = argparse.ArgumentParser(description="Deepsearch 브리핑 CSV 과거 데이터 백필")
+    parser.add_argument("--from", dest="date_from", required=True, help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="date_to", required=True, help="종료 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--types", nargs="+", default=BRIEFING_TYPES, choices=BRIEFING_TYPES,
+                        help="브리핑 타입 목록")
+    parser.add_argument("--workers", type=int, default=8, help="동시 다운로드 수")
+    parser.add_argument("--force", action="store_true", help="이미 받은 날짜도 다시 다운로드")
+    parser.add_argument("--no-verify", action="store_true", help="건너뛸 때 체크섬 재계산 생략")
+    args = parser.parse_args()
+
+    backfill = BriefingBackfill(max_workers=args.workers)
+    summary = backfill.run(args.date_from, args.date_to, args.types, force=args.force, verify=not args.no_verify)
+
+    if summary["failed"]:
+        print("\n실패 목록:")
+        for job in summary["failed"]:
+            print(f"  - {job}")
+
+
+if __name__ == "__main__":
+    main()
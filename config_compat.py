@@ -0,0 +1,33 @@
+"""
+설정 호환 모듈
+예전 config_example.py를 복사해 만든 config.py에는 HTTP_CONFIG, CACHE_CONFIG 등
+새 설정 블록과 get_*_config 함수가 없습니다. 이 경우 빈 값을 반환해
+각 모듈이 자체 기본값을 사용하도록 합니다.
+"""
+
+from typing import Any, Callable
+
+import config
+
+
+def _section_getter(getter_name: str, section_name: str) -> Callable[[str], Any]:
+    """config.py의 getter를 반환하고, 없으면 설정 블록(없으면 빈 dict)을 읽는 getter를 만듭니다."""
+    getter = getattr(config, getter_name, None)
+    if getter is not None:
+        return getter
+
+    section = getattr(config, section_name, None) or {}
+
+    def get_section_config(config_name: str) -> Any:
+        return section.get(config_name, "")
+
+    get_section_config.__name__ = getter_name
+    return get_section_config
+
+
+get_http_config = _section_getter("get_http_config", "HTTP_CONFIG")
+get_cache_config = _section_getter("get_cache_config", "CACHE_CONFIG")
+get_rate_limit_config = _section_getter("get_rate_limit_config", "RATE_LIMIT_CONFIG")
+get_retry_config = _section_getter("get_retry_config", "RETRY_CONFIG")
+get_capability_config = _section_getter("get_capability_config", "CAPABILITY_CONFIG")
+get_slack_queue_config = _section_getter("get_slack_queue_config", "SLACK_QUEUE_CONFIG")
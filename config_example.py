@@ -39,6 +39,85 @@ API_ENDPOINTS = {
     "SLACK_BASE_URL": "https://slack.com/api"
 }
 
+# HTTP 전송 계층 설정 (커넥션 풀/keep-alive)
+HTTP_CONFIG = {
+    "CONNECT_TIMEOUT": 5,    # 연결 타임아웃 (초)
+    "READ_TIMEOUT": 30,      # 응답 타임아웃 (초)
+    "DEFAULT_POOL_SIZE": 10,
+    "POOL_SIZES": {          # 호스트별 커넥션 풀 크기
+        "api-v2.deepsearch.com": 32,
+        "finnhub.io": 16,
+        "slack.com": 4
+    },
+    "POOL_BLOCK": False,     # 풀이 가득 차면 대기할지 여부
+    "MAX_CONCURRENCY": 50    # 비동기 클라이언트 동시 요청 수 상한
+}
+
+# API 응답 캐시 설정 (Deepsearch)
+CACHE_CONFIG = {
+    "ENABLED": True,
+    "MAX_ENTRIES": 1024,          # 메모리 LRU 최대 항목 수
+    "DEFAULT_TTL": 300,           # 기본 TTL (초)
+    "HISTORICAL_TTL": 86400,      # date_to가 과거인 요청의 TTL (초)
+    "ENDPOINT_TTLS": {            # 엔드포인트 prefix별 TTL (초)
+        "/articles/topics/trending": 60,
+        "/articles/topics": 600,
+        "/articles/aggregation": 600,
+        "/global-articles/aggregation": 600,
+        "/filings": 1800
+    },
+    "DISK_ENABLED": False,        # 디스크 캐시 사용 여부
+    "DISK_DIR": "cache"           # DATA_DIR 하위 디스크 캐시 경로
+}
+
+# 제공자별 호출 속도 제한 (API 키별로 적용, calls/period 초)
+RATE_LIMIT_CONFIG = {
+    "finnhub": {
+        "default": {"calls": 60, "period": 60, "burst": 30}       # 무료 플랜 분당 60회
+    },
+    "slack": {                                                     # Web API 메서드별 tier
+        "default": {"calls": 50, "period": 60, "burst": 10},      # Tier 3
+        "/chat.postMessage": {"calls": 60, "period": 60, "burst": 5},
+        "/conversations.list": {"calls": 20, "period": 60, "burst": 5},  # Tier 2
+        "/files.upload": {"calls": 20, "period": 60, "burst": 5},        # Tier 2
+        "/files.getUploadURLExternal": {"calls": 20, "period": 60, "burst": 5},
+        "/files.completeUploadExternal": {"calls": 20, "period": 60, "burst": 5},
+        "/auth.test": {"calls": 100, "period": 60, "burst": 20}         # Tier 4
+    },
+    "deepsearch": {
+        "/briefings/csv": {"calls": 120, "period": 60, "burst": 10}    # 브리핑 백필용
+    },
+    "MAX_THROTTLE_RETRIES": 2   # 429 응답 시 Retry-After 후 재시도 횟수
+}
+
+# 재시도 / 서킷 브레이커 설정
+RETRY_CONFIG = {
+    "MAX_RETRIES": 3,                       # 멱등(GET) 요청의 최대 재시도 횟수
+    "BASE_DELAY": 0.5,                      # 지수 백오프 기본 대기 (초)
+    "MAX_DELAY": 8.0,                       # 대기 시간 상한 (초)
+    "RETRY_STATUSES": [500, 502, 503, 504],
+    "FAILURE_THRESHOLD": 5,                 # 연속 실패 시 서킷 열림
+    "RECOVERY_TIMEOUT": 30                  # 서킷이 열린 뒤 재확인까지 대기 (초)
+}
+
+# API 권한 맵 설정 (Deepsearch 엔드포인트별 허용 / 403)
+CAPABILITY_CONFIG = {
+    "TTL": 86400,                      # 확인 결과 유효 시간 (초)
+    "FILE": "api_capabilities.json",   # DATA_DIR 하위 저장 파일
+    "PROBE_TIMEOUT": 5                 # 확인 요청 타임아웃 (초)
+}
+
+# Slack 비동기 전송 큐 설정
+SLACK_QUEUE_CONFIG = {
+    "COALESCE_WINDOW": 2.0,       # 같은 채널 메시지를 모으는 시간 (초)
+    "CHANNEL_INTERVAL": 1.0,      # 채널별 최소 전송 간격 (초, Slack 권장 초당 1건)
+    "MAX_BATCH": 10,              # 한 번에 합칠 최대 메시지 수
+    "MAX_ATTEMPTS": 5,            # 일시적 실패 시 최대 전송 시도 횟수
+    "JOURNAL_FILE": "slack_outbox.jsonl",  # DATA_DIR 하위 미전송 메시지 저널
+    "JOURNAL_FSYNC": False,       # 저널 기록마다 fsync 여부
+    "JOURNAL_COMPACT_RATIO": 4.0  # 확인된 기록이 미전송 메시지 수의 몇 배를 넘으면 저널을 압축할지
+}
+
 # 모델 설정
 MODEL_CONFIG = {
     "OPENAI_MODEL": "gpt-4o",  # gpt-5가 아직 공개되지 않았으므로 gpt-4o 사용
@@ -58,6 +137,30 @@ def get_endpoint(endpoint_name: str) -> str:
     """API 엔드포인트를 반환합니다."""
     return API_ENDPOINTS.get(endpoint_name, "")
 
+def get_http_config(config_name: str) -> Any:
+    """HTTP 전송 계층 설정값을 반환합니다."""
+    return HTTP_CONFIG.get(config_name, "")
+
+def get_cache_config(config_name: str) -> Any:
+    """응답 캐시 설정값을 반환합니다."""
+    return CACHE_CONFIG.get(config_name, "")
+
+def get_rate_limit_config(config_name: str) -> Any:
+    """호출 속도 제한 설정값을 반환합니다."""
+    return RATE_LIMIT_CONFIG.get(config_name, "")
+
+def get_retry_config(config_name: str) -> Any:
+    """재시도/서킷 브레이커 설정값을 반환합니다."""
+    return RETRY_CONFIG.get(config_name, "")
+
+def get_capability_config(config_name: str) -> Any:
+    """API 권한 맵 설정값을 반환합니다."""
+    return CAPABILITY_CONFIG.get(config_name, "")
+
+def get_slack_queue_config(config_name: str) -> Any:
+    """Slack 전송 큐 설정값을 반환합니다."""
+    return SLACK_QUEUE_CONFIG.get(config_name, "")
+
 def get_model_config(config_name: str) -> Any:
     """모델 설정을 반환합니다."""
     return MODEL_CONFIG.get(config_name, "")
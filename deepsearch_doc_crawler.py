@@ -1,31 +1,289 @@
+import argparse
+import base64
+import hashlib
+import threading
 import time
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional
+from urllib.parse import unquote, urljoin, urlparse
+import requests
+import lxml.html
+from lxml import etree
+
+from api_doc_index import write_doc_index
+from http_transport import HTTPTransport, get_transport
+from resilience import call_with_retry, get_circuit_breaker
+from typing import Dict, List, Optional, Any, Tuple, Callable
 import logging
+import zlib
+
+# 브라우저 모드에서만 필요 (스펙 모드는 브라우저 없이 동작)
+try:
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from selenium.common.exceptions import TimeoutException, NoSuchElementException
+    from webdriver_manager.chrome import ChromeDriverManager
+except ImportError:
+    webdriver = None
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+HTTP_METHODS = ("get", "post", "put", "patch", "delete")
+CODE_FENCE_PATTERN = re.compile(r'```([\w+-]*)\n(.*?)```', re.S)
+
+
+# 브라우저 모드에서 차단할 리소스 (이미지, 폰트, 분석 스크립트)
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*", "*segment.io*", "*amplitude.com*"
+]
+
+# 렌더링 완료 판단에 쓰는 콘텐츠 선택자 (crawl_section의 추출 선택자와 동일)
+CONTENT_SELECTORS = [
+    '.api-content',
+    '.swagger-ui',
+    '.documentation',
+    'article',
+    'main',
+    '.content',
+    '#api-docs'
+]
+
+
+def _selector_xpath(selector: str) -> str:
+    """단순 CSS 선택자(.class, #id, tag)를 XPath로 변환합니다. (cssselect 패키지 불필요)"""
+    if selector.startswith('.'):
+        return f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {selector[1:]} ')]"
+    if selector.startswith('#'):
+        return f"//*[@id='{selector[1:]}']"
+    return f"//{selector}"
+
+
+CONTENT_XPATHS = [_selector_xpath(selector) for selector in CONTENT_SELECTORS]
+HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+RAW_CONTENT_MODES = ("full", "compressed", "none")
+
+
+def _text(element, strip: bool = True) -> str:
+    """BeautifulSoup get_text(strip=True)와 같은 규칙의 텍스트 (각 문자열을 strip 후 연결)"""
+    if strip:
+        return "".join(piece.strip() for piece in element.itertext())
+    return "".join(element.itertext())
+
+
+class ContentScan:
+    """
+    콘텐츠 요소를 한 번 순회하며 모은 코드 블록 / 테이블 / 제목 / 설명 후보
+    
+    추출기(_extract_*)는 트리를 다시 탐색하지 않고 이 결과만 사용합니다.
+    """
+    
+    def __init__(self, element):
+        self.code_blocks: List[Dict[str, Any]] = []   # {"raw", "text", "context"}
+        self.tables: List[Dict[str, Any]] = []        # {"headers", "rows": [{"cells", "text"}]}
+        self.headings: List[Tuple[int, str]] = []
+        self.description_candidates: Dict[str, Any] = {}
+        self._text_cache: Dict[int, str] = {}
+        self._scan(element)
+    
+    def _scan(self, root):
+        context = None   # 문서 순서상 가장 최근의 p / div / span (find_previous와 동일)
+        pre_depth = 0
+        
+        for event, element in etree.iterwalk(root, events=("start", "end")):
+            tag = element.tag if isinstance(element.tag, str) else ""
+            
+            if event == "end":
+                if tag == "pre":
+                    pre_depth -= 1
+                continue
+            
+            if tag in ("pre", "code"):
+                # <pre><code>는 바깥 pre 하나로만 수집
+                if pre_depth == 0:
+                    self.code_blocks.append({"raw": _text(element, strip=False), "context": context})
+                if tag == "pre":
+                    pre_depth += 1
+            elif tag == "table":
+                self.tables.append(self._scan_table(element))
+            elif tag in HEADING_TAGS:
+                self.headings.append((int(tag[1]), _text(element)))
+            
+            if tag == "p":
+                self._collect_description_candidate(element)
+            else:
+                css_class = f" {element.get('class', '')} "
+                for name in ("description", "intro"):
+                    if f" {name} " in css_class:
+                        self.description_candidates.setdefault(name, element)
+            
+            if tag in ("p", "div", "span"):
+                context = element
+    
+    def _collect_description_candidate(self, element):
+        candidates = self.description_candidates
+        candidates.setdefault("p", element)
+        previous = element.getprevious()
+        while previous is not None and not isinstance(previous.tag, str):
+            previous = previous.getprevious()
+        if previous is not None and previous.tag in ("h1", "h2"):
+            candidates.setdefault(f"{previous.tag}+p", element)
+    
+    def _scan_table(self, table) -> Dict[str, Any]:
+        rows = []
+        for row in table.iter("tr"):
+            rows.append({
+                "cells": [_text(cell) for cell in row if cell.tag == "td"],
+                "text": _text(row)
+            })
+        return {
+            "headers": [_text(th).lower() for th in table.iter("th")],
+            "rows": rows[1:]  # 헤더 제외
+        }
+    
+    def text_of(self, element) -> str:
+        """요소 텍스트 (요소별 캐시 - 여러 코드 블록이 같은 부모를 공유)"""
+        key = id(element)
+        if key not in self._text_cache:
+            self._text_cache[key] = _text(element)
+        return self._text_cache[key]
+
+
+class DriverPool:
+    """재사용 가능한 WebDriver 풀 (필요할 때 최대 size개까지 생성)"""
+    
+    def __init__(self, factory: Callable[[], Any], size: int = 3):
+        self.factory = factory
+        self.size = size
+        self._idle = []
+        self._drivers = []
+        # 생성했거나 생성 중인 드라이버 수 (factory는 lock 밖에서 실행하므로 자리를 먼저 예약)
+        self._created = 0
+        self._cond = threading.Condition()
+    
+    @contextmanager
+    def acquire(self):
+        """
+        유휴 드라이버를 빌려주고, 없으면 새로 만들거나 반납될 때까지 대기합니다.
+        사용 중 예외가 나면 드라이버 상태를 믿을 수 없으므로 종료하고 풀에서 빼며, 다음 요청 때 새로 만듭니다.
+        """
+        driver = self._checkout()
+        released = False
+        try:
+            yield driver
+            released = True
+        finally:
+            if released:
+                self._release(driver)
+            else:
+                self._discard(driver)
+    
+    def _checkout(self):
+        with self._cond:
+            while not self._idle and self._created >= self.size:
+                self._cond.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+        try:
+            driver = self.factory()
+        except BaseException:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._drivers.append(driver)
+        return driver
+    
+    def _release(self, driver):
+        with self._cond:
+            # close() 이후 반납된 드라이버는 이미 종료됨
+            if driver in self._drivers:
+                self._idle.append(driver)
+                self._cond.notify()
+    
+    def _discard(self, driver):
+        with self._cond:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+                self._created -= 1
+            self._cond.notify()
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"WebDriver 종료 실패: {e}")
+    
+    def close(self):
+        with self._cond:
+            drivers, self._drivers = self._drivers, []
+            self._idle = []
+            self._created -= len(drivers)
+            self._cond.notify_all()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.warning(f"WebDriver 종료 실패: {e}")
+
+
+def _section_key(name: str) -> str:
+    """섹션 이름 / Redoc 앵커를 비교용 키로 정규화합니다. ("국내 기사" == "국내-기사")"""
+    return re.sub(r'[\s-]+', '-', unquote(name).strip()).lower()
+
 
 class DeepsearchDocCrawler:
     """Deepsearch API 문서 전문 크롤러"""
     
-    def __init__(self, output_dir: str = "deepsearch_docs"):
+    def __init__(self,
+                 output_dir: str = "deepsearch_docs",
+                 spec_source: str = None,
+                 headless: bool = True,
+                 pool_size: int = 3,
+                 wait_timeout: float = 15,
+                 raw_content: str = "compressed",
+                 transport: HTTPTransport = None):
+        """
+        Args:
+            output_dir: 결과 저장 디렉토리
+            spec_source: OpenAPI/Redoc 스펙 위치 (URL 또는 로컬 파일, 기본값: 문서 페이지에서 탐색)
+            headless: 브라우저 모드에서 헤드리스 Chrome 사용 여부
+            pool_size: 브라우저 모드에서 동시에 사용할 WebDriver 수
+            wait_timeout: 콘텐츠 렌더링 대기 최대 시간 (초)
+            raw_content: 전체 텍스트 저장 방식 ("full", "compressed": zlib+base64, "none": 저장 안 함)
+            transport: 스펙/문서 페이지를 받을 공유 HTTP 전송 계층
+        """
+        if raw_content not in RAW_CONTENT_MODES:
+            raise ValueError(f"raw_content는 {RAW_CONTENT_MODES} 중 하나여야 합니다: {raw_content}")
         self.driver = None
+        self.spec_source = spec_source
+        self.headless = headless
+        self.pool_size = pool_size
+        self.wait_timeout = wait_timeout
+        self.raw_content = raw_content
+        self.transport = transport or get_transport()
+        self._driver_path = None
+        self._pool = None
+        self.section_timings: Dict[str, Dict[str, float]] = {}
+        
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
+        # 증분 크롤링 상태 (섹션별 콘텐츠 해시, 스펙의 ETag / Last-Modified)
+        self.state_path = self.output_dir / "crawl_state.json"
+        self.report_path = self.output_dir / "crawl_changes.json"
+        self._state = self._load_state()
+        
         # API 문서 섹션 구조
         self.sections = {
             "시작하기": "/api/#section/%EC%8B%9C%EC%9E%91%ED%95%98%EA%B8%B0",
@@ -43,9 +301,17 @@ class DeepsearchDocCrawler:
     
     def setup_driver(self):
         """Selenium WebDriver 설정"""
+        self.driver = self._create_driver()
+        logger.info("✅ Selenium WebDriver 설정 완료")
+    
+    def _create_driver(self):
+        """이미지/폰트/분석 요청을 차단한 Chrome WebDriver를 생성합니다."""
+        if webdriver is None:
+            raise ImportError("브라우저 모드에는 selenium, webdriver-manager 패키지가 필요합니다 (스펙 모드는 불필요)")
+        
         chrome_options = Options()
-        # 헤드리스 모드 비활성화 (디버깅용)
-        # chrome_options.add_argument('--headless')
+        if self.headless:
+            chrome_options.add_argument('--headless=new')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-gpu')
@@ -55,17 +321,35 @@ class DeepsearchDocCrawler:
         # User-Agent 설정
         chrome_options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        # 이미지 로드 비활성화
+        chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
         
-        logger.info("✅ Selenium WebDriver 설정 완료")
+        # 드라이버 바이너리는 한 번만 설치/확인
+        if self._driver_path is None:
+            self._driver_path = ChromeDriverManager().install()
+        driver = webdriver.Chrome(service=Service(self._driver_path), options=chrome_options)
+        
+        # 폰트, 분석 스크립트 등 나머지 리소스는 CDP로 차단
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        return driver
     
-    def crawl_all_sections(self) -> Dict:
-        """모든 API 문서 섹션 크롤링"""
+    def crawl_all_sections(self, mode: str = "auto", force: bool = False) -> Dict:
+        """
+        모든 API 문서 섹션 크롤링
         
-        if not self.driver:
-            self.setup_driver()
+        이전 크롤링과 콘텐츠 해시가 같은 섹션은 추출과 파일 쓰기를 건너뛰고,
+        변경된 섹션 목록을 crawl_changes.json에 기록합니다.
         
+        Args:
+            mode: "spec" (OpenAPI 스펙을 HTTP로 한 번만 받아 전체 섹션 생성),
+                  "browser" (Selenium으로 섹션별 렌더링),
+                  "auto" (스펙 모드를 시도하고 실패하면 브라우저 모드)
+            force: True이면 이전 상태를 무시하고 전체를 다시 추출/저장
+        """
+        started = time.time()
+        if force:
+            self._state = {"sections": {}, "sources": {}}
         all_docs = {
             "metadata": {
                 "crawled_at": time.strftime("%Y-%m-%d %H:%M:%S"),
@@ -75,58 +359,425 @@ class DeepsearchDocCrawler:
             "sections": {}
         }
         
-        logger.info(f"🚀 {len(self.sections)}개 섹션 크롤링 시작")
+        sections = None
+        validators = {}
+        if mode in ("auto", "spec"):
+            try:
+                spec, source = self.load_spec(conditional=True)
+                if spec is None and self._previous_sections() is None:
+                    # 304이지만 이전 결과 파일이 없으면 본문을 다시 받음
+                    spec, source = self.load_spec()
+                validators = self._state["sources"].get(source, {})
+                
+                spec_hash = self._hash(spec) if spec is not None else self._state.get("spec_hash")
+                if spec_hash == self._state.get("spec_hash") and self._previous_sections() is not None:
+                    logger.info("📭 스펙 변경 없음 - 섹션 추출 생략")
+                    sections = self._previous_sections()
+                    for section_name, section_data in sections.items():
+                        section_data["_content_hash"] = self._state["sections"][section_name]["hash"]
+                else:
+                    sections = self.build_sections_from_spec(spec)
+                    all_docs["metadata"]["spec_version"] = spec.get("info", {}).get("version", "")
+                self._state["spec_hash"] = spec_hash
+                all_docs["metadata"]["source"] = "spec"
+                all_docs["metadata"]["spec_source"] = source
+            except (requests.exceptions.RequestException, OSError, ValueError) as e:
+                if mode == "spec":
+                    raise
+                logger.warning(f"⚠️ 스펙 로드 실패, 브라우저 모드로 전환: {e}")
         
-        for section_name, section_path in self.sections.items():
-            logger.info(f"\n📄 [{section_name}] 크롤링 중...")
+        if sections is None:
+            sections = self._crawl_sections_with_browser()
+            all_docs["metadata"]["source"] = "browser"
+            self._state.pop("spec_hash", None)
+        
+        all_docs["metadata"]["total_sections"] = len(sections)
+        previous_state = self._state.get("sections", {})
+        section_state = {}
+        changes = {"added": [], "changed": [], "removed": [], "unchanged": [], "failed": []}
+        
+        for section_name, section_data in sections.items():
+            content_hash = section_data.pop("_content_hash", None)
+            all_docs["sections"][section_name] = section_data
+            previous = previous_state.get(section_name)
+            
+            if "error" in section_data:
+                changes["failed"].append(section_name)
+                if previous:
+                    section_state[section_name] = previous
+                continue
+            
+            content_hash = content_hash or self._hash(section_data)
+            if previous and previous["hash"] == content_hash and self._section_path(section_name).exists():
+                changes["unchanged"].append(section_name)
+                section_state[section_name] = previous
+                continue
+            
+            changes["changed" if previous else "added"].append(section_name)
+            section_state[section_name] = {
+                "hash": content_hash,
+                "etag": validators.get("etag"),
+                "last_modified": validators.get("last_modified"),
+                "updated_at": all_docs["metadata"]["crawled_at"]
+            }
+            # 각 섹션을 개별 파일로 저장
+            self.save_section_to_file(section_name, section_data)
+        
+        changes["removed"] = [name for name in previous_state if name not in sections]
+        spec_changed = bool(changes["added"] or changes["changed"] or changes["removed"])
+        
+        if spec_changed or not (self.output_dir / "deepsearch_api_complete.json").exists():
+            # 전체 문서를 하나의 JSON 파일로 저장
+            self.save_all_docs(all_docs)
             
+            # Markdown 형식으로도 저장
+            self.generate_markdown_docs(all_docs)
+        else:
+            logger.info("📭 변경된 섹션 없음 - 전체 문서 저장 생략")
+        
+        self._state["sections"] = section_state
+        self._save_state()
+        self.save_change_report(all_docs["metadata"], changes, spec_changed)
+        all_docs["metadata"]["changes"] = changes
+        
+        logger.info(f"\n✅ 전체 크롤링 완료! ({time.time() - started:.2f}초)")
+        logger.info(f"📂 저장 위치: {self.output_dir.absolute()}")
+        
+        return all_docs
+    
+    def _crawl_sections_with_browser(self) -> Dict[str, Dict]:
+        """WebDriver 풀로 섹션을 동시에 렌더링해 크롤링 (동시 요청 수 = pool_size)"""
+        
+        if self._pool is None:
+            self._pool = DriverPool(self._create_driver, self.pool_size)
+        
+        logger.info(f"🚀 {len(self.sections)}개 섹션 크롤링 시작 (WebDriver {self.pool_size}개)")
+        
+        def crawl(item):
+            section_name, section_path = item
+            logger.info(f"📄 [{section_name}] 크롤링 중...")
             try:
-                section_data = self.crawl_section(section_name, section_path)
-                all_docs["sections"][section_name] = section_data
-                
+                with self._pool.acquire() as driver:
+                    section_data = self.crawl_section(section_name, section_path, driver=driver)
                 logger.info(f"✅ [{section_name}] 완료 - {len(section_data.get('endpoints', []))}개 엔드포인트")
-                
-                # 각 섹션을 개별 파일로 저장
-                self.save_section_to_file(section_name, section_data)
-                
-                # 서버 부하 방지
-                time.sleep(2)
-                
+                return section_name, section_data
             except Exception as e:
                 logger.error(f"❌ [{section_name}] 크롤링 실패: {e}")
-                all_docs["sections"][section_name] = {"error": str(e)}
+                return section_name, {"error": str(e)}
         
-        # 전체 문서를 하나의 JSON 파일로 저장
-        self.save_all_docs(all_docs)
+        with ThreadPoolExecutor(max_workers=max(1, self.pool_size), thread_name_prefix="doc-crawler") as executor:
+            results = dict(executor.map(crawl, self.sections.items()))
         
-        # Markdown 형식으로도 저장
-        self.generate_markdown_docs(all_docs)
+        self._log_timings()
         
-        logger.info(f"\n✅ 전체 크롤링 완료!")
-        logger.info(f"📂 저장 위치: {self.output_dir.absolute()}")
+        # 원래 섹션 순서 유지
+        return {section_name: results[section_name] for section_name in self.sections}
+    
+    def _log_timings(self):
+        """섹션별 소요 시간 요약 (느린 순)"""
+        if not self.section_timings:
+            return
+        logger.info("⏱️ 섹션별 소요 시간 (로드 / 대기 / 파싱)")
+        for section_name, timing in sorted(self.section_timings.items(), key=lambda kv: -kv[1]["total"]):
+            logger.info(f"   {section_name}: {timing['total']:.2f}초 "
+                        f"({timing['load']:.2f} / {timing['wait']:.2f} / {timing['parse']:.2f})")
+    
+    # ========================================
+    # 스펙 모드 (브라우저 없이 OpenAPI/Redoc JSON 사용)
+    # ========================================
+    
+    def load_spec(self, source: str = None, conditional: bool = False) -> Tuple[Optional[Dict], str]:
+        """
+        OpenAPI 스펙을 로드합니다.
         
-        return all_docs
+        source가 로컬 파일이면 그대로 읽고, URL이면 HTTP로 한 번 가져옵니다.
+        Redoc HTML 페이지가 오면 내장된 __redoc_state 또는 spec-url / Redoc.init()이 가리키는 스펙을 찾습니다.
+        
+        Args:
+            conditional: 저장된 ETag / Last-Modified로 조건부 요청 (304이면 스펙 대신 None 반환)
+        
+        Returns:
+            (스펙 dict 또는 None, 실제 스펙 위치)
+        """
+        source = source or self.spec_source or f"{self.base_url}/api/"
+        
+        path = Path(source)
+        if "://" not in source and path.exists():
+            text = path.read_text(encoding="utf-8")
+        else:
+            text = self._fetch(source, conditional)
+            if text is None:
+                # 304: 페이지가 가리키던 스펙 URL이 따로 있으면 그쪽도 확인
+                spec_url = self._state["sources"].get(source, {}).get("spec_url")
+                if spec_url:
+                    return self.load_spec(spec_url, conditional)
+                logger.info(f"📭 스펙 변경 없음 (304): {source}")
+                return None, source
+        
+        stripped = text.lstrip()
+        if stripped.startswith("{"):
+            spec = json.loads(stripped)
+        else:
+            spec, spec_url = self._spec_from_html(text)
+            if spec is None:
+                if spec_url is None:
+                    raise ValueError(f"스펙을 찾을 수 없습니다: {source}")
+                if "://" not in source:
+                    spec_url = str(path.parent / spec_url) if "://" not in spec_url else spec_url
+                else:
+                    spec_url = urljoin(source, spec_url)
+                    self._state["sources"].setdefault(source, {})["spec_url"] = spec_url
+                return self.load_spec(spec_url, conditional)
+        
+        if "paths" not in spec:
+            raise ValueError(f"OpenAPI 스펙이 아닙니다: {source}")
+        
+        logger.info(f"📥 스펙 로드 완료: {source} ({len(spec['paths'])}개 경로)")
+        return spec, source
+    
+    def _fetch(self, url: str, conditional: bool = False) -> Optional[str]:
+        """GET 요청. conditional이면 저장된 검증자로 조건부 요청하고 304이면 None을 반환합니다."""
+        headers = {"Accept": "application/json, text/html"}
+        source_state = self._state["sources"].setdefault(url, {})
+        if conditional:
+            if source_state.get("etag"):
+                headers["If-None-Match"] = source_state["etag"]
+            if source_state.get("last_modified"):
+                headers["If-Modified-Since"] = source_state["last_modified"]
+        
+        def send():
+            response = self.transport.get(url, headers=headers)
+            response.raise_for_status()
+            return response
+        
+        response = call_with_retry(send, get_circuit_breaker("deepsearch-docs", urlparse(url).path or "/"))
+        if response.status_code == 304:
+            return None
+        
+        source_state["etag"] = response.headers.get("ETag")
+        source_state["last_modified"] = response.headers.get("Last-Modified")
+        return response.text
+    
+    def _spec_from_html(self, html: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """Redoc HTML에서 내장 스펙 또는 스펙 URL을 찾습니다."""
+        
+        # redoc-cli 번들: const __redoc_state = {"menu": ..., "spec": {"data": {...}}};
+        match = re.search(r'__redoc_state\s*=\s*', html)
+        if match:
+            state, _ = json.JSONDecoder().raw_decode(html, match.end())
+            return state.get("spec", {}).get("data", state), None
+        
+        # <redoc spec-url="..."> 또는 Redoc.init("...")
+        match = (re.search(r'spec-url\s*=\s*["\']([^"\']+)', html)
+                 or re.search(r'Redoc\.init\(\s*["\']([^"\']+)', html))
+        return None, match.group(1) if match else None
+    
+    def _resolve(self, spec: Dict, obj: Any) -> Any:
+        """$ref(#/components/...)를 따라가 실제 객체를 반환합니다."""
+        seen = set()
+        while isinstance(obj, dict) and "$ref" in obj and obj["$ref"].startswith("#/") and obj["$ref"] not in seen:
+            seen.add(obj["$ref"])
+            target = spec
+            for part in obj["$ref"][2:].split("/"):
+                target = target.get(part.replace("~1", "/").replace("~0", "~"), {})
+            obj = target
+        return obj
+    
+    def _split_markdown_sections(self, markdown: str) -> Dict[str, str]:
+        """info.description의 제목(#, ##)별 본문. Redoc은 이 제목들을 #section/ 앵커로 만듭니다."""
+        chunks = {}
+        current = None
+        in_code = False
+        
+        for line in markdown.splitlines():
+            if line.lstrip().startswith("```"):
+                in_code = not in_code
+            heading = None if in_code else re.match(r'#{1,2}\s+(.+?)\s*#*\s*$', line)
+            if heading:
+                current = _section_key(heading.group(1))
+                chunks.setdefault(current, [])
+            elif current is not None:
+                chunks[current].append(line)
+        
+        return {key: "\n".join(lines).strip() for key, lines in chunks.items()}
+    
+    def _tag_sections(self, spec: Dict) -> Dict[str, List[str]]:
+        """섹션 키 → 태그 목록 (태그 이름 자체와 x-tagGroups 그룹 이름 모두 매칭)"""
+        tag_sections = {}
+        for tag in spec.get("tags", []):
+            tag_sections.setdefault(_section_key(tag["name"]), []).append(tag["name"])
+        for group in spec.get("x-tagGroups", []):
+            tag_sections.setdefault(_section_key(group["name"]), []).extend(group.get("tags", []))
+        return tag_sections
+    
+    def _spec_operation_data(self, spec: Dict, path: str, method: str, operation: Dict,
+                             path_parameters: List, server_url: str) -> Dict:
+        """오퍼레이션 하나에서 엔드포인트 / 파라미터 / 예제를 만듭니다."""
+        description = operation.get("summary") or operation.get("description", "")
+        endpoint = {
+            "method": method.upper(),
+            "path": path,
+            "description": description,
+            "full_url": f"{server_url}{path}"
+        }
+        
+        parameters = {}
+        for param in list(path_parameters) + operation.get("parameters", []):
+            param = self._resolve(spec, param)
+            if not param.get("name"):
+                continue
+            schema = self._resolve(spec, param.get("schema", {}))
+            parameters[param["name"]] = {
+                "type": schema.get("type", "string"),
+                "description": param.get("description", ""),
+                "required": bool(param.get("required")),
+                "in": param.get("in", "query")
+            }
+        
+        examples = []
+        for sample in operation.get("x-codeSamples", operation.get("x-code-samples", [])):
+            examples.append({
+                "language": (sample.get("lang") or "unknown").lower(),
+                "code": sample.get("source", ""),
+                "description": sample.get("label") or description
+            })
+        for status, response in operation.get("responses", {}).items():
+            response = self._resolve(spec, response)
+            for media in response.get("content", {}).values():
+                samples = [media["example"]] if "example" in media else [
+                    self._resolve(spec, example).get("value") for example in media.get("examples", {}).values()]
+                for sample in samples:
+                    if sample is not None:
+                        examples.append({
+                            "language": "json",
+                            "code": json.dumps(sample, ensure_ascii=False, indent=2),
+                            "description": f"{method.upper()} {path} 응답 예시 ({status})"
+                        })
+        
+        return {"endpoint": endpoint, "parameters": parameters, "examples": examples,
+                "text": "\n".join(filter(None, [f"{method.upper()} {path}", operation.get("summary"),
+                                                  operation.get("description")]))}
+    
+    def build_sections_from_spec(self, spec: Dict) -> Dict[str, Dict]:
+        """
+        OpenAPI 스펙 하나로 전체 섹션 데이터를 만듭니다. (crawl_section과 같은 구조)
+        
+        #section/ 앵커는 info.description의 제목에, 오퍼레이션은 태그(또는 x-tagGroups)에 매칭합니다.
+        어느 섹션에도 속하지 않는 태그는 태그 이름으로 섹션을 추가합니다.
+        """
+        servers = spec.get("servers") or [{}]
+        server_url = servers[0].get("url", "").rstrip("/") or self.base_url
+        
+        markdown_sections = self._split_markdown_sections(spec.get("info", {}).get("description", ""))
+        tag_sections = self._tag_sections(spec)
+        tag_descriptions = {tag["name"]: tag.get("description", "") for tag in spec.get("tags", [])}
+        
+        # 태그 → 오퍼레이션
+        operations_by_tag = {}
+        for path, path_item in spec.get("paths", {}).items():
+            path_item = self._resolve(spec, path_item)
+            for method in HTTP_METHODS:
+                operation = path_item.get(method)
+                if operation is None:
+                    continue
+                data = self._spec_operation_data(spec, path, method, operation,
+                                                 path_item.get("parameters", []), server_url)
+                for tag in operation.get("tags") or ["default"]:
+                    operations_by_tag.setdefault(tag, []).append(data)
+        
+        targets = dict(self.sections)
+        assigned = {tag for name in targets for tag in tag_sections.get(_section_key(name), [])}
+        for tag in operations_by_tag:
+            if tag not in assigned:
+                targets[tag] = f"/api/#tag/{tag.replace(' ', '-')}"
+        
+        sections = {}
+        for section_name, section_path in targets.items():
+            key = _section_key(section_name)
+            tags = tag_sections.get(key) or ([section_name] if section_name in operations_by_tag else [])
+            markdown = markdown_sections.get(key, "")
+            
+            section_data = {
+                "url": f"{self.base_url}{section_path}",
+                "title": section_name,
+                "description": "",
+                "endpoints": [],
+                "examples": [],
+                "parameters": {}
+            }
+            
+            # 설명: 본문의 첫 문단, 없으면 태그 설명
+            prose = CODE_FENCE_PATTERN.sub("", markdown)
+            paragraphs = [p.strip() for p in re.split(r'\n\s*\n', prose) if p.strip() and not p.lstrip().startswith("#")]
+            section_data["description"] = paragraphs[0] if paragraphs else next(
+                (tag_descriptions[tag] for tag in tags if tag_descriptions.get(tag)), "")
+            
+            examples = [{"language": language.lower() or "unknown", "code": code.strip(), "description": ""}
+                        for language, code in CODE_FENCE_PATTERN.findall(markdown)]
+            texts = [markdown]
+            seen = set()
+            for tag in tags:
+                for data in operations_by_tag.get(tag, []):
+                    endpoint_key = f"{data['endpoint']['method']}:{data['endpoint']['path']}"
+                    if endpoint_key in seen:
+                        continue
+                    seen.add(endpoint_key)
+                    section_data["endpoints"].append(data["endpoint"])
+                    section_data["parameters"].update(data["parameters"])
+                    examples.extend(data["examples"])
+                    texts.append(data["text"])
+            
+            for i, example in enumerate(examples):
+                section_data["examples"].append({"id": f"example_{i+1}", **example})
+            self._store_raw_content(section_data, "\n\n".join(filter(None, texts)))
+            sections[section_name] = section_data
+            
+            logger.info(f"✅ [{section_name}] {len(section_data['endpoints'])}개 엔드포인트, "
+                        f"{len(section_data['examples'])}개 예제")
+        
+        return sections
+    
+    def _wait_for_content(self, driver, section_path: str):
+        """고정 대기 대신 콘텐츠 선택자와 섹션 앵커가 렌더링될 때까지 대기합니다."""
+        
+        WebDriverWait(driver, self.wait_timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, ", ".join(CONTENT_SELECTORS)))
+        )
+        
+        # Redoc은 #section/... 앵커와 같은 id의 요소를 렌더링합니다 (없는 페이지도 있으므로 실패는 무시)
+        if "#" in section_path:
+            anchor = unquote(section_path.split("#", 1)[1])
+            try:
+                WebDriverWait(driver, min(5, self.wait_timeout)).until(
+                    lambda d: d.execute_script("return !!document.getElementById(arguments[0])", anchor)
+                )
+            except TimeoutException:
+                logger.debug(f"섹션 앵커 없음: {anchor}")
     
-    def crawl_section(self, section_name: str, section_path: str) -> Dict:
-        """특정 섹션 크롤링"""
+    def crawl_section(self, section_name: str, section_path: str, driver=None) -> Dict:
+        """특정 섹션 크롤링 (driver가 없으면 self.driver 사용)"""
         
         url = f"{self.base_url}{section_path}"
         
+        if driver is None:
+            if not self.driver:
+                self.setup_driver()
+            driver = self.driver
+        
         try:
+            started = time.time()
+            
             # 페이지 로드
-            self.driver.get(url)
+            driver.get(url)
+            loaded = time.time()
             
             # JavaScript 렌더링 대기
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            self._wait_for_content(driver, section_path)
+            rendered = time.time()
             
-            # 추가 대기 (동적 콘텐츠 로딩)
-            time.sleep(5)
-            
-            # 페이지 소스 가져오기
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            # 페이지 소스 가져오기 (lxml로 한 번만 파싱)
+            page_source = driver.page_source
+            root = lxml.html.fromstring(page_source)
             
             # 섹션 데이터 추출
             section_data = {
@@ -135,53 +786,50 @@ class DeepsearchDocCrawler:
                 "description": "",
                 "endpoints": [],
                 "examples": [],
-                "parameters": {},
-                "raw_content": ""
+                "parameters": {}
             }
             
-            # 콘텐츠 추출 (여러 가능한 선택자 시도)
-            content_selectors = [
-                '.api-content',
-                '.swagger-ui',
-                '.documentation',
-                'article',
-                'main',
-                '.content',
-                '#api-docs'
-            ]
-            
+            # 콘텐츠 추출 (여러 가능한 선택자 시도, 없으면 전체 body)
             content_element = None
-            for selector in content_selectors:
-                try:
-                    content_element = soup.select_one(selector)
-                    if content_element:
-                        break
-                except:
-                    continue
-            
-            if not content_element:
-                # 전체 body에서 추출
-                content_element = soup.find('body')
+            for xpath in CONTENT_XPATHS:
+                found = root.xpath(xpath)
+                if found:
+                    content_element = found[0]
+                    break
+            if content_element is None:
+                content_element = root.find('body') if root.tag != 'body' else root
             
-            if content_element:
-                # 설명 추출
-                description = self._extract_description(content_element)
-                section_data["description"] = description
+            if content_element is not None:
+                raw_text = "\n".join(piece.strip() for piece in content_element.itertext() if piece.strip())
                 
-                # API 엔드포인트 추출
-                endpoints = self._extract_endpoints(content_element)
-                section_data["endpoints"] = endpoints
+                # 렌더링된 콘텐츠가 이전과 같으면 추출 없이 이전 결과 재사용
+                content_hash = hashlib.sha256(raw_text.encode("utf-8")).hexdigest()
+                previous = self._state["sections"].get(section_name)
+                if previous and previous["hash"] == content_hash and self._section_path(section_name).exists():
+                    with open(self._section_path(section_name), 'r', encoding='utf-8') as f:
+                        section_data = json.load(f)
+                    section_data["_content_hash"] = content_hash
+                    logger.info(f"📭 [{section_name}] 변경 없음 - 추출 생략")
+                    return section_data
+                section_data["_content_hash"] = content_hash
                 
-                # 예제 코드 추출
-                examples = self._extract_code_examples(content_element)
-                section_data["examples"] = examples
-                
-                # 파라미터 정보 추출
-                parameters = self._extract_parameters(content_element)
-                section_data["parameters"] = parameters
-                
-                # 전체 텍스트 추출
-                section_data["raw_content"] = content_element.get_text(separator="\n", strip=True)
+                # 한 번 순회로 코드 블록 / 테이블 / 제목을 모은 뒤 각 추출기로 전달
+                scan = ContentScan(content_element)
+                section_data["description"] = self._extract_description(scan)
+                section_data["endpoints"] = self._extract_endpoints(scan)
+                section_data["examples"] = self._extract_code_examples(scan)
+                section_data["parameters"] = self._extract_parameters(scan)
+                self._store_raw_content(section_data, raw_text)
+            
+            finished = time.time()
+            self.section_timings[section_name] = {
+                "load": loaded - started,
+                "wait": rendered - loaded,
+                "parse": finished - rendered,
+                "total": finished - started
+            }
+            logger.info(f"⏱️ [{section_name}] {finished - started:.2f}초 (로드 {loaded - started:.2f} / "
+                        f"대기 {rendered - loaded:.2f} / 파싱 {finished - rendered:.2f})")
             
             return section_data
             
@@ -189,29 +837,21 @@ class DeepsearchDocCrawler:
             logger.error(f"섹션 크롤링 오류: {e}")
             raise
     
-    def _extract_description(self, element) -> str:
+    def _extract_description(self, scan: ContentScan) -> str:
         """섹션 설명 추출"""
         description = ""
         
-        # 설명 패턴 찾기
-        desc_selectors = [
-            'p:first-of-type',
-            '.description',
-            '.intro',
-            'h2 + p',
-            'h1 + p'
-        ]
-        
-        for selector in desc_selectors:
-            desc_elem = element.select_one(selector)
-            if desc_elem:
-                description = desc_elem.get_text(strip=True)
+        # 설명 패턴 (p:first-of-type, .description, .intro, h2 + p, h1 + p 순서)
+        for key in ("p", "description", "intro", "h2+p", "h1+p"):
+            desc_elem = scan.description_candidates.get(key)
+            if desc_elem is not None:
+                description = scan.text_of(desc_elem)
                 if len(description) > 20:  # 유효한 설명
                     break
         
         return description
     
-    def _extract_endpoints(self, element) -> List[Dict]:
+    def _extract_endpoints(self, scan: ContentScan) -> List[Dict]:
         """API 엔드포인트 추출"""
         endpoints = []
         
@@ -219,38 +859,29 @@ class DeepsearchDocCrawler:
         method_pattern = re.compile(r'(GET|POST|PUT|DELETE|PATCH)\s+(/[^\s]+)')
         
         # 코드 블록에서 엔드포인트 찾기
-        code_blocks = element.find_all(['code', 'pre'])
-        
-        for code in code_blocks:
-            text = code.get_text()
-            matches = method_pattern.findall(text)
-            
-            for method, path in matches:
+        for block in scan.code_blocks:
+            for method, path in method_pattern.findall(block["raw"]):
                 endpoint = {
                     "method": method,
                     "path": path,
-                    "description": self._find_nearby_description(code),
+                    "description": self._find_nearby_description(scan, block),
                     "full_url": f"{self.base_url}{path}" if not path.startswith('http') else path
                 }
                 endpoints.append(endpoint)
         
         # 테이블에서 엔드포인트 찾기
-        tables = element.find_all('table')
-        for table in tables:
-            rows = table.find_all('tr')[1:]  # 헤더 제외
-            
-            for row in rows:
-                cells = row.find_all('td')
+        for table in scan.tables:
+            for row in table["rows"]:
+                cells = row["cells"]
                 if len(cells) >= 2:
                     # 첫 번째 셀에 메서드, 두 번째 셀에 경로
-                    method_text = cells[0].get_text(strip=True)
-                    path_text = cells[1].get_text(strip=True)
+                    method_text, path_text = cells[0], cells[1]
                     
                     if any(m in method_text.upper() for m in ['GET', 'POST', 'PUT', 'DELETE']):
                         endpoint = {
                             "method": method_text.upper(),
                             "path": path_text,
-                            "description": cells[2].get_text(strip=True) if len(cells) > 2 else "",
+                            "description": cells[2] if len(cells) > 2 else "",
                             "full_url": f"{self.base_url}{path_text}" if not path_text.startswith('http') else path_text
                         }
                         endpoints.append(endpoint)
@@ -266,15 +897,12 @@ class DeepsearchDocCrawler:
         
         return unique_endpoints
     
-    def _extract_code_examples(self, element) -> List[Dict]:
+    def _extract_code_examples(self, scan: ContentScan) -> List[Dict]:
         """예제 코드 추출"""
         examples = []
         
-        # 코드 블록 찾기
-        code_blocks = element.find_all(['pre', 'code'])
-        
-        for i, code in enumerate(code_blocks):
-            text = code.get_text(strip=True)
+        for block in scan.code_blocks:
+            text = block["raw"].strip()
             
             if len(text) > 10:  # 유효한 코드
                 # 언어 감지
@@ -289,66 +917,112 @@ class DeepsearchDocCrawler:
                     language = "json"
                 
                 example = {
-                    "id": f"example_{i+1}",
+                    "id": f"example_{len(examples)+1}",
                     "language": language,
                     "code": text,
-                    "description": self._find_nearby_description(code)
+                    "description": self._find_nearby_description(scan, block)
                 }
                 examples.append(example)
         
         return examples
     
-    def _extract_parameters(self, element) -> Dict:
+    def _extract_parameters(self, scan: ContentScan) -> Dict:
         """파라미터 정보 추출"""
         parameters = {}
         
-        # 테이블에서 파라미터 찾기
-        tables = element.find_all('table')
-        
-        for table in tables:
-            headers = [th.get_text(strip=True).lower() for th in table.find_all('th')]
-            
+        for table in scan.tables:
             # 파라미터 테이블인지 확인
-            if any(keyword in ' '.join(headers) for keyword in ['parameter', 'param', '파라미터', 'name', 'type']):
-                rows = table.find_all('tr')[1:]  # 헤더 제외
-                
-                for row in rows:
-                    cells = row.find_all('td')
+            if any(keyword in ' '.join(table["headers"]) for keyword in ['parameter', 'param', '파라미터', 'name', 'type']):
+                for row in table["rows"]:
+                    cells = row["cells"]
                     if len(cells) >= 2:
-                        param_name = cells[0].get_text(strip=True)
-                        param_type = cells[1].get_text(strip=True) if len(cells) > 1 else "string"
-                        param_desc = cells[2].get_text(strip=True) if len(cells) > 2 else ""
-                        param_required = "required" in row.get_text().lower()
-                        
-                        parameters[param_name] = {
-                            "type": param_type,
-                            "description": param_desc,
-                            "required": param_required
+                        parameters[cells[0]] = {
+                            "type": cells[1],
+                            "description": cells[2] if len(cells) > 2 else "",
+                            "required": "required" in row["text"].lower()
                         }
         
         return parameters
     
-    def _find_nearby_description(self, element) -> str:
-        """요소 근처의 설명 텍스트 찾기"""
-        description = ""
+    def _find_nearby_description(self, scan: ContentScan, block: Dict) -> str:
+        """코드 블록 앞(문서 순서)의 가장 가까운 p / div / span 텍스트"""
+        if block["context"] is None:
+            return ""
+        text = scan.text_of(block["context"])
+        return text if 10 < len(text) < 500 else ""
+    
+    def _store_raw_content(self, section_data: Dict, text: str):
+        """raw_content 저장 방식에 따라 전체 텍스트를 저장합니다. (읽을 때는 api_doc_index.load_raw_content)"""
+        if self.raw_content == "full":
+            section_data["raw_content"] = text
+        elif self.raw_content == "compressed":
+            section_data["raw_content_z"] = base64.b64encode(zlib.compress(text.encode("utf-8"), 9)).decode("ascii")
+    
+    # ========================================
+    # 증분 크롤링 상태
+    # ========================================
+    
+    def _load_state(self) -> Dict:
+        if self.state_path.exists():
+            try:
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                state.setdefault("sections", {})
+                state.setdefault("sources", {})
+                return state
+            except (OSError, ValueError) as e:
+                logger.warning(f"크롤링 상태 파일을 읽을 수 없어 전체 크롤링합니다: {e}")
+        return {"sections": {}, "sources": {}}
+    
+    def _save_state(self):
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._state, f, ensure_ascii=False, indent=2)
+        tmp_path.replace(self.state_path)
+    
+    @staticmethod
+    def _hash(data: Any) -> str:
+        return hashlib.sha256(json.dumps(data, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+    
+    def _section_path(self, section_name: str) -> Path:
+        # 파일명에서 특수문자 제거
+        safe_name = re.sub(r'[^\w\s-]', '', section_name).strip().replace(' ', '_')
+        return self.output_dir / f"{safe_name}.json"
+    
+    def _previous_sections(self) -> Optional[Dict[str, Dict]]:
+        """이전 크롤링의 섹션 파일들. 하나라도 없으면 None."""
+        names = list(self._state.get("sections", {}))
+        if not names or not all(self._section_path(name).exists() for name in names):
+            return None
+        sections = {}
+        for name in names:
+            with open(self._section_path(name), 'r', encoding='utf-8') as f:
+                sections[name] = json.load(f)
+        return sections
+    
+    def save_change_report(self, metadata: Dict, changes: Dict[str, List[str]], spec_changed: bool):
+        """
+        변경 섹션 보고서 저장 (crawl_changes.json)
         
-        # 이전 형제 요소에서 설명 찾기
-        prev = element.find_previous(['p', 'div', 'span'])
-        if prev:
-            text = prev.get_text(strip=True)
-            if len(text) > 10 and len(text) < 500:
-                description = text
+        spec_changed가 False이면 deepsearch_client_generated.py를 다시 생성할 필요가 없습니다.
+        """
+        report = {
+            "crawled_at": metadata["crawled_at"],
+            "source": metadata.get("source"),
+            "spec_changed": spec_changed,
+            **changes
+        }
+        with open(self.report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
         
-        return description
+        logger.info(f"📝 변경 보고서: 추가 {len(changes['added'])}, 변경 {len(changes['changed'])}, "
+                    f"삭제 {len(changes['removed'])}, 유지 {len(changes['unchanged'])}")
     
     def save_section_to_file(self, section_name: str, section_data: Dict):
         """섹션 데이터를 개별 파일로 저장"""
         
-        # 파일명에서 특수문자 제거
-        safe_name = re.sub(r'[^\w\s-]', '', section_name).strip().replace(' ', '_')
-        
         # JSON 저장
-        json_path = self.output_dir / f"{safe_name}.json"
+        json_path = self._section_path(section_name)
         with open(json_path, 'w', encoding='utf-8') as f:
             json.dump(section_data, f, ensure_ascii=False, indent=2)
         
@@ -361,7 +1035,10 @@ class DeepsearchDocCrawler:
         with open(json_path, 'w', encoding='utf-8') as f:
             json.dump(all_docs, f, ensure_ascii=False, indent=2)
         
-        logger.info(f"📦 전체 문서 저장: {json_path.name}")
+        # 분석기가 전체 문서를 읽지 않도록 인덱스 + 사이드카도 함께 저장
+        index_path = write_doc_index(all_docs, self.output_dir)
+        
+        logger.info(f"📦 전체 문서 저장: {json_path.name} (인덱스: {index_path.name})")
     
     def generate_markdown_docs(self, all_docs: Dict):
         """Markdown 형식으로 문서 생성"""
@@ -426,7 +1103,12 @@ class DeepsearchDocCrawler:
         """리소스 정리"""
         if self.driver:
             self.driver.quit()
+            self.driver = None
             logger.info("🔒 WebDriver 종료")
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+            logger.info("🔒 WebDriver 풀 종료")
 
 
 # ========================================
@@ -436,15 +1118,29 @@ class DeepsearchDocCrawler:
 def main():
     """Deepsearch API 문서 크롤링 실행"""
     
+    parser = argparse.ArgumentParser(description="Deepsearch API 문서 크롤러")
+    parser.add_argument("--mode", choices=["auto", "spec", "browser"], default="auto",
+                        help="spec: OpenAPI 스펙 사용 (브라우저 불필요), browser: Selenium 렌더링")
+    parser.add_argument("--spec", dest="spec_source", help="스펙 URL 또는 로컬 파일 경로")
+    parser.add_argument("--output-dir", default="deepsearch_docs")
+    parser.add_argument("--workers", type=int, default=3, help="브라우저 모드 동시 WebDriver 수")
+    parser.add_argument("--show-browser", action="store_true", help="헤드리스 대신 브라우저 창 표시 (디버깅용)")
+    parser.add_argument("--force", action="store_true", help="변경 여부와 관계없이 전체 다시 추출/저장")
+    parser.add_argument("--raw-content", choices=RAW_CONTENT_MODES, default="compressed",
+                        help="섹션 전체 텍스트 저장 방식 (기본값: 압축)")
+    args = parser.parse_args()
+    
     print("="*60)
     print("🚀 Deepsearch API 문서 크롤러")
     print("="*60)
     
-    crawler = DeepsearchDocCrawler(output_dir="deepsearch_docs")
+    crawler = DeepsearchDocCrawler(output_dir=args.output_dir, spec_source=args.spec_source,
+                                   headless=not args.show_browser, pool_size=args.workers,
+                                   raw_content=args.raw_content)
     
     try:
         # 모든 섹션 크롤링
-        all_docs = crawler.crawl_all_sections()
+        all_docs = crawler.crawl_all_sections(mode=args.mode, force=args.force)
         
         print("\n" + "="*60)
         print("✅ 크롤링 완료!")
@@ -466,6 +1162,10 @@ def main():
         )
         print(f"  - 총 예제: {total_examples}개")
         
+        changes = all_docs['metadata']['changes']
+        print(f"  - 변경 섹션: {len(changes['added']) + len(changes['changed']) + len(changes['removed'])}개 "
+              f"(유지 {len(changes['unchanged'])}개)")
+        
         print(f"\n📂 저장 위치: {crawler.output_dir.absolute()}")
         print("\n파일 목록:")
         for file in sorted(crawler.output_dir.glob("*")):
@@ -0,0 +1,112 @@
+"""
+HTTP 전송 계층 모듈
+Deepsearch, Finnhub, Slack 클라이언트가 공유하는 keep-alive 커넥션 풀을 관리합니다.
+"""
+
+import threading
+from typing import Dict, Any, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config_compat import get_http_config
+
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class HTTPTransport:
+    """호스트별 커넥션 풀과 기본 타임아웃을 가진 공유 HTTP 전송 계층"""
+
+    def __init__(self,
+                 pool_sizes: Dict[str, int] = None,
+                 default_pool_size: int = None,
+                 timeout: Timeout = None,
+                 pool_block: bool = None):
+        """
+        Args:
+            pool_sizes: 호스트별 풀 크기 (예: {"finnhub.io": 16})
+            default_pool_size: 호스트별 설정이 없을 때의 풀 크기
+            timeout: 기본 타임아웃 (connect, read) 초
+            pool_block: 풀이 가득 찼을 때 새 연결을 만드는 대신 대기할지 여부
+        """
+        self.pool_sizes = pool_sizes if pool_sizes is not None else (get_http_config("POOL_SIZES") or {})
+        self.default_pool_size = default_pool_size or get_http_config("DEFAULT_POOL_SIZE") or 10
+        if timeout is None:
+            timeout = (get_http_config("CONNECT_TIMEOUT") or 5, get_http_config("READ_TIMEOUT") or 30)
+        self.timeout = timeout
+        self.pool_block = bool(pool_block if pool_block is not None else get_http_config("POOL_BLOCK"))
+
+        self.session = requests.Session()
+        self._adapters: Dict[str, HTTPAdapter] = {}
+
+        # 기본 어댑터 (설정되지 않은 호스트용)
+        default_adapter = self._build_adapter(self.default_pool_size)
+        self.session.mount("https://", default_adapter)
+        self.session.mount("http://", default_adapter)
+        self._adapters["*"] = default_adapter
+
+        # 호스트별 어댑터 - Session은 가장 긴 prefix를 우선 사용
+        for host, size in self.pool_sizes.items():
+            adapter = self._build_adapter(size)
+            self.session.mount(f"https://{host}/", adapter)
+            self._adapters[host] = adapter
+
+    def _build_adapter(self, pool_size: int) -> HTTPAdapter:
+        """커넥션 풀 어댑터를 생성합니다."""
+        return HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, pool_block=self.pool_block)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """공유 세션으로 요청을 수행합니다. 타임아웃이 없으면 기본값을 사용합니다."""
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET 요청"""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """POST 요청"""
+        return self.request("POST", url, **kwargs)
+
+    def get_pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        호스트별 커넥션 풀 통계를 반환합니다.
+
+        misses는 새로 연결(TCP/TLS 핸드셰이크)을 맺은 횟수,
+        hits는 기존 keep-alive 연결을 재사용한 요청 수입니다.
+        """
+        stats = {}
+        for adapter in self._adapters.values():
+            for pool in list(adapter.poolmanager.pools._container.values()):
+                host = pool.host
+                requests_count = getattr(pool, "num_requests", 0)
+                misses = getattr(pool, "num_connections", 0)
+                entry = stats.setdefault(host, {
+                    "pool_size": self.pool_sizes.get(host, self.default_pool_size),
+                    "requests": 0,
+                    "hits": 0,
+                    "misses": 0
+                })
+                entry["requests"] += requests_count
+                entry["misses"] += misses
+                entry["hits"] += max(requests_count - misses, 0)
+        return stats
+
+    def close(self):
+        """세션과 모든 풀을 닫습니다."""
+        self.session.close()
+
+
+_default_transport: Optional[HTTPTransport] = None
+_default_transport_lock = threading.Lock()
+
+
+def get_transport() -> HTTPTransport:
+    """프로세스 전역에서 공유하는 기본 HTTPTransport를 반환합니다."""
+    global _default_transport
+    if _default_transport is None:
+        with _default_transport_lock:
+            if _default_transport is None:
+                _default_transport = HTTPTransport()
+    return _default_transport
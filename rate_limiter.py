@@ -0,0 +1,190 @@
+"""
+클라이언트 측 호출 속도 제한 모듈
+제공자/API 키별 토큰 버킷으로 호출 속도를 조절하고 Retry-After 및 rate-limit 헤더에 따라 속도를 조정합니다.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Mapping
+
+from config_compat import get_rate_limit_config
+
+
+class TokenBucket:
+    """스레드/asyncio 겸용 토큰 버킷"""
+
+    def __init__(self, calls: float, period: float = 60.0, burst: int = None):
+        """
+        Args:
+            calls: period 동안 허용되는 호출 수
+            period: 기간 (초)
+            burst: 한 번에 몰아서 보낼 수 있는 최대 호출 수 (기본값: calls)
+        """
+        self.period = period
+        self.rate = calls / period
+        self.capacity = float(burst or calls)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._stats = {"acquired": 0, "waited_seconds": 0.0, "throttled": 0}
+
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰을 채웁니다. (lock 보유 상태에서 호출)"""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """토큰을 예약하고 호출 전에 기다려야 하는 시간(초)을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            wait = max(wait, self._paused_until - now)
+            self._stats["acquired"] += 1
+            self._stats["waited_seconds"] += wait
+            return wait
+
+    def acquire(self, tokens: float = 1) -> float:
+        """토큰을 얻을 때까지 블로킹합니다. 기다린 시간(초)을 반환합니다."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1) -> float:
+        """토큰을 얻을 때까지 이벤트 루프를 막지 않고 대기합니다."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float):
+        """지정한 시간 동안 호출을 멈춥니다. (Retry-After 등)"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = min(self._tokens, 0.0)
+
+    def update_from_response(self, status_code: int, headers: Mapping[str, str]):
+        """
+        응답 상태 코드와 헤더로 속도를 조정합니다.
+
+        - 429 / Retry-After: 지정 시간만큼 일시 정지
+        - X-RateLimit-Limit: 서버가 알려준 한도로 속도 재설정
+        - X-RateLimit-Remaining / X-RateLimit-Reset: 남은 호출 수에 맞춰 토큰을 줄이고,
+          0이면 리셋 시각까지 일시 정지
+        """
+        retry_after = _parse_retry_after(headers.get("Retry-After"))
+        if status_code == 429 or retry_after is not None:
+            with self._lock:
+                self._stats["throttled"] += 1
+            self.pause(retry_after if retry_after is not None else 1.0)
+
+        limit = _parse_number(headers.get("X-RateLimit-Limit"))
+        remaining = _parse_number(headers.get("X-RateLimit-Remaining"))
+        reset = _parse_number(headers.get("X-RateLimit-Reset"))
+
+        with self._lock:
+            if limit and limit > 0:
+                # 이전 속도로 지금까지의 토큰을 채운 뒤 한도를 서버 값으로 교체 (한도가 다시 올라가면 버킷도 커짐)
+                self._refill(time.monotonic())
+                self.rate = limit / self.period
+                self.capacity = limit
+                self._tokens = min(self._tokens, self.capacity)
+            if remaining is not None:
+                self._tokens = min(self._tokens, remaining)
+
+        if remaining is not None and remaining <= 0 and reset:
+            # reset은 epoch 초 또는 남은 초로 올 수 있음
+            seconds = reset - time.time() if reset > 1e9 else reset
+            if seconds > 0:
+                self.pause(seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        """호출/대기/스로틀 통계를 반환합니다."""
+        with self._lock:
+            return {
+                **self._stats,
+                "rate_per_second": self.rate,
+                "tokens": round(self._tokens, 3),
+                "paused_for": max(0.0, self._paused_until - time.monotonic())
+            }
+
+
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 초 단위로 변환합니다."""
+    if value is None:
+        return None
+    seconds = _parse_number(value)
+    if seconds is not None:
+        return max(seconds, 0.0)
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+_buckets: Dict[tuple, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, api_key: str, method: str = None) -> Optional[TokenBucket]:
+    """
+    제공자 + API 키 (+ 메서드)별로 공유하는 TokenBucket을 반환합니다.
+
+    RATE_LIMIT_CONFIG[provider]에 method 항목이 없으면 "default" 설정을 사용하며,
+    설정이 전혀 없으면 None(제한 없음)을 반환합니다.
+    """
+    provider_config = get_rate_limit_config(provider) or {}
+    bucket_name = method if method in provider_config else "default"
+    spec = provider_config.get(bucket_name)
+    if not spec:
+        return None
+
+    key_id = hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]
+    bucket_key = (provider, key_id, bucket_name)
+    with _buckets_lock:
+        bucket = _buckets.get(bucket_key)
+        if bucket is None:
+            bucket = TokenBucket(spec["calls"], spec.get("period", 60), spec.get("burst"))
+            _buckets[bucket_key] = bucket
+        return bucket
+
+
+def send_with_rate_limit(limiter: Optional[TokenBucket], send, max_throttle_retries: int = None):
+    """
+    limiter 속도에 맞춰 send()를 호출하고 응답 헤더로 속도를 조정합니다.
+    429 응답은 limiter가 Retry-After만큼 기다린 뒤 최대 max_throttle_retries번 다시 보냅니다.
+
+    Args:
+        limiter: 사용할 TokenBucket (None이면 제한 없이 한 번 호출)
+        send: requests.Response를 반환하는 함수
+    """
+    if max_throttle_retries is None:
+        max_throttle_retries = get_rate_limit_config("MAX_THROTTLE_RETRIES") or 0
+
+    for attempt in range(max_throttle_retries + 1):
+        if limiter is not None:
+            limiter.acquire()
+        response = send()
+        if limiter is None:
+            return response
+        limiter.update_from_response(response.status_code, response.headers)
+        if response.status_code != 429:
+            return response
+    return response
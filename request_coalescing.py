@@ -0,0 +1,117 @@
+"""
+요청 병합(single-flight) 모듈
+동시에 들어온 동일한 요청을 한 번의 네트워크 호출로 합치고 결과를 모든 대기자에게 공유합니다.
+"""
+
+import asyncio
+import copy
+import threading
+import weakref
+from typing import Dict, Callable, Awaitable, TypeVar
+
+
+T = TypeVar("T")
+
+
+class _Call:
+    """진행 중인 호출 하나의 상태"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """스레드 간 동일 요청 병합"""
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "shared": 0}
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """
+        key로 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 fn을 실행합니다.
+        fn이 예외를 던지면 모든 대기자에게 같은 예외가 전달됩니다.
+        결과는 호출자마다 복사본을 돌려주므로 한 호출자의 수정이 다른 호출자에게 보이지 않습니다.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._stats["shared"] += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._stats["calls"] += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return copy.deepcopy(call.result)
+
+    def stats(self) -> Dict[str, int]:
+        """실제 호출 수(calls)와 병합된 요청 수(shared)를 반환합니다."""
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._calls)}
+
+
+class AsyncSingleFlight:
+    """asyncio 태스크 간 동일 요청 병합 (이벤트 루프별로 관리)"""
+
+    def __init__(self):
+        self._loop_calls: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = \
+            weakref.WeakKeyDictionary()
+        self._stats = {"calls": 0, "shared": 0}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """key로 진행 중인 코루틴이 있으면 그 결과를 기다리고, 없으면 fn()을 실행합니다. (결과는 호출자별 복사본)"""
+        loop = asyncio.get_running_loop()
+        calls = self._loop_calls.setdefault(loop, {})
+
+        task = calls.get(key)
+        if task is not None:
+            self._stats["shared"] += 1
+        else:
+            task = loop.create_task(fn())
+            calls[key] = task
+            self._stats["calls"] += 1
+            task.add_done_callback(lambda done: calls.pop(key) if calls.get(key) is done else None)
+
+        # 한 대기자가 취소되어도 공유 태스크는 계속 진행
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def stats(self) -> Dict[str, int]:
+        """실제 호출 수(calls)와 병합된 요청 수(shared)를 반환합니다."""
+        return {**self._stats, "in_flight": sum(len(calls) for calls in self._loop_calls.values())}
+
+
+_single_flights: Dict[str, SingleFlight] = {}
+_async_single_flights: Dict[str, AsyncSingleFlight] = {}
+_registry_lock = threading.Lock()
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """이름(제공자)별로 프로세스 전역에서 공유하는 SingleFlight를 반환합니다."""
+    with _registry_lock:
+        return _single_flights.setdefault(name, SingleFlight())
+
+
+def get_async_single_flight(name: str) -> AsyncSingleFlight:
+    """이름(제공자)별로 프로세스 전역에서 공유하는 AsyncSingleFlight를 반환합니다."""
+    with _registry_lock:
+        return _async_single_flights.setdefault(name, AsyncSingleFlight())
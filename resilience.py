@@ -0,0 +1,262 @@
+"""
+재시도 및 서킷 브레이커 모듈
+일시적인 오류(5xx, 타임아웃, 연결 오류)를 지수 백오프 + 지터로 재시도하고,
+엔드포인트별 서킷 브레이커로 장애 중인 업스트림 호출을 빠르게 차단합니다.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Dict, Any, Callable, Awaitable, Iterable, Optional, Tuple, TypeVar
+
+import requests
+
+from config_compat import get_retry_config
+
+
+T = TypeVar("T")
+
+DEFAULT_RETRY_EXCEPTIONS: Tuple[type, ...] = (
+    requests.exceptions.Timeout,
+    requests.exceptions.ConnectionError,
+    asyncio.TimeoutError,
+    ConnectionError,
+)
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """서킷이 열려 있어 요청을 보내지 않았을 때 발생합니다."""
+
+
+class RetryPolicy:
+    """멱등 요청의 재시도 정책 (지수 백오프 + full jitter)"""
+
+    def __init__(self,
+                 max_retries: int = None,
+                 base_delay: float = None,
+                 max_delay: float = None,
+                 retry_statuses: Iterable[int] = None,
+                 retry_exceptions: Tuple[type, ...] = None):
+        """
+        Args:
+            max_retries: 첫 시도 이후 최대 재시도 횟수
+            base_delay: 첫 재시도 대기 시간의 상한 (초)
+            max_delay: 대기 시간 상한 (초)
+            retry_statuses: 재시도할 HTTP 상태 코드
+            retry_exceptions: 재시도할 예외 타입 (타임아웃, 연결 오류 등)
+        """
+        self.max_retries = max_retries if max_retries is not None else (get_retry_config("MAX_RETRIES") or 0)
+        self.base_delay = base_delay if base_delay is not None else (get_retry_config("BASE_DELAY") or 0.5)
+        self.max_delay = max_delay if max_delay is not None else (get_retry_config("MAX_DELAY") or 8.0)
+        self.retry_statuses = frozenset(retry_statuses or get_retry_config("RETRY_STATUSES") or (500, 502, 503, 504))
+        self.retry_exceptions = retry_exceptions or DEFAULT_RETRY_EXCEPTIONS
+
+    def delay(self, attempt: int) -> float:
+        """attempt번째 재시도 전 대기 시간 (0 ~ base * 2^attempt 사이 무작위)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """일시적인 오류인지 판단합니다."""
+        status = _status_of(error)
+        if status is not None:
+            return status in self.retry_statuses
+        return isinstance(error, self.retry_exceptions)
+
+
+def _status_of(error: BaseException) -> Optional[int]:
+    """requests.HTTPError / aiohttp.ClientResponseError에서 상태 코드를 꺼냅니다."""
+    status = getattr(error, "status", None)
+    if isinstance(status, int):
+        return status
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+class CircuitBreaker:
+    """
+    엔드포인트별 서킷 브레이커
+
+    closed: 정상 / open: 연속 실패로 차단 중 / half_open: 복구 확인용 요청 1건만 허용
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = None, recovery_timeout: float = None):
+        self.name = name
+        self.failure_threshold = failure_threshold or get_retry_config("FAILURE_THRESHOLD") or 5
+        self.recovery_timeout = recovery_timeout or get_retry_config("RECOVERY_TIMEOUT") or 30.0
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> bool:
+        """요청을 보내도 되는지 확인합니다. half_open에서는 한 번에 하나의 확인 요청만 허용합니다."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def release_probe(self):
+        """확인 요청이 결과 없이 중단되었을 때(취소 등) 다음 확인 요청을 허용합니다."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태를 반환합니다."""
+        state = self.state
+        with self._lock:
+            retry_in = max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at)) \
+                if state == self.OPEN else 0.0
+            return {"state": state, "failures": self._failures, "retry_in": round(retry_in, 1)}
+
+
+def breaker_key(endpoint: str) -> str:
+    """
+    엔드포인트를 서킷 단위로 정규화합니다.
+    ID가 포함된 경로는 리소스 단위로 묶습니다. (예: /filings/0000320193-24 → /filings)
+    """
+    parts = []
+    for part in endpoint.strip("/").split("/"):
+        if not part or any(ch.isdigit() for ch in part) or len(parts) == 2:
+            break
+        parts.append(part)
+    return "/" + "/".join(parts)
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(provider: str, endpoint: str) -> CircuitBreaker:
+    """제공자 + 엔드포인트별로 공유하는 CircuitBreaker를 반환합니다."""
+    name = f"{provider}:{breaker_key(endpoint)}"
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name)
+            _breakers[name] = breaker
+        return breaker
+
+
+def get_circuit_states() -> Dict[str, Dict[str, Any]]:
+    """모든 서킷의 상태를 반환합니다. (예: {"deepsearch:/filings": {"state": "open", ...}})"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.snapshot() for breaker in breakers}
+
+
+def is_endpoint_available(provider: str, endpoint: str) -> bool:
+    """서킷이 열려 있지 않으면 True. 파이프라인이 죽은 소스를 건너뛰는 데 사용합니다."""
+    return get_circuit_breaker(provider, endpoint).state != CircuitBreaker.OPEN
+
+
+def call_with_retry(fn: Callable[[], T],
+                    breaker: CircuitBreaker = None,
+                    policy: RetryPolicy = None,
+                    idempotent: bool = True) -> T:
+    """
+    fn()을 서킷 브레이커와 재시도 정책 아래에서 실행합니다.
+
+    일시적인 오류는 idempotent일 때만 재시도하며, 재시도를 모두 소진하면 서킷에 실패로 기록하고
+    마지막 예외를 그대로 발생시킵니다.
+    """
+    policy = policy or RetryPolicy()
+    if breaker is not None and not breaker.allow_request():
+        raise CircuitOpenError(f"서킷 열림 - 요청 생략: {breaker.name}")
+
+    attempts = policy.max_retries + 1 if idempotent else 1
+    for attempt in range(attempts):
+        try:
+            result = fn()
+        except Exception as e:
+            if not policy.is_retryable(e):
+                if breaker is not None:
+                    # 4xx 등은 업스트림이 정상 응답한 것으로 간주
+                    if _status_of(e) is not None:
+                        breaker.record_success()
+                    else:
+                        breaker.release_probe()
+                raise
+            if attempt + 1 >= attempts:
+                if breaker is not None:
+                    breaker.record_failure()
+                raise
+            time.sleep(policy.delay(attempt))
+        except BaseException:
+            if breaker is not None:
+                breaker.release_probe()
+            raise
+        else:
+            if breaker is not None:
+                breaker.record_success()
+            return result
+
+
+async def call_with_retry_async(fn: Callable[[], Awaitable[T]],
+                                breaker: CircuitBreaker = None,
+                                policy: RetryPolicy = None,
+                                idempotent: bool = True) -> T:
+    """call_with_retry의 asyncio 버전 (대기 중 이벤트 루프를 막지 않음)"""
+    policy = policy or RetryPolicy()
+    if breaker is not None and not breaker.allow_request():
+        raise CircuitOpenError(f"서킷 열림 - 요청 생략: {breaker.name}")
+
+    attempts = policy.max_retries + 1 if idempotent else 1
+    for attempt in range(attempts):
+        try:
+            result = await fn()
+        except Exception as e:
+            if not policy.is_retryable(e):
+                if breaker is not None:
+                    # 4xx 등은 업스트림이 정상 응답한 것으로 간주
+                    if _status_of(e) is not None:
+                        breaker.record_success()
+                    else:
+                        breaker.release_probe()
+                raise
+            if attempt + 1 >= attempts:
+                if breaker is not None:
+                    breaker.record_failure()
+                raise
+            await asyncio.sleep(policy.delay(attempt))
+        except BaseException:
+            if breaker is not None:
+                breaker.release_probe()
+            raise
+        else:
+            if breaker is not None:
+                breaker.record_success()
+            return result
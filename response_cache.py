@@ -0,0 +1,182 @@
+"""
+API 응답 캐시 모듈
+엔드포인트별 TTL, 크기 제한 LRU 메모리 캐시와 선택적 디스크 캐시를 제공합니다.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+from config import get_config
+from config_compat import get_cache_config
+
+
+# 캐시 키에서 제외할 파라미터 (인증 정보)
+EXCLUDED_PARAMS = ("api_key", "token")
+
+
+class ResponseCache:
+    """TTL + LRU 응답 캐시 (선택적 디스크 계층 포함)"""
+
+    def __init__(self,
+                 max_entries: int = None,
+                 default_ttl: float = None,
+                 endpoint_ttls: Dict[str, float] = None,
+                 historical_ttl: float = None,
+                 disk_dir: str = None):
+        """
+        Args:
+            max_entries: 메모리에 유지할 최대 항목 수
+            default_ttl: 기본 TTL (초)
+            endpoint_ttls: 엔드포인트 prefix별 TTL (가장 긴 prefix 우선)
+            historical_ttl: date_to가 오늘 이전인 요청의 TTL (초)
+            disk_dir: 디스크 캐시 디렉토리 (None이면 메모리만 사용)
+        """
+        self.max_entries = max_entries or get_cache_config("MAX_ENTRIES") or 1024
+        self.default_ttl = default_ttl if default_ttl is not None else (get_cache_config("DEFAULT_TTL") or 300)
+        self.endpoint_ttls = endpoint_ttls if endpoint_ttls is not None else (get_cache_config("ENDPOINT_TTLS") or {})
+        self.historical_ttl = historical_ttl if historical_ttl is not None else (
+            get_cache_config("HISTORICAL_TTL") or self.default_ttl)
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0, "disk_hits": 0}
+
+    @staticmethod
+    def make_key(endpoint: str, params: Dict[str, Any] = None) -> str:
+        """엔드포인트와 정규화된 파라미터로 캐시 키를 생성합니다. (API 키 제외)"""
+        normalized = {
+            key: value for key, value in (params or {}).items()
+            if key not in EXCLUDED_PARAMS and value is not None and value != ""
+        }
+        payload = json.dumps({"endpoint": endpoint, "params": normalized},
+                             sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, endpoint: str, params: Dict[str, Any] = None) -> float:
+        """요청에 적용할 TTL을 결정합니다."""
+        # 과거 구간 조회는 결과가 바뀌지 않으므로 길게 유지
+        date_to = (params or {}).get("date_to")
+        if date_to:
+            try:
+                if date.fromisoformat(str(date_to)[:10]) < date.today():
+                    return self.historical_ttl
+            except ValueError:
+                pass
+
+        matched = None
+        for prefix in self.endpoint_ttls:
+            if endpoint.startswith(prefix) and (matched is None or len(prefix) > len(matched)):
+                matched = prefix
+        return self.endpoint_ttls[matched] if matched is not None else self.default_ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시된 값을 반환합니다. 없거나 만료되었으면 None.
+        호출자가 응답을 제자리에서 수정해도 캐시가 오염되지 않도록 복사본을 반환합니다.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return copy.deepcopy(value)
+                del self._entries[key]
+                self._stats["expired"] += 1
+
+        # 디스크 계층 확인
+        entry = self._read_disk(key)
+        with self._lock:
+            if entry is not None and entry[0] > now:
+                self._store(key, entry)
+                self._stats["hits"] += 1
+                self._stats["disk_hits"] += 1
+                return copy.deepcopy(entry[1])
+            self._stats["misses"] += 1
+        return None
+
+    def set(self, key: str, value: Any, ttl: float):
+        """값의 복사본을 캐시에 저장합니다. (저장 후 호출자가 원본을 수정해도 무관)"""
+        if ttl <= 0:
+            return
+        entry = (time.time() + ttl, copy.deepcopy(value))
+        with self._lock:
+            self._store(key, entry)
+        self._write_disk(key, entry)
+
+    def _store(self, key: str, entry: Tuple[float, Any]):
+        """메모리 LRU에 저장합니다. (lock 보유 상태에서 호출)"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Optional[Tuple[float, Any]]:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data["expires_at"], data["value"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write_disk(self, key: str, entry: Tuple[float, Any]):
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"expires_at": entry[0], "value": entry[1]}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"디스크 캐시 저장 실패: {e}")
+
+    def clear(self):
+        """메모리 캐시를 비웁니다. (디스크 캐시는 만료 시각으로 관리)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """hit/miss/eviction 카운터를 반환합니다."""
+        with self._lock:
+            return {**self._stats, "size": len(self._entries)}
+
+
+_default_cache: Optional[ResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """설정에 따라 공유 ResponseCache를 반환합니다. 캐시가 비활성화되어 있으면 None."""
+    global _default_cache
+    if not get_cache_config("ENABLED"):
+        return None
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                disk_dir = None
+                if get_cache_config("DISK_ENABLED"):
+                    disk_dir = os.path.join(get_config("DATA_DIR") or "data", get_cache_config("DISK_DIR") or "cache")
+                _default_cache = ResponseCache(disk_dir=disk_dir)
+    return _default_cache
@@ -0,0 +1,387 @@
+"""
+Slack 비동기 전송 큐 모듈
+메시지를 즉시 큐(와 디스크 저널)에 넣고 반환하며, 백그라운드 스레드가 채널별 전송 간격을 지키면서
+짧은 시간 안에 쌓인 같은 채널 메시지를 하나의 Block Kit 메시지로 합쳐 전송합니다.
+"""
+
+import itertools
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Deque
+
+from config import get_config
+from config_compat import get_slack_queue_config
+
+
+# Slack 메시지당 최대 블록 수
+MAX_BLOCKS = 50
+
+# 저널 압축을 검토하기 시작하는 최소 확인(ack) 건수
+JOURNAL_COMPACT_MIN_ACKED = 100
+
+# 다시 시도할 Slack API 오류 코드
+RETRYABLE_SLACK_ERRORS = {"ratelimited", "internal_error", "fatal_error", "service_unavailable", "request_timeout"}
+
+
+class _OutboundMessage:
+    """큐에 들어간 메시지 하나"""
+
+    def __init__(self, message_id: str, channel: str, text: str, blocks: Optional[List[Dict[str, Any]]],
+                 enqueued_at: float):
+        self.id = message_id
+        self.channel = channel
+        self.text = text
+        self.blocks = blocks
+        self.enqueued_at = enqueued_at
+        self.attempts = 0
+        self.future: Future = Future()
+
+    def to_record(self) -> Dict[str, Any]:
+        return {"op": "enqueue", "id": self.id, "channel": self.channel, "text": self.text,
+                "blocks": self.blocks, "enqueued_at": self.enqueued_at}
+
+    def as_blocks(self) -> List[Dict[str, Any]]:
+        if self.blocks:
+            return list(self.blocks)
+        return [{"type": "section", "text": {"type": "mrkdwn", "text": self.text[:3000]}}]
+
+
+class SlackOutboundQueue:
+    """채널별 속도 조절과 메시지 병합을 하는 Slack 전송 큐"""
+
+    def __init__(self,
+                 client=None,
+                 journal_path: str = None,
+                 coalesce_window: float = None,
+                 channel_interval: float = None,
+                 max_batch: int = None,
+                 max_attempts: int = None):
+        """
+        Args:
+            client: 전송에 사용할 SlackClient
+            journal_path: 미전송 메시지 저널 경로 (기본값: DATA_DIR/slack_outbox.jsonl)
+            coalesce_window: 같은 채널 메시지를 모으는 시간 (초)
+            channel_interval: 채널별 최소 전송 간격 (초)
+            max_batch: 한 번에 합칠 최대 메시지 수
+            max_attempts: 일시적 실패 시 최대 전송 시도 횟수
+        """
+        if client is None:
+            from api_clients import SlackClient
+            client = SlackClient()
+        self.client = client
+        self.coalesce_window = _first_set(coalesce_window, get_slack_queue_config("COALESCE_WINDOW"), 2.0)
+        self.channel_interval = _first_set(channel_interval, get_slack_queue_config("CHANNEL_INTERVAL"), 1.0)
+        self.max_batch = max_batch or get_slack_queue_config("MAX_BATCH") or 10
+        self.max_attempts = max_attempts or get_slack_queue_config("MAX_ATTEMPTS") or 5
+        self.journal_fsync = bool(get_slack_queue_config("JOURNAL_FSYNC"))
+        self.journal_compact_ratio = get_slack_queue_config("JOURNAL_COMPACT_RATIO") or 4.0
+        self.journal_path = journal_path or os.path.join(
+            get_config("DATA_DIR") or "data", get_slack_queue_config("JOURNAL_FILE") or "slack_outbox.jsonl")
+
+        self._pending: Dict[str, Deque[_OutboundMessage]] = {}
+        self._ready_at: Dict[str, float] = {}
+        self._in_flight = 0
+        self._wait_for: Optional[float] = None
+        self._cond = threading.Condition()
+        self._journal_lock = threading.Lock()
+        self._journal = None
+        # 저널 압축 시 남길 미확인 메시지 기록과 마지막 압축 이후 확인된 건수
+        self._unacked: Dict[str, Dict[str, Any]] = {}
+        self._acked_since_compact = 0
+        self._closed = False
+        self._stats = {"enqueued": 0, "delivered": 0, "failed": 0, "posts": 0, "retries": 0}
+
+        self._recover()
+        self._worker = threading.Thread(target=self._run, name="slack-outbound", daemon=True)
+        self._worker.start()
+
+    # ========================================
+    # 저널
+    # ========================================
+
+    def _recover(self):
+        """저널에서 확인(ack)되지 않은 메시지를 복구하고 저널을 미전송 메시지만 남도록 압축합니다."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.journal_path)), exist_ok=True)
+        records: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # 기록 도중 중단된 마지막 줄
+                        continue
+                    if record.get("op") == "enqueue":
+                        records[record["id"]] = record
+                    elif record.get("op") == "ack":
+                        records.pop(record.get("id"), None)
+
+        with self._journal_lock:
+            self._unacked = records
+            self._compact_journal()
+
+        for record in records.values():
+            message = _OutboundMessage(record["id"], record["channel"], record.get("text") or "",
+                                       record.get("blocks"), record.get("enqueued_at") or time.time())
+            self._pending.setdefault(message.channel, deque()).append(message)
+        if records:
+            print(f"📮 Slack 미전송 메시지 {len(records)}건 복구")
+
+    def _compact_journal(self):
+        """저널을 미확인 메시지 기록만 남도록 다시 씁니다. (self._journal_lock 보유 상태에서 호출)"""
+        tmp_path = self.journal_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for record in self._unacked.values():
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            if self.journal_fsync:
+                os.fsync(f.fileno())
+        if self._journal is not None:
+            self._journal.close()
+        os.replace(tmp_path, self.journal_path)
+        self._journal = open(self.journal_path, 'a', encoding='utf-8')
+        self._acked_since_compact = 0
+
+    def _write_journal(self, records: List[Dict[str, Any]]):
+        """
+        저널에 기록을 추가합니다. 확인된 기록이 미확인 메시지 수의 journal_compact_ratio배를 넘으면
+        저널을 압축해 전송이 끝난 메시지가 계속 쌓이지 않게 합니다.
+        """
+        with self._journal_lock:
+            if self._journal.closed:
+                return
+            for record in records:
+                self._journal.write(json.dumps(record, ensure_ascii=False) + "\n")
+                if record["op"] == "enqueue":
+                    self._unacked[record["id"]] = record
+                elif self._unacked.pop(record["id"], None) is not None:
+                    self._acked_since_compact += 1
+            self._journal.flush()
+            if self.journal_fsync:
+                os.fsync(self._journal.fileno())
+
+            if self._acked_since_compact >= max(JOURNAL_COMPACT_MIN_ACKED,
+                                                len(self._unacked) * self.journal_compact_ratio):
+                try:
+                    self._compact_journal()
+                except OSError as e:
+                    # 압축하지 못해도 기존 저널은 그대로 유효함
+                    print(f"Slack 저널 압축 실패: {e}")
+
+    # ========================================
+    # 생산자 API
+    # ========================================
+
+    def enqueue(self, channel: str, text: str, blocks: List[Dict[str, Any]] = None) -> Future:
+        """
+        메시지를 큐에 넣고 바로 반환합니다. (네트워크 대기 없음)
+
+        Returns:
+            전송이 끝나면 Slack 응답(실패 시 {"error": ...})으로 완료되는 Future
+        """
+        message = _OutboundMessage(uuid.uuid4().hex, channel, text, blocks, time.time())
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Slack 전송 큐가 닫혔습니다")
+        self._write_journal([message.to_record()])
+        with self._cond:
+            self._pending.setdefault(channel, deque()).append(message)
+            self._stats["enqueued"] += 1
+            self._cond.notify()
+        return message.future
+
+    def flush(self, timeout: float = None) -> bool:
+        """큐가 빌 때까지 기다립니다. 모두 전송되면 True를 반환합니다."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._cond.notify()
+            while any(self._pending.values()) or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 30.0):
+        """
+        남은 메시지를 최대 timeout초 동안 전송한 뒤 작업 스레드를 멈추고 저널을 압축합니다.
+        그때까지 보내지 못한 메시지는 저널에 남아 다음 실행 때 복구됩니다.
+        """
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._worker.join(timeout=5)
+        with self._journal_lock:
+            if self._journal.closed:
+                return
+            try:
+                self._compact_journal()
+            except OSError as e:
+                print(f"Slack 저널 압축 실패: {e}")
+            self._journal.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {**self._stats, "pending": sum(len(queue) for queue in self._pending.values())}
+
+    # ========================================
+    # 작업 스레드
+    # ========================================
+
+    def _next_batch(self) -> Optional[List[_OutboundMessage]]:
+        """
+        전송할 수 있는 채널의 메시지 묶음을 꺼냅니다. 없으면 다음 확인까지 대기할 시간을 설정하고 None.
+        (self._cond 보유 상태에서 호출)
+        """
+        now = time.monotonic()
+        wall_now = time.time()
+        self._wait_for = None
+        for channel, queue in self._pending.items():
+            if not queue:
+                continue
+            ready_at = self._ready_at.get(channel, 0.0)
+            # 가장 오래된 메시지가 병합 시간을 채웠거나 묶음이 가득 찼으면 전송
+            gathered_at = queue[0].enqueued_at + self.coalesce_window - wall_now
+            due = 0.0 if len(queue) >= self.max_batch else max(gathered_at, 0.0)
+            wait = max(ready_at - now, due)
+            if wait <= 0:
+                return self._take(channel, queue)
+            self._wait_for = wait if self._wait_for is None else min(self._wait_for, wait)
+        return None
+
+    def _take(self, channel: str, queue: Deque[_OutboundMessage]) -> List[_OutboundMessage]:
+        """블록 수 제한 안에서 최대 max_batch개 메시지를 꺼냅니다. (self._cond 보유 상태에서 호출)"""
+        batch: List[_OutboundMessage] = []
+        blocks = 0
+        while queue and len(batch) < self.max_batch:
+            needed = len(queue[0].as_blocks()) + (1 if batch else 0)
+            if batch and blocks + needed > MAX_BLOCKS:
+                break
+            message = queue.popleft()
+            message.attempts += 1
+            batch.append(message)
+            blocks += needed
+        self._ready_at[channel] = time.monotonic() + self.channel_interval
+        self._in_flight += 1
+        return batch
+
+    def _run(self):
+        while True:
+            with self._cond:
+                batch = None if self._closed else self._next_batch()
+                while batch is None:
+                    if self._closed:
+                        return
+                    self._cond.wait(self._wait_for)
+                    batch = self._next_batch()
+            try:
+                self._deliver(batch)
+            except Exception as e:
+                # 작업 스레드가 멈추지 않도록 묶음 단위로 처리하고 끝나지 않은 메시지는 다시 큐에 넣음
+                print(f"❌ Slack 전송 처리 오류 ({batch[0].channel}): {e}")
+                self._requeue_failed(batch, e)
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    self._cond.notify_all()
+
+    def _deliver(self, batch: List[_OutboundMessage]):
+        """묶음을 하나의 메시지로 전송하고 결과에 따라 확인 처리하거나 다시 큐에 넣습니다."""
+        channel = batch[0].channel
+        text, blocks = _merge(batch)
+        try:
+            response = self.client.send_message(channel, text, blocks)
+        except Exception as e:
+            response = {"error": str(e)}
+
+        error = response.get("error") if isinstance(response, dict) else "invalid response"
+        if error is None and response.get("ok", True):
+            self._finish(batch, response, delivered=True)
+            return
+
+        retryable = "ok" not in response or error in RETRYABLE_SLACK_ERRORS
+        remaining = [message for message in batch if message.attempts < self.max_attempts]
+        if retryable and remaining:
+            backoff = self._requeue(channel, remaining)
+            print(f"⚠️ Slack 전송 실패 ({channel}, {error}) - {backoff:.1f}초 후 재시도")
+            batch = [message for message in batch if message.attempts >= self.max_attempts]
+            if not batch:
+                return
+
+        print(f"❌ Slack 전송 실패 ({channel}, {error}) - 메시지 {len(batch)}건 폐기")
+        self._finish(batch, response if isinstance(response, dict) else {"error": error}, delivered=False)
+
+    def _requeue(self, channel: str, messages: List[_OutboundMessage]) -> float:
+        """메시지를 채널 큐 앞에 되돌리고 시도 횟수에 따른 대기 시간(초)을 반환합니다."""
+        backoff = min(60.0, self.channel_interval * (2 ** messages[0].attempts))
+        with self._cond:
+            self._pending.setdefault(channel, deque()).extendleft(reversed(messages))
+            self._ready_at[channel] = time.monotonic() + backoff
+            self._stats["retries"] += 1
+        return backoff
+
+    def _requeue_failed(self, batch: List[_OutboundMessage], error: Exception):
+        """
+        처리 중 예외가 난 묶음에서 아직 완료되지 않은 메시지를 다시 큐에 넣습니다.
+        시도 횟수를 다 쓴 메시지는 오류로 완료하며, 확인 기록을 남기지 않으므로 다음 실행 때 다시 복구됩니다.
+        """
+        unfinished = [message for message in batch if not message.future.done()]
+        remaining = [message for message in unfinished if message.attempts < self.max_attempts]
+        if remaining:
+            self._requeue(remaining[0].channel, remaining)
+        exhausted = [message for message in unfinished if message.attempts >= self.max_attempts]
+        if exhausted:
+            with self._cond:
+                self._stats["failed"] += len(exhausted)
+            for message in exhausted:
+                message.future.set_result({"error": str(error)})
+
+    def _finish(self, batch: List[_OutboundMessage], response: Dict[str, Any], delivered: bool):
+        self._write_journal([{"op": "ack", "id": message.id,
+                              "at": datetime.now().isoformat(timespec="seconds")} for message in batch])
+        with self._cond:
+            if delivered:
+                self._stats["delivered"] += len(batch)
+                self._stats["posts"] += 1
+            else:
+                self._stats["failed"] += len(batch)
+        for message in batch:
+            message.future.set_result(response)
+
+
+def _merge(batch: List[_OutboundMessage]) -> tuple:
+    """메시지 묶음을 (text, blocks)로 합칩니다. 한 건이면 원래 메시지를 그대로 보냅니다."""
+    if len(batch) == 1:
+        return batch[0].text, batch[0].blocks
+    divider = [{"type": "divider"}]
+    blocks = list(itertools.chain.from_iterable(
+        (divider if i else []) + message.as_blocks() for i, message in enumerate(batch)))
+    text = "\n".join(message.text for message in batch if message.text)[:4000]
+    return text, blocks
+
+
+def _first_set(*values):
+    for value in values:
+        if value is not None and value != "":
+            return value
+    return None
+
+
+_default_queue: Optional[SlackOutboundQueue] = None
+_default_queue_lock = threading.Lock()
+
+
+def get_slack_queue(client=None) -> SlackOutboundQueue:
+    """프로세스 전체에서 공유하는 SlackOutboundQueue를 반환합니다."""
+    global _default_queue
+    with _default_queue_lock:
+        if _default_queue is None:
+            _default_queue = SlackOutboundQueue(client)
+        return _default_queue